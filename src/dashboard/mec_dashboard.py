@@ -3,21 +3,117 @@ MEC Orchestration Dashboard - Streamlit Interface
 """
 
 import asyncio
+import hashlib
+import heapq
+import itertools
+import json
+import logging
 import math
 import os
-import random
+import queue
+import re
+import threading
 import time
+from collections import deque
 from datetime import UTC, datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener
 
-import networkx as nx
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
 from src.dashboard.mcp_dashboard_bridge import dashboard_bridge
 from src.swarm.swarm_coordinator import SwarmCoordinator
 
+try:
+    import uvloop  # optional: faster event loop for the bridge calls
+except ImportError:
+    uvloop = None
+
+try:
+    import orjson  # optional: faster JSON encoding for exports
+except ImportError:
+    orjson = None
+
+# Expected API key shape: "sk-" prefix, at least 20 characters in total
+_API_KEY_RE = re.compile(r"sk-.{17,}", re.DOTALL)
+
+# Sidebar notice for scenarios that run with adjusted thresholds
+_SCENARIO_THRESHOLD_INFO = {
+    "automotive": "🚗 **Automotive Mode**: Ultra-low latency thresholds active",
+    "gaming": "🎮 **Gaming Mode**: High GPU utilization expected",
+    "healthcare": "🏥 **Healthcare Mode**: Reliable, consistent processing",
+}
+
+# Activity stream icons by severity level and by demo scenario
+_LEVEL_COLORS = {"info": "🔵", "success": "🟢", "warning": "🟡", "error": "🔴"}
+_SCENARIO_ICONS = {"gaming": "🎮", "automotive": "🚗", "healthcare": "🏥"}
+
+# Shared generator for vectorized demo data (PCG64, no global state lock)
+_RNG = np.random.default_rng()
+
+
+# Bridge site ids and the per-site metric fields averaged for the metrics
+# panel, with the defaults used when a site does not report a field
+_BRIDGE_SITES = ("MEC_A", "MEC_B", "MEC_C")
+_BRIDGE_METRIC_FIELDS = (
+    ("cpu_utilization", 50),
+    ("gpu_utilization", 50),
+    ("response_time_ms", 50),
+    ("queue_depth", 25),
+)
+
+# Load multipliers for the swarm-status metrics fallback; a swarm state
+# entry takes precedence over the operation mode
+_SWARM_STATE_MULTIPLIER = {"consensus": 1.3}
+_MODE_MULTIPLIER = {"Threshold Breach": 1.5, "Swarm Active": 0.8}
+
+# Metrics jitter bounds for latency, CPU, GPU and queue depth, shared by the
+# mock generator and the real-mode fallback (low inclusive, high exclusive)
+_MOCK_JITTER_LOW = (-10, -5, -10, -5)
+_MOCK_JITTER_HIGH = (11, 16, 21, 26)
+
+# Dashboard error logging goes through a queue so the render path never
+# blocks on stream I/O; the listener thread does the actual writes
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _LOG_QUEUE = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(_LOG_QUEUE))
+    logger.propagate = False
+    QueueListener(_LOG_QUEUE, logging.StreamHandler()).start()
+
+# Persistent event loop for dashboard bridge calls, shared like the bridge
+_BRIDGE_LOOP = None
+_BRIDGE_LOOP_LOCK = threading.Lock()
+
+
+def _get_bridge_loop() -> asyncio.AbstractEventLoop:
+    """Return the background bridge event loop, starting it on first use"""
+    global _BRIDGE_LOOP
+    with _BRIDGE_LOOP_LOCK:
+        if _BRIDGE_LOOP is None:
+            loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="dashboard-bridge-loop", daemon=True
+            ).start()
+            _BRIDGE_LOOP = loop
+    return _BRIDGE_LOOP
+
+
+def _run_bridge(coro, timeout: float = 5):
+    """Run a bridge coroutine on the persistent loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_bridge_loop()).result(
+        timeout=timeout
+    )
+
+
+def _dumps_json(data) -> str:
+    """Encode data as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, default=str)
+
 
 def validate_claude_api_key(api_key: str) -> bool:
     """
@@ -29,27 +125,93 @@ def validate_claude_api_key(api_key: str) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    if not api_key or not api_key.startswith("sk-"):
-        return False
-
-    try:
-        # Simple validation - check format and length
-        if len(api_key) < 20:
-            return False
-
-        # For now, just validate format
-        # In production, you'd make a test API call
-        return True
-
-    except Exception:
-        return False
+    # For now, just validate format and length (at least 20 characters)
+    # In production, you'd make a test API call
+    return bool(api_key) and _API_KEY_RE.fullmatch(api_key) is not None
+
+
+@st.cache_data(
+    ttl=300,
+    max_entries=4,
+    show_spinner=False,
+    hash_funcs={str: lambda s: hashlib.sha256(s.encode()).digest()},
+)
+def _validate_cached(api_key: str) -> bool:
+    """Validate an API key, caching the result under the SHA-256 of the key."""
+    return validate_claude_api_key(api_key)
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _get_coordinator(api_key_hash: str) -> SwarmCoordinator:
+    """Build one SwarmCoordinator per API key, reused across revalidations."""
+    return SwarmCoordinator()
+
+
+# The metrics, swarm and activity panels all fall back to the coordinator in
+# the same refresh; these share one read per tick. The id(...) key changes
+# when a revalidated API key swaps in a different coordinator.
+@st.cache_data(ttl=2, max_entries=4, show_spinner=False)
+def _cached_status(coord_id: int, _coordinator: SwarmCoordinator) -> dict:
+    """Return the coordinator's swarm status, cached briefly per coordinator."""
+    return _coordinator.get_swarm_status()
+
+
+@st.cache_data(ttl=2, max_entries=4, show_spinner=False)
+def _cached_events(coord_id: int, _coordinator: SwarmCoordinator, limit: int) -> list:
+    """Return the coordinator's recent events, cached briefly per coordinator."""
+    return _coordinator.get_event_history(limit=limit)
+
+
+async def _periodic_simulate(simulation: dict, interval: float = 30) -> None:
+    """Run bridge MCP simulations every interval while the session keeps polling"""
+    # Stops once the session sets "stopped" and wakes it, or on its own once
+    # the session has not drained results for two intervals (closed tab)
+    wake = simulation["wake"]
+    while (
+        not simulation["stopped"]
+        and time.monotonic() - simulation["last_poll"] < 2 * interval
+    ):
+        try:
+            simulation["results"].put(await dashboard_bridge.simulate_agent_mcp_calls())
+        except Exception as e:
+            logger.warning("Background agent activity error", exc_info=e)
+        try:
+            await asyncio.wait_for(wake.wait(), timeout=interval)
+        except TimeoutError:
+            pass
+        wake.clear()
+
+
+def _stop_background_simulation() -> None:
+    """Stop the session's periodic simulation now instead of at its timeout"""
+    simulation = st.session_state.pop("background_simulation", None)
+    if simulation is not None and not simulation["future"].done():
+        simulation["stopped"] = True
+        _get_bridge_loop().call_soon_threadsafe(simulation["wake"].set)
+
+
+async def _fetch_bridge_data(timeout: float = 4) -> list:
+    """Fetch bridge metrics, swarm view and activity stream concurrently"""
+    # Each read gets its own deadline, inside _run_bridge's overall one, so a
+    # slow call comes back as a TimeoutError for its own panel to fall back on
+    return await asyncio.gather(
+        asyncio.wait_for(dashboard_bridge.get_real_time_metrics(), timeout),
+        asyncio.wait_for(dashboard_bridge.get_swarm_visualization_data(), timeout),
+        asyncio.wait_for(dashboard_bridge.get_agent_activity_stream(8), timeout),
+        return_exceptions=True,
+    )
 
 
-def get_real_metrics_data(swarm_coordinator: SwarmCoordinator, mode: str) -> dict:
+def get_real_metrics_data(
+    swarm_coordinator: SwarmCoordinator, mode: str, dashboard_data=None
+) -> dict:
     """Get real metrics data from SwarmCoordinator."""
     try:
-        # Get real-time metrics from MCP dashboard bridge
-        dashboard_data = asyncio.run(dashboard_bridge.get_real_time_metrics())
+        # Get real-time metrics from MCP dashboard bridge, unless prefetched
+        if dashboard_data is None:
+            dashboard_data = _run_bridge(dashboard_bridge.get_real_time_metrics())
+        elif isinstance(dashboard_data, Exception):
+            raise dashboard_data
 
         if "metrics" in dashboard_data and dashboard_data["metrics"]:
             # Extract metrics from MCP tools
@@ -57,39 +219,34 @@ def get_real_metrics_data(swarm_coordinator: SwarmCoordinator, mode: str) -> dic
 
             # Calculate aggregated metrics
             if isinstance(mec_metrics, dict) and "MEC_A" in mec_metrics:
-                # Average across all MEC sites
-                sites = ["MEC_A", "MEC_B", "MEC_C"]
-                total_cpu = sum(
-                    mec_metrics.get(site, {}).get("cpu_utilization", 50)
-                    for site in sites
-                ) / len(sites)
-
-                total_gpu = sum(
-                    mec_metrics.get(site, {}).get("gpu_utilization", 50)
-                    for site in sites
-                ) / len(sites)
-
-                avg_latency = sum(
-                    mec_metrics.get(site, {}).get("response_time_ms", 50)
-                    for site in sites
-                ) / len(sites)
-
-                total_queue = sum(
-                    mec_metrics.get(site, {}).get("queue_depth", 25) for site in sites
-                ) / len(sites)
+                # Average across all MEC sites: one (site x field) array, one
+                # column-wise mean
+                site_values = np.array(
+                    [
+                        [
+                            mec_metrics.get(site, {}).get(field, default)
+                            for field, default in _BRIDGE_METRIC_FIELDS
+                        ]
+                        for site in _BRIDGE_SITES
+                    ],
+                    dtype=np.float32,
+                )
+                avg_cpu, avg_gpu, avg_latency, avg_queue = (
+                    site_values.mean(axis=0).astype(np.int32).tolist()
+                )
 
                 return {
-                    "latency": int(avg_latency),
-                    "cpu_usage": int(total_cpu),
-                    "gpu_usage": int(total_gpu),
-                    "queue_depth": int(total_queue),
+                    "latency": avg_latency,
+                    "cpu_usage": avg_cpu,
+                    "gpu_usage": avg_gpu,
+                    "queue_depth": avg_queue,
                     "timestamp": datetime.now(UTC),
                     "real_mode": True,
                     "mcp_source": True,
                 }
 
         # Fallback to SwarmCoordinator data
-        swarm_status = swarm_coordinator.get_swarm_status()
+        swarm_status = _cached_status(id(swarm_coordinator), swarm_coordinator)
         sites = swarm_status.get("sites", {})
 
         if sites:
@@ -100,24 +257,24 @@ def get_real_metrics_data(swarm_coordinator: SwarmCoordinator, mode: str) -> dic
                 / total_sites
             )
 
-            # Adjust based on swarm state and mode
-            state_multiplier = 1.0
-            if swarm_status.get("state") == "consensus":
-                state_multiplier = 1.3
-            elif mode == "Threshold Breach":
-                state_multiplier = 1.5
-            elif mode == "Swarm Active":
-                state_multiplier = 0.8
+            # Adjust based on swarm state and mode (swarm state wins)
+            state_multiplier = _SWARM_STATE_MULTIPLIER.get(
+                swarm_status.get("state")
+            ) or _MODE_MULTIPLIER.get(mode, 1.0)
 
             base_latency = 45 * state_multiplier
             base_queue = 25 * state_multiplier
 
+            # One draw for the four jitters (inclusive bounds, as randint)
+            latency_jitter, cpu_jitter, gpu_jitter, queue_jitter = _RNG.integers(
+                _MOCK_JITTER_LOW, _MOCK_JITTER_HIGH
+            ).tolist()
+
             return {
-                "latency": int(base_latency) + random.randint(-10, 10),
-                "cpu_usage": int(avg_cpu * state_multiplier) + random.randint(-5, 15),
-                "gpu_usage": int(avg_cpu * 0.8 * state_multiplier)
-                + random.randint(-10, 20),
-                "queue_depth": int(base_queue) + random.randint(-5, 25),
+                "latency": int(base_latency) + latency_jitter,
+                "cpu_usage": int(avg_cpu * state_multiplier) + cpu_jitter,
+                "gpu_usage": int(avg_cpu * 0.8 * state_multiplier) + gpu_jitter,
+                "queue_depth": int(base_queue) + queue_jitter,
                 "timestamp": datetime.now(UTC),
                 "real_mode": True,
                 "swarm_source": True,
@@ -128,26 +285,36 @@ def get_real_metrics_data(swarm_coordinator: SwarmCoordinator, mode: str) -> dic
 
     except Exception as e:
         # Fallback to mock data on error, but log the error
-        print(f"Real metrics error: {e}")
+        logger.warning("Real metrics error", exc_info=e)
         fallback_data = generate_metrics_data(mode)
         fallback_data["real_mode_error"] = str(e)
         return fallback_data
 
 
 def get_real_swarm_data(
-    swarm_coordinator: SwarmCoordinator, selected_sites: list
+    swarm_coordinator: SwarmCoordinator, selected_sites: list, swarm_viz_data=None
 ) -> dict:
     """Get real swarm data from SwarmCoordinator and MCP tools."""
     try:
-        # Get swarm visualization data from MCP dashboard bridge
-        swarm_viz_data = asyncio.run(dashboard_bridge.get_swarm_visualization_data())
+        # Get swarm visualization data from MCP dashboard bridge, unless prefetched
+        if swarm_viz_data is None:
+            swarm_viz_data = _run_bridge(
+                dashboard_bridge.get_swarm_visualization_data()
+            )
+        elif isinstance(swarm_viz_data, Exception):
+            raise swarm_viz_data
+
+        # Placeholder load/connection values for every site, drawn up front
+        # in two vectorized calls instead of per-site randint
+        default_loads = _RNG.integers(20, 91, size=len(selected_sites)).tolist()
+        default_connections = _RNG.integers(5, 26, size=len(selected_sites)).tolist()
 
         if "swarm_overview" in swarm_viz_data and swarm_viz_data["swarm_overview"]:
             # Use MCP data if available
             container_status = swarm_viz_data.get("container_status", {})
 
             swarm_data = {}
-            for site in selected_sites:
+            for i, site in enumerate(selected_sites):
                 # Map display names to internal names
                 internal_name = site.replace("-Site-", "_")
 
@@ -165,7 +332,7 @@ def get_real_swarm_data(
                         "status": status,
                         "load": int(container_info.get("cpu_utilization", 50)),
                         "connections": container_info.get(
-                            "active_connections", random.randint(5, 25)
+                            "active_connections", default_connections[i]
                         ),
                         "is_healthy": status == "active",
                         "mcp_source": True,
@@ -174,8 +341,8 @@ def get_real_swarm_data(
                     # Default data for unmapped sites
                     swarm_data[site] = {
                         "status": "active",
-                        "load": random.randint(20, 90),
-                        "connections": random.randint(5, 25),
+                        "load": default_loads[i],
+                        "connections": default_connections[i],
                         "is_healthy": True,
                         "mcp_source": False,
                     }
@@ -183,11 +350,11 @@ def get_real_swarm_data(
             return swarm_data
 
         # Fallback to SwarmCoordinator data
-        swarm_status = swarm_coordinator.get_swarm_status()
+        swarm_status = _cached_status(id(swarm_coordinator), swarm_coordinator)
         sites_data = swarm_status.get("sites", {})
 
         swarm_data = {}
-        for site in selected_sites:
+        for i, site in enumerate(selected_sites):
             # Map display names to internal names
             internal_name = site.replace("-Site-", "_")
 
@@ -196,7 +363,7 @@ def get_real_swarm_data(
                 swarm_data[site] = {
                     "status": site_info.get("status", "active"),
                     "load": int(site_info.get("load_score", 0.5) * 100),
-                    "connections": random.randint(5, 25),
+                    "connections": default_connections[i],
                     "is_healthy": site_info.get("is_healthy", True),
                     "swarm_source": True,
                 }
@@ -204,8 +371,8 @@ def get_real_swarm_data(
                 # Default data for unmapped sites
                 swarm_data[site] = {
                     "status": "active",
-                    "load": random.randint(20, 90),
-                    "connections": random.randint(5, 25),
+                    "load": default_loads[i],
+                    "connections": default_connections[i],
                     "is_healthy": True,
                     "swarm_source": False,
                 }
@@ -214,18 +381,32 @@ def get_real_swarm_data(
 
     except Exception as e:
         # Fallback to mock data
-        print(f"Real swarm data error: {e}")
+        logger.warning("Real swarm data error", exc_info=e)
         return generate_swarm_data(selected_sites, "Normal Operation")
 
 
-def get_real_activity_data(swarm_coordinator: SwarmCoordinator) -> list:
+def _with_parsed_times(rows: list, timestamps: list) -> list:
+    """Attach ISO-8601 timestamps to activity rows, parsed in one pandas call"""
+    parsed = pd.to_datetime(timestamps, utc=True, format="ISO8601")
+    for row, time_value in zip(rows, parsed, strict=True):
+        row["time"] = time_value
+    return rows
+
+
+def get_real_activity_data(
+    swarm_coordinator: SwarmCoordinator, bridge_data=None
+) -> list:
     """Get real activity data from SwarmCoordinator and MCP tools."""
     try:
         activities = []
 
-        # Get MCP bridge activity stream (primary source)
+        # Get MCP bridge activity stream (primary source), unless prefetched
         try:
-            bridge_data = asyncio.run(dashboard_bridge.get_agent_activity_stream(8))
+            if bridge_data is None:
+                bridge_data = _run_bridge(dashboard_bridge.get_agent_activity_stream(8))
+            elif isinstance(bridge_data, Exception):
+                raise bridge_data
+            bridge_rows = []
             for activity in bridge_data:
                 # Parse different activity types
                 agent_name = activity.get("source", "MCPBridge")
@@ -245,11 +426,8 @@ def get_real_activity_data(swarm_coordinator: SwarmCoordinator) -> list:
                 elif action_type == "telemetry_event":
                     action_type = activity.get("event_type", "TELEMETRY")
 
-                activities.append(
+                bridge_rows.append(
                     {
-                        "time": datetime.fromisoformat(
-                            activity["timestamp"].replace("Z", "+00:00")
-                        ),
                         "agent": agent_name,
                         "action": action_type.upper(),
                         "level": (
@@ -259,32 +437,37 @@ def get_real_activity_data(swarm_coordinator: SwarmCoordinator) -> list:
                         "mcp_source": True,
                     }
                 )
+            activities.extend(
+                _with_parsed_times(
+                    bridge_rows, [activity["timestamp"] for activity in bridge_data]
+                )
+            )
         except Exception as e:
-            print(f"MCP bridge activity error: {e}")
+            logger.warning("MCP bridge activity error", exc_info=e)
 
         # Get swarm coordinator events (secondary source)
         try:
-            events = swarm_coordinator.get_event_history(limit=5)
-            for event in events:
-                activities.append(
-                    {
-                        "time": datetime.fromisoformat(
-                            event["timestamp"].replace("Z", "+00:00")
-                        ),
-                        "agent": "SwarmCoordinator",
-                        "action": event.get("event_type", "SWARM_EVENT").upper(),
-                        "level": ("success" if event.get("success") else "warning"),
-                        "real_mode": True,
-                        "swarm_source": True,
-                    }
-                )
+            events = _cached_events(id(swarm_coordinator), swarm_coordinator, 5)
+            event_rows = [
+                {
+                    "agent": "SwarmCoordinator",
+                    "action": event.get("event_type", "SWARM_EVENT").upper(),
+                    "level": ("success" if event.get("success") else "warning"),
+                    "real_mode": True,
+                    "swarm_source": True,
+                }
+                for event in events
+            ]
+            activities.extend(
+                _with_parsed_times(event_rows, [event["timestamp"] for event in events])
+            )
         except Exception as e:
-            print(f"Swarm events error: {e}")
+            logger.warning("Swarm events error", exc_info=e)
 
         # Trigger some real MCP activity for demonstration
         try:
             # Simulate agent MCP calls to generate activity
-            simulation_result = asyncio.run(dashboard_bridge.simulate_agent_mcp_calls())
+            simulation_result = _run_bridge(dashboard_bridge.simulate_agent_mcp_calls())
             if simulation_result.get("success"):
                 activities.append(
                     {
@@ -300,231 +483,330 @@ def get_real_activity_data(swarm_coordinator: SwarmCoordinator) -> list:
                     }
                 )
         except Exception as e:
-            print(f"MCP simulation error: {e}")
+            logger.warning("MCP simulation error", exc_info=e)
 
-        # Sort by time (most recent first) and limit
-        activities.sort(key=lambda x: x["time"], reverse=True)
-        return activities[:10]
+        # Most recent first, limited to 10 without sorting the whole list
+        return heapq.nlargest(10, activities, key=lambda x: x["time"])
 
     except Exception:
         # Fallback to mock data
         return generate_activity_data("Normal Operation")
 
 
-def apply_demo_scenario(data: dict, scenario: str, data_type: str) -> dict:
-    """Apply comprehensive demo scenario modifications to data."""
+# Demo activity skeletons per scenario: (agent, action, level, warning chance,
+# seconds ago, details, randint range filled into the details or None)
+_SCENARIO_ACTIVITY_TEMPLATES = {
+    "gaming": (
+        (
+            "CacheManager",
+            "PRELOAD_GAME_ASSETS",
+            "info",
+            0,
+            0,
+            "Cached {} game textures",
+            (15, 45),
+        ),
+        (
+            "LoadBalancer",
+            "OPTIMIZE_NPC_DIALOGUE",
+            "success",
+            0,
+            2,
+            "Balanced {} NPC AI requests",
+            (25, 80),
+        ),
+        (
+            "ResourceMonitor",
+            "MULTIPLAYER_SYNC_CHECK",
+            "info",
+            0,
+            4,
+            "Synchronized {} player states",
+            (100, 300),
+        ),
+        (
+            "DecisionCoordinator",
+            "PHYSICS_ENGINE_SCALING",
+            "success",
+            0,
+            6,
+            "Scaled physics calculations for battle scene",
+            None,
+        ),
+    ),
+    "automotive": (
+        (
+            "SafetyMonitor",
+            "COLLISION_AVOIDANCE_CHECK",
+            "success",
+            0,
+            0,
+            "Processed {} sensor readings",
+            (50, 200),
+        ),
+        (
+            "DecisionCoordinator",
+            "ROUTE_OPTIMIZATION",
+            "info",
+            0,
+            1,
+            "Optimized routes for {} vehicles",
+            (15, 45),
+        ),
+        (
+            "LoadBalancer",
+            "V2X_COMMUNICATION_SYNC",
+            "success",
+            0,
+            2,
+            "Synchronized vehicle-to-everything communications",
+            None,
+        ),
+        (
+            "CacheManager",
+            "MAP_DATA_PRELOAD",
+            "info",
+            0,
+            3,
+            "Preloaded HD maps for {} km radius",
+            (5, 15),
+        ),
+        (
+            "ResourceMonitor",
+            "EMERGENCY_RESPONSE_READY",
+            "success",
+            0.3,
+            5,
+            "Emergency braking system status verified",
+            None,
+        ),
+    ),
+    "healthcare": (
+        (
+            "PatientMonitor",
+            "VITAL_SIGNS_ANALYSIS",
+            "success",
+            0,
+            0,
+            "Analyzed vitals for {} patients",
+            (25, 100),
+        ),
+        (
+            "DecisionCoordinator",
+            "ALERT_PRIORITIZATION",
+            "info",
+            0.4,
+            2,
+            "Prioritized {} medical alerts",
+            (3, 12),
+        ),
+        (
+            "CacheManager",
+            "MEDICAL_RECORD_SYNC",
+            "success",
+            0,
+            4,
+            "Synchronized {} patient records",
+            (15, 60),
+        ),
+        (
+            "LoadBalancer",
+            "DIAGNOSTIC_LOAD_BALANCE",
+            "info",
+            0,
+            6,
+            "Balanced diagnostic requests across {} systems",
+            (3, 8),
+        ),
+        (
+            "ResourceMonitor",
+            "COMPLIANCE_CHECK",
+            "success",
+            0,
+            8,
+            "HIPAA compliance verified for data processing",
+            None,
+        ),
+    ),
+}
+
+
+def _extend_scenario_activities(data: list, scenario: str, now: datetime) -> None:
+    """Append the scenario's activity templates, stamped relative to now"""
+    data.extend(
+        {
+            "time": now - timedelta(seconds=seconds_ago),
+            "agent": agent,
+            "action": action,
+            "level": (
+                "warning"
+                if warning_chance and _RNG.random() < warning_chance
+                else level
+            ),
+            "scenario": scenario,
+            "details": (
+                details.format(_RNG.integers(*detail_range, endpoint=True))
+                if detail_range
+                else details
+            ),
+        }
+        for (
+            agent,
+            action,
+            level,
+            warning_chance,
+            seconds_ago,
+            details,
+            detail_range,
+        ) in _SCENARIO_ACTIVITY_TEMPLATES[scenario]
+    )
 
-    if scenario == "gaming":
-        if data_type == "metrics":
-            # Gaming scenario: High GPU usage for rendering, variable latency for real-time multiplayer
-            current_time = time.time()
-
-            # Simulate gaming load patterns - peak during evening hours
-            hour_factor = 1.0 + 0.3 * abs(
-                math.sin(current_time / 3600)
-            )  # Hourly variation
-
-            # High GPU usage for game rendering and AI NPCs
-            data["gpu_usage"] = min(
-                95, int(data.get("gpu_usage", 50) + 35 * hour_factor)
-            )
 
-            # Variable latency for multiplayer synchronization
-            base_latency = data.get("latency", 50)
-            multiplayer_spike = random.choice([0, 0, 0, 25, 45])  # Occasional spikes
-            data["latency"] = int(base_latency + 15 + multiplayer_spike)
+# Metrics the demo scenarios adjust, with the defaults for missing values
+_SCENARIO_METRIC_FIELDS = (
+    ("latency", 50),
+    ("cpu_usage", 50),
+    ("gpu_usage", 50),
+    ("queue_depth", 25),
+)
+
+# Static per-scenario adjustment as (offset, low, high) arrays over
+# _SCENARIO_METRIC_FIELDS; an infinite bound leaves that side unclamped
+_SCENARIO_METRIC_BOUNDS = {
+    # Game logic CPU and capped GPU/queue; latency spikes are added per call
+    "gaming": (
+        np.array((15, 20, 0, 0)),
+        np.full(4, -np.inf),
+        np.array((np.inf, 85, 95, 80)),
+    ),
+    # Ultra-low latency for collision avoidance, real-time sensor CPU,
+    # moderate vision GPU and a short queue so safety systems get priority
+    "automotive": (
+        np.array((-30, 30, 15, -18)),
+        np.array((8, -np.inf, -np.inf, 2)),
+        np.array((25, 92, 75, 15)),
+    ),
+    # Consistent latency for patient monitoring, moderate CPU, low GPU (data
+    # processing, not rendering) and a steady queue of patient data
+    "healthcare": (
+        np.array((-20, 10, -10, 5)),
+        np.array((15, -np.inf, -np.inf, 10)),
+        np.array((40, 70, 45, 40)),
+    ),
+}
+
+
+def _apply_scenario_bounds(data: dict, scenario: str, extra=0) -> None:
+    """Offset and clamp the scenario metrics in one vectorized step"""
+    offsets, low, high = _SCENARIO_METRIC_BOUNDS[scenario]
+    values = np.array(
+        [data.get(field, default) for field, default in _SCENARIO_METRIC_FIELDS],
+        dtype=float,
+    )
+    adjusted = np.clip(values + offsets + extra, low, high).astype(int).tolist()
+    data.update(
+        zip((field for field, _ in _SCENARIO_METRIC_FIELDS), adjusted, strict=True),
+    )
 
-            # Queue depth varies with concurrent players
-            data["queue_depth"] = min(
-                80, data.get("queue_depth", 25) + random.randint(15, 35)
-            )
 
-            # CPU usage for game logic and physics
-            data["cpu_usage"] = min(85, data.get("cpu_usage", 50) + 20)
+def _gaming_metrics_scenario(data: dict, now: datetime) -> None:
+    """Apply the gaming scenario to the metrics"""
+    # Gaming scenario: High GPU usage for rendering, variable latency for real-time multiplayer
+
+    # Simulate gaming load patterns - peak during evening hours
+    hour_factor = 1.0 + 0.3 * abs(math.sin(now.timestamp() / 3600))  # Hourly variation
+
+    # On top of the static bounds: occasional multiplayer latency spikes, GPU
+    # load for rendering and AI NPCs, and queue depth from concurrent players
+    _apply_scenario_bounds(
+        data,
+        "gaming",
+        (
+            _RNG.choice((0, 0, 0, 25, 45)),
+            0,
+            35 * hour_factor,
+            _RNG.integers(15, 35, endpoint=True),
+        ),
+    )
 
-            # Add gaming-specific metadata
-            data["scenario_context"] = {
-                "active_players": random.randint(150, 500),
-                "npc_ai_load": f"{random.randint(60, 95)}%",
-                "physics_calculations": f"{random.randint(1000, 3500)}/sec",
-            }
+    # Add gaming-specific metadata
+    players, npc_ai_load, physics = _RNG.integers(
+        (150, 60, 1000), (500, 95, 3500), endpoint=True
+    ).tolist()
+    data["scenario_context"] = {
+        "active_players": players,
+        "npc_ai_load": f"{npc_ai_load}%",
+        "physics_calculations": f"{physics}/sec",
+    }
 
-        elif data_type == "activity":
-            # Add comprehensive gaming-specific activities
-            gaming_activities = [
-                {
-                    "time": datetime.now(UTC),
-                    "agent": "CacheManager",
-                    "action": "PRELOAD_GAME_ASSETS",
-                    "level": "info",
-                    "scenario": "gaming",
-                    "details": f"Cached {random.randint(15, 45)} game textures",
-                },
-                {
-                    "time": datetime.now(UTC) - timedelta(seconds=2),
-                    "agent": "LoadBalancer",
-                    "action": "OPTIMIZE_NPC_DIALOGUE",
-                    "level": "success",
-                    "scenario": "gaming",
-                    "details": f"Balanced {random.randint(25, 80)} NPC AI requests",
-                },
-                {
-                    "time": datetime.now(UTC) - timedelta(seconds=4),
-                    "agent": "ResourceMonitor",
-                    "action": "MULTIPLAYER_SYNC_CHECK",
-                    "level": "info",
-                    "scenario": "gaming",
-                    "details": f"Synchronized {random.randint(100, 300)} player states",
-                },
-                {
-                    "time": datetime.now(UTC) - timedelta(seconds=6),
-                    "agent": "DecisionCoordinator",
-                    "action": "PHYSICS_ENGINE_SCALING",
-                    "level": "success",
-                    "scenario": "gaming",
-                    "details": "Scaled physics calculations for battle scene",
-                },
-            ]
-            data.extend(gaming_activities)
 
-    elif scenario == "automotive":
-        if data_type == "metrics":
-            # Automotive scenario: Ultra-low latency for safety-critical systems
+def _gaming_activity_scenario(data: list, now: datetime) -> None:
+    """Apply the gaming scenario to the activity stream"""
+    _extend_scenario_activities(data, "gaming", now)
 
-            # Critical latency requirements for collision avoidance
-            data["latency"] = min(25, max(8, data.get("latency", 50) - 30))
 
-            # High CPU usage for real-time sensor processing
-            data["cpu_usage"] = min(92, data.get("cpu_usage", 50) + 30)
+def _automotive_metrics_scenario(data: dict, now: datetime) -> None:
+    """Apply the automotive scenario to the metrics"""
+    # Automotive scenario: Ultra-low latency for safety-critical systems
 
-            # Moderate GPU usage for computer vision
-            data["gpu_usage"] = min(75, data.get("gpu_usage", 50) + 15)
+    _apply_scenario_bounds(data, "automotive")
 
-            # Low queue depth - safety systems get priority
-            data["queue_depth"] = max(2, min(15, data.get("queue_depth", 25) - 18))
+    # Add automotive-specific metadata
+    vehicles, sensor_rate, alerts = _RNG.integers(
+        (25, 500, 0), (150, 2000, 3), endpoint=True
+    ).tolist()
+    data["scenario_context"] = {
+        "connected_vehicles": vehicles,
+        "sensor_data_rate": f"{sensor_rate} Hz",
+        "safety_alerts_active": alerts,
+    }
 
-            # Add automotive-specific metadata
-            data["scenario_context"] = {
-                "connected_vehicles": random.randint(25, 150),
-                "sensor_data_rate": f"{random.randint(500, 2000)} Hz",
-                "safety_alerts_active": random.randint(0, 3),
-            }
 
-        elif data_type == "activity":
-            # Add comprehensive automotive-specific activities
-            auto_activities = [
-                {
-                    "time": datetime.now(UTC),
-                    "agent": "SafetyMonitor",
-                    "action": "COLLISION_AVOIDANCE_CHECK",
-                    "level": "success",
-                    "scenario": "automotive",
-                    "details": f"Processed {random.randint(50, 200)} sensor readings",
-                },
-                {
-                    "time": datetime.now(UTC) - timedelta(seconds=1),
-                    "agent": "DecisionCoordinator",
-                    "action": "ROUTE_OPTIMIZATION",
-                    "level": "info",
-                    "scenario": "automotive",
-                    "details": f"Optimized routes for {random.randint(15, 45)} vehicles",
-                },
-                {
-                    "time": datetime.now(UTC) - timedelta(seconds=2),
-                    "agent": "LoadBalancer",
-                    "action": "V2X_COMMUNICATION_SYNC",
-                    "level": "success",
-                    "scenario": "automotive",
-                    "details": "Synchronized vehicle-to-everything communications",
-                },
-                {
-                    "time": datetime.now(UTC) - timedelta(seconds=3),
-                    "agent": "CacheManager",
-                    "action": "MAP_DATA_PRELOAD",
-                    "level": "info",
-                    "scenario": "automotive",
-                    "details": f"Preloaded HD maps for {random.randint(5, 15)} km radius",
-                },
-                {
-                    "time": datetime.now(UTC) - timedelta(seconds=5),
-                    "agent": "ResourceMonitor",
-                    "action": "EMERGENCY_RESPONSE_READY",
-                    "level": "warning" if random.random() < 0.3 else "success",
-                    "scenario": "automotive",
-                    "details": "Emergency braking system status verified",
-                },
-            ]
-            data.extend(auto_activities)
+def _automotive_activity_scenario(data: list, now: datetime) -> None:
+    """Apply the automotive scenario to the activity stream"""
+    _extend_scenario_activities(data, "automotive", now)
 
-    elif scenario == "healthcare":
-        if data_type == "metrics":
-            # Healthcare scenario: Reliable processing for patient monitoring
 
-            # Consistent low latency for patient monitoring
-            data["latency"] = min(40, max(15, data.get("latency", 50) - 20))
+def _healthcare_metrics_scenario(data: dict, now: datetime) -> None:
+    """Apply the healthcare scenario to the metrics"""
+    # Healthcare scenario: Reliable processing for patient monitoring
 
-            # Moderate CPU usage for continuous monitoring
-            data["cpu_usage"] = min(70, data.get("cpu_usage", 50) + 10)
+    _apply_scenario_bounds(data, "healthcare")
 
-            # Low GPU usage - mostly data processing, not rendering
-            data["gpu_usage"] = min(45, data.get("gpu_usage", 50) - 10)
+    # Add healthcare-specific metadata
+    patients, vitals, alerts = _RNG.integers(
+        (50, 1000, 0), (200, 5000, 5), endpoint=True
+    ).tolist()
+    data["scenario_context"] = {
+        "monitored_patients": patients,
+        "vital_signs_processed": f"{vitals}/min",
+        "alert_conditions": alerts,
+    }
 
-            # Steady queue depth for continuous patient data
-            data["queue_depth"] = min(40, max(10, data.get("queue_depth", 25) + 5))
 
-            # Add healthcare-specific metadata
-            data["scenario_context"] = {
-                "monitored_patients": random.randint(50, 200),
-                "vital_signs_processed": f"{random.randint(1000, 5000)}/min",
-                "alert_conditions": random.randint(0, 5),
-            }
+def _healthcare_activity_scenario(data: list, now: datetime) -> None:
+    """Apply the healthcare scenario to the activity stream"""
+    _extend_scenario_activities(data, "healthcare", now)
+
+
+# Demo scenario modifiers, dispatched on (scenario, data_type)
+_DEMO_SCENARIO_HANDLERS = {
+    ("gaming", "metrics"): _gaming_metrics_scenario,
+    ("gaming", "activity"): _gaming_activity_scenario,
+    ("automotive", "metrics"): _automotive_metrics_scenario,
+    ("automotive", "activity"): _automotive_activity_scenario,
+    ("healthcare", "metrics"): _healthcare_metrics_scenario,
+    ("healthcare", "activity"): _healthcare_activity_scenario,
+}
 
-        elif data_type == "activity":
-            # Add comprehensive healthcare-specific activities
-            healthcare_activities = [
-                {
-                    "time": datetime.now(UTC),
-                    "agent": "PatientMonitor",
-                    "action": "VITAL_SIGNS_ANALYSIS",
-                    "level": "success",
-                    "scenario": "healthcare",
-                    "details": f"Analyzed vitals for {random.randint(25, 100)} patients",
-                },
-                {
-                    "time": datetime.now(UTC) - timedelta(seconds=2),
-                    "agent": "DecisionCoordinator",
-                    "action": "ALERT_PRIORITIZATION",
-                    "level": "warning" if random.random() < 0.4 else "info",
-                    "scenario": "healthcare",
-                    "details": f"Prioritized {random.randint(3, 12)} medical alerts",
-                },
-                {
-                    "time": datetime.now(UTC) - timedelta(seconds=4),
-                    "agent": "CacheManager",
-                    "action": "MEDICAL_RECORD_SYNC",
-                    "level": "success",
-                    "scenario": "healthcare",
-                    "details": f"Synchronized {random.randint(15, 60)} patient records",
-                },
-                {
-                    "time": datetime.now(UTC) - timedelta(seconds=6),
-                    "agent": "LoadBalancer",
-                    "action": "DIAGNOSTIC_LOAD_BALANCE",
-                    "level": "info",
-                    "scenario": "healthcare",
-                    "details": f"Balanced diagnostic requests across {random.randint(3, 8)} systems",
-                },
-                {
-                    "time": datetime.now(UTC) - timedelta(seconds=8),
-                    "agent": "ResourceMonitor",
-                    "action": "COMPLIANCE_CHECK",
-                    "level": "success",
-                    "scenario": "healthcare",
-                    "details": "HIPAA compliance verified for data processing",
-                },
-            ]
-            data.extend(healthcare_activities)
 
+def apply_demo_scenario(
+    data: dict, scenario: str, data_type: str, now: datetime | None = None
+) -> dict:
+    """Apply comprehensive demo scenario modifications to data."""
+    handler = _DEMO_SCENARIO_HANDLERS.get((scenario, data_type))
+    if handler:
+        handler(data, now or datetime.now(UTC))
     return data
 
 
@@ -532,6 +814,9 @@ def trigger_agent_conversation(
     swarm_coordinator: SwarmCoordinator, scenario: str
 ) -> dict:
     """Trigger real agent conversation and capture responses."""
+    # Event id and event time share one clock read; the result timestamps
+    # below stay per-branch since they mark when the swarm finished
+    now = datetime.now(UTC)
     try:
         from src.orchestrator.threshold_monitor import (
             EventType,
@@ -544,7 +829,7 @@ def trigger_agent_conversation(
             # Create a CPU threshold breach event
 
             threshold_event = ThresholdEvent(
-                event_id=f"breach_{int(time.time() * 1000)}",
+                event_id=f"breach_{int(now.timestamp() * 1000)}",
                 event_type=EventType.THRESHOLD_BREACH,
                 site_id="MEC_A",
                 metric_name="cpu_utilization",
@@ -552,7 +837,7 @@ def trigger_agent_conversation(
                 threshold_value=80.0,
                 severity=SeverityLevel.HIGH,
                 breach_duration_ms=2500,
-                timestamp=datetime.now(UTC),
+                timestamp=now,
                 details={"trigger_source": "dashboard", "scenario": scenario},
             )
 
@@ -578,7 +863,7 @@ def trigger_agent_conversation(
         elif scenario == "load_balancing":
             # Create a queue depth threshold breach for load balancing
             threshold_event = ThresholdEvent(
-                event_id=f"breach_{int(time.time() * 1000)}",
+                event_id=f"breach_{int(now.timestamp() * 1000)}",
                 event_type=EventType.THRESHOLD_BREACH,
                 site_id="MEC_B",
                 metric_name="queue_depth",
@@ -586,7 +871,7 @@ def trigger_agent_conversation(
                 threshold_value=50,
                 severity=SeverityLevel.MEDIUM,
                 breach_duration_ms=1800,
-                timestamp=datetime.now(UTC),
+                timestamp=now,
                 details={"trigger_source": "dashboard", "scenario": scenario},
             )
 
@@ -612,7 +897,7 @@ def trigger_agent_conversation(
         else:
             # Generic scenario - create a latency threshold breach
             threshold_event = ThresholdEvent(
-                event_id=f"breach_{int(time.time() * 1000)}",
+                event_id=f"breach_{int(now.timestamp() * 1000)}",
                 event_type=EventType.THRESHOLD_BREACH,
                 site_id="MEC_C",
                 metric_name="response_time_ms",
@@ -620,7 +905,7 @@ def trigger_agent_conversation(
                 threshold_value=100.0,
                 severity=SeverityLevel.MEDIUM,
                 breach_duration_ms=1200,
-                timestamp=datetime.now(UTC),
+                timestamp=now,
                 details={"trigger_source": "dashboard", "scenario": scenario},
             )
 
@@ -656,21 +941,21 @@ def trigger_agent_conversation(
 def extract_agent_conversations(swarm_event) -> list:
     """Extract agent conversations from swarm event."""
     conversations = []
+    # Fallback timestamp for entries that carry none, computed once
+    default_ts = datetime.now(UTC).isoformat()
 
     # Extract from swarm event details first (enhanced data from orchestrator)
     if swarm_event.details and "agent_interactions" in swarm_event.details:
-        for interaction in swarm_event.details["agent_interactions"]:
-            conversations.append(
-                {
-                    "agent": interaction.get("agent_id", "Unknown"),
-                    "message": interaction.get("output", ""),
-                    "timestamp": interaction.get(
-                        "timestamp", datetime.now(UTC).isoformat()
-                    ),
-                    "type": "agent_response",
-                    "step": interaction.get("step", 0),
-                }
-            )
+        conversations.extend(
+            {
+                "agent": interaction.get("agent_id", "Unknown"),
+                "message": interaction.get("output", ""),
+                "timestamp": interaction.get("timestamp", default_ts),
+                "type": "agent_response",
+                "step": interaction.get("step", 0),
+            }
+            for interaction in swarm_event.details["agent_interactions"]
+        )
 
     # Extract from decision swarm result
     if swarm_event.decision and hasattr(swarm_event.decision, "swarm_result"):
@@ -688,7 +973,7 @@ def extract_agent_conversations(swarm_event) -> list:
                         {
                             "agent": getattr(node, "node_id", f"Agent_{i+1}"),
                             "message": str(output),
-                            "timestamp": datetime.now(UTC).isoformat(),
+                            "timestamp": default_ts,
                             "type": "agent_response",
                             "step": i + 1,
                         }
@@ -697,17 +982,15 @@ def extract_agent_conversations(swarm_event) -> list:
         elif hasattr(swarm_result, "messages") or isinstance(swarm_result, dict):
             # Dictionary format with messages
             if isinstance(swarm_result, dict) and "messages" in swarm_result:
-                for msg in swarm_result["messages"]:
-                    conversations.append(
-                        {
-                            "agent": msg.get("agent", "Unknown"),
-                            "message": msg.get("content", ""),
-                            "timestamp": msg.get(
-                                "timestamp", datetime.now(UTC).isoformat()
-                            ),
-                            "type": msg.get("type", "response"),
-                        }
-                    )
+                conversations.extend(
+                    {
+                        "agent": msg.get("agent", "Unknown"),
+                        "message": msg.get("content", ""),
+                        "timestamp": msg.get("timestamp", default_ts),
+                        "type": msg.get("type", "response"),
+                    }
+                    for msg in swarm_result["messages"]
+                )
 
         elif isinstance(swarm_result, str) and len(swarm_result.strip()) > 0:
             # String result - only show if it's not just "Status.FAILED"
@@ -716,7 +999,7 @@ def extract_agent_conversations(swarm_event) -> list:
                     {
                         "agent": "SwarmResult",
                         "message": swarm_result,
-                        "timestamp": datetime.now(UTC).isoformat(),
+                        "timestamp": default_ts,
                         "type": "final_output",
                     }
                 )
@@ -775,6 +1058,37 @@ def extract_agent_conversations(swarm_event) -> list:
     return conversations
 
 
+# Conversation table columns and the row background for each message type
+_CONVERSATION_COLUMNS = ["time", "agent", "type", "message", "details"]
+_CONVERSATION_TYPE_COLORS = {
+    "decision_reasoning": "background-color: rgba(33, 195, 84, 0.15)",
+    "final_output": "background-color: rgba(33, 195, 84, 0.15)",
+    "agent_response": "background-color: rgba(28, 131, 225, 0.12)",
+    "trigger": "background-color: rgba(255, 189, 69, 0.18)",
+    "error": "background-color: rgba(255, 43, 43, 0.15)",
+}
+
+
+def _conversation_details(conv: dict) -> str:
+    """Short type-specific detail text for a conversation table row"""
+    conv_type = conv.get("type", "response")
+    if conv_type == "decision_reasoning":
+        return (
+            f"🎯 {conv.get('selected_site', 'Unknown')} "
+            f"({conv.get('confidence', 0.0):.1%})"
+        )
+    if conv_type == "agent_response":
+        step = conv.get("step", "")
+        if step and step > 1:
+            return f"🔄 Handoff - Step {step}"
+        return f"Step {step}" if step else ""
+    if conv_type == "coordination_summary":
+        status_icon = "✅" if conv.get("success", False) else "❌"
+        participants = conv.get("participants", [])
+        return f"{status_icon} {', '.join(participants)}".rstrip()
+    return ""
+
+
 def display_agent_conversations(conversations_data: list):
     """Display real agent conversations and reasoning."""
     # Only show in Real mode
@@ -799,211 +1113,42 @@ def display_agent_conversations(conversations_data: list):
 
     # Get settings from session state (set by sidebar controls)
     show_threading = st.session_state.get("show_threading", True)
-    auto_scroll = st.session_state.get("auto_scroll", True)
 
-    # Group conversations by trigger event if available
     recent_conversations = conversations_data[-15:]  # Show last 15 conversations
 
-    # Group conversations by threading if enabled
-    if len(conversations_data) > 0 and show_threading:
-        # Group conversations by event or time proximity
-        conversation_threads = []
-        current_thread = []
-
-        for conv in recent_conversations:
-            conv_type = conv.get("type", "")
-
-            # Start new thread on trigger events
-            if conv_type == "trigger" and current_thread:
-                conversation_threads.append(current_thread)
-                current_thread = [conv]
-            else:
-                current_thread.append(conv)
-
-        # Add final thread
-        if current_thread:
-            conversation_threads.append(current_thread)
-
-        # Display threaded conversations
-        for thread_idx, thread in enumerate(conversation_threads):
-            if len(thread) > 1:
-                with st.expander(
-                    f"🧵 **Conversation Thread {thread_idx + 1}** ({len(thread)} messages)",
-                    expanded=True,
-                ):
-                    for i, conv in enumerate(thread):
-                        _display_single_conversation(conv, i, len(thread))
-            else:
-                # Single conversation, display normally
-                _display_single_conversation(thread[0], 0, 1)
-    else:
-        # Display conversations without threading
-        for i, conv in enumerate(recent_conversations):
-            _display_single_conversation(conv, i, len(recent_conversations))
-
-
-def _display_single_conversation(conv: dict, index: int, total: int):
-    """Display a single conversation with enhanced formatting."""
-    agent_name = conv.get("agent", "Unknown Agent")
-    message = conv.get("message", "")
-    conv_type = conv.get("type", "response")
-    timestamp = conv.get("timestamp", "")
-
-    # Format timestamp
-    try:
-        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        time_str = dt.strftime("%H:%M:%S")
-    except:
-        time_str = "Unknown"
-
-    # Enhanced styling based on conversation type
-    if conv_type == "decision_reasoning":
-        confidence = conv.get("confidence", 0.0)
-        selected_site = conv.get("selected_site", "Unknown")
-
-        st.success(f"🎯 **{agent_name}** ({time_str}) - Confidence: {confidence:.1%}")
-        st.markdown(f"**Selected Site:** {selected_site}")
-        st.markdown(f"**Reasoning:** {message}")
-
-    elif conv_type == "agent_response":
-        step = conv.get("step", "")
-        step_text = f" - Step {step}" if step else ""
-
-        # Show agent handoff indicators
-        if step and step > 1:
-            st.info(f"🔄 **Agent Handoff** → **{agent_name}** ({time_str}){step_text}")
-        else:
-            st.info(f"🤖 **{agent_name}** ({time_str}){step_text}")
-
-        # Enhanced message display with reasoning extraction
-        if len(message) > 300:
-            with st.expander(f"View full response from {agent_name}"):
-                # Try to extract reasoning patterns from agent response
-                if "reasoning" in message.lower() or "analysis" in message.lower():
-                    st.markdown("**🧠 Agent Reasoning:**")
-                st.markdown(message)
-
-            # Show preview with reasoning highlight
-            preview = message[:300]
-            if "reasoning" in preview.lower():
-                st.markdown(f"*🧠 {preview}...*")
-            else:
-                st.markdown(f"*{preview}...*")
-        else:
-            # Highlight reasoning in shorter messages
-            if "reasoning" in message.lower() or "analysis" in message.lower():
-                st.markdown(f"**🧠 Agent Reasoning:** *{message}*")
-            else:
-                st.markdown(f"*{message}*")
-
-    elif conv_type == "coordination_summary":
-        success = conv.get("success", False)
-        participants = conv.get("participants", [])
-
-        status_icon = "✅" if success else "❌"
-        st.write(f"{status_icon} **{agent_name}** ({time_str})")
-        st.markdown(f"**Summary:** {message}")
-        if participants:
-            st.caption(f"**Participants:** {', '.join(participants)}")
-
-    elif conv_type == "final_output":
-        st.success(f"🏁 **{agent_name}** ({time_str})")
-        st.markdown(f"**Final Output:** {message}")
-
-    elif conv_type == "trigger":
-        st.warning(f"⚡ **{agent_name}** ({time_str})")
-        st.markdown(f"**Trigger:** {message}")
-
-    elif conv_type == "error":
-        st.error(f"❌ **{agent_name}** ({time_str})")
-        st.markdown(f"**Error:** {message}")
-
-    else:
-        # Default conversation display
-        st.write(f"💬 **{agent_name}** ({time_str})")
-        st.markdown(f"{message}")
-
-    # Add separator except for last item in non-threaded view
-    if index < total - 1:
-        st.divider()
-        agent_name = conv.get("agent", "Unknown Agent")
-        message = conv.get("message", "")
-        conv_type = conv.get("type", "response")
-        timestamp = conv.get("timestamp", "")
-
-        # Format timestamp
-        try:
-            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            time_str = dt.strftime("%H:%M:%S")
-        except:
-            time_str = "Unknown"
-
-        # Enhanced styling based on conversation type
-        if conv_type == "decision_reasoning":
-            confidence = conv.get("confidence", 0.0)
-            selected_site = conv.get("selected_site", "Unknown")
-
-            st.success(
-                f"🎯 **{agent_name}** ({time_str}) - Confidence: {confidence:.1%}"
-            )
-            st.markdown(f"**Selected Site:** {selected_site}")
-            st.markdown(f"**Reasoning:** {message}")
-
-        elif conv_type == "agent_response":
-            step = conv.get("step", "")
-            step_text = f" - Step {step}" if step else ""
-
-            # Show agent handoff indicators
-            if step and step > 1:
-                st.info(
-                    f"🔄 **Agent Handoff** → **{agent_name}** ({time_str}){step_text}"
-                )
-            else:
-                st.info(f"🤖 **{agent_name}** ({time_str}){step_text}")
-
-            # Enhanced message display with reasoning extraction
-            if len(message) > 300:
-                with st.expander(f"View full response from {agent_name}"):
-                    # Try to extract reasoning patterns from agent response
-                    if "reasoning" in message.lower() or "analysis" in message.lower():
-                        st.markdown("**🧠 Agent Reasoning:**")
-                    st.markdown(message)
-
-                # Show preview with reasoning highlight
-                preview = message[:300]
-                if "reasoning" in preview.lower():
-                    st.markdown(f"*🧠 {preview}...*")
-                else:
-                    st.markdown(f"*{preview}...*")
-            else:
-                # Highlight reasoning in shorter messages
-                if "reasoning" in message.lower() or "analysis" in message.lower():
-                    st.markdown(f"**🧠 Agent Reasoning:** *{message}*")
-                else:
-                    st.markdown(f"*{message}*")
-
-        elif conv_type == "coordination_summary":
-            success = conv.get("success", False)
-            participants = conv.get("participants", [])
-
-            status_icon = "✅" if success else "❌"
-            st.write(f"{status_icon} **{agent_name}** ({time_str})")
-            st.markdown(f"**Summary:** {message}")
-            if participants:
-                st.caption(f"**Participants:** {', '.join(participants)}")
-
-        elif conv_type == "final_output":
-            st.success(f"🏁 **{agent_name}** ({time_str})")
-            st.markdown(f"**Final Output:** {message}")
-
-        elif conv_type == "trigger":
-            st.warning(f"⚡ **{agent_name}** ({time_str})")
-            st.markdown(f"**Trigger:** {message}")
-
-        else:
-            # Default conversation display
-            st.write(f"💬 **{agent_name}** ({time_str})")
-            st.markdown(f"{message}")
+    # One table payload instead of several widgets per conversation
+    df = pd.DataFrame(
+        {
+            "time": pd.to_datetime(
+                [conv.get("timestamp", "") for conv in recent_conversations],
+                utc=True,
+                format="ISO8601",
+                errors="coerce",
+            ).strftime("%H:%M:%S"),
+            "agent": [
+                conv.get("agent", "Unknown Agent") for conv in recent_conversations
+            ],
+            "type": [conv.get("type", "response") for conv in recent_conversations],
+            "message": [conv.get("message", "") for conv in recent_conversations],
+            "details": [_conversation_details(conv) for conv in recent_conversations],
+        },
+        columns=_CONVERSATION_COLUMNS,
+    )
+    df["time"] = df["time"].fillna("Unknown")
+
+    # Group conversations by threading if enabled: each trigger opens a thread
+    if show_threading:
+        triggers = df["type"] == "trigger"
+        df.insert(0, "thread", triggers.cumsum() + int(not triggers.iat[0]))
+
+    st.dataframe(
+        df.style.map(
+            lambda conv_type: _CONVERSATION_TYPE_COLORS.get(conv_type, ""),
+            subset=["type"],
+        ),
+        use_container_width=True,
+        hide_index=True,
+    )
 
 
 def apply_scenario_swarm_behaviors(swarm_data: dict, scenario: str) -> dict:
@@ -1014,9 +1159,10 @@ def apply_scenario_swarm_behaviors(swarm_data: dict, scenario: str) -> dict:
         for site, data in swarm_data.items():
             if data["status"] == "active":
                 # Simulate multiplayer session coordination
-                if random.random() < 0.3:  # 30% chance of gaming-specific behavior
-                    data["gaming_sessions"] = random.randint(5, 25)
-                    data["npc_ai_load"] = random.randint(60, 95)
+                if _RNG.random() < 0.3:  # 30% chance of gaming-specific behavior
+                    data["gaming_sessions"], data["npc_ai_load"] = _RNG.integers(
+                        (5, 60), (25, 95), endpoint=True
+                    ).tolist()
 
                     # Adjust load based on gaming activity
                     if data["gaming_sessions"] > 15:
@@ -1027,8 +1173,9 @@ def apply_scenario_swarm_behaviors(swarm_data: dict, scenario: str) -> dict:
         for site, data in swarm_data.items():
             if data["status"] == "active":
                 # Simulate vehicle coordination
-                data["connected_vehicles"] = random.randint(10, 80)
-                data["safety_alerts"] = random.randint(0, 3)
+                data["connected_vehicles"], data["safety_alerts"] = _RNG.integers(
+                    (10, 0), (80, 3), endpoint=True
+                ).tolist()
 
                 # Priority handling for safety systems
                 if data["safety_alerts"] > 0:
@@ -1040,8 +1187,9 @@ def apply_scenario_swarm_behaviors(swarm_data: dict, scenario: str) -> dict:
         for site, data in swarm_data.items():
             if data["status"] == "active":
                 # Simulate patient monitoring
-                data["monitored_patients"] = random.randint(20, 150)
-                data["vital_alerts"] = random.randint(0, 5)
+                data["monitored_patients"], data["vital_alerts"] = _RNG.integers(
+                    (20, 0), (150, 5), endpoint=True
+                ).tolist()
 
                 # Ensure reliability for patient care
                 if data["vital_alerts"] > 2:
@@ -1104,6 +1252,9 @@ def main():
         st.session_state.scenario_active = False
     if "agent_conversations" not in st.session_state:
         st.session_state.agent_conversations = []
+    if "activity_buffer" not in st.session_state:
+        st.session_state.activity_buffer = deque(maxlen=_ACTIVITY_BUFFER_SIZE)
+        st.session_state.activity_tick = 0
 
     # Simple sidebar controls
     with st.sidebar:
@@ -1187,18 +1338,18 @@ def main():
                 )
 
                 # Change scenario every 15 seconds
-                if time.time() - st.session_state.auto_demo_last_change > 15:
+                current_time = time.time()
+                if current_time - st.session_state.auto_demo_last_change > 15:
                     st.session_state.auto_demo_step += 1
                     st.session_state.demo_scenario = demo_sequence[current_step]
-                    st.session_state.auto_demo_last_change = time.time()
+                    st.session_state.auto_demo_last_change = current_time
 
             # Scenario-specific threshold adjustments
-            if st.session_state.demo_scenario == "automotive":
-                st.info("🚗 **Automotive Mode**: Ultra-low latency thresholds active")
-            elif st.session_state.demo_scenario == "gaming":
-                st.info("🎮 **Gaming Mode**: High GPU utilization expected")
-            elif st.session_state.demo_scenario == "healthcare":
-                st.info("🏥 **Healthcare Mode**: Reliable, consistent processing")
+            threshold_info = _SCENARIO_THRESHOLD_INFO.get(
+                st.session_state.demo_scenario
+            )
+            if threshold_info:
+                st.info(threshold_info)
 
             # System mode
             mode = st.selectbox(
@@ -1233,10 +1384,14 @@ def main():
 
             if api_key and st.button("🔍 Validate", key="validate_button"):
                 with st.spinner("Validating..."):
-                    if validate_claude_api_key(api_key):
+                    if _validate_cached(api_key):
                         try:
                             os.environ["ANTHROPIC_API_KEY"] = api_key
-                            st.session_state.swarm_coordinator = SwarmCoordinator()
+                            st.session_state.swarm_coordinator = _get_coordinator(
+                                hashlib.blake2b(
+                                    api_key.encode(), digest_size=16
+                                ).hexdigest()
+                            )
                             st.session_state.api_key_validated = True
                             st.success("✅ Ready!")
                         except Exception as e:
@@ -1422,233 +1577,268 @@ def main():
                     key="sidebar_export_conversations",
                     help="Export conversations as JSON",
                 ):
-                    import json
-
+                    exported_at = datetime.now(UTC)
                     export_data = {
-                        "timestamp": datetime.now(UTC).isoformat(),
+                        "timestamp": exported_at.isoformat(),
                         "total_conversations": len(conversations),
                         "conversations": conversations,
                     }
                     st.download_button(
                         label="Download JSON",
-                        data=json.dumps(export_data, indent=2),
-                        file_name=f"agent_conversations_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}.json",
+                        data=_dumps_json(export_data),
+                        file_name=f"agent_conversations_{exported_at.strftime('%Y%m%d_%H%M%S')}.json",
                         mime="application/json",
                         key="sidebar_download_conversations",
                     )
 
-    # Auto-refresh logic
-    placeholder = st.empty()
-
-    while True:
-        with placeholder.container():
-            # Create layout inside the refresh loop to avoid duplicate elements
-            if (
-                st.session_state.dashboard_mode == "Real Strands Agents Mode"
-                and st.session_state.api_key_validated
-            ):
-                # Real mode: Show agent conversations prominently
-                col1, col2 = st.columns([1, 1])
+    # Auto-refresh logic: only the panels rerun on the timer, the sidebar
+    # widgets above keep their state and are not re-executed every tick
+    st.fragment(run_every=refresh_rate)(_render_panels)(
+        mode, selected_sites, latency_threshold, cpu_threshold
+    )
 
-                with col1:
-                    st.subheader("📊 Real-time Metrics")
-                    metrics_container = st.container()
 
-                    st.subheader("🤝 Swarm Visualization")
-                    swarm_container = st.container()
+def _render_panels(mode, selected_sites, latency_threshold, cpu_threshold):
+    """Render the dashboard panels (run as a fragment on the refresh timer)"""
+    # One clock read per tick, shared by the generators and scenario handlers
+    now = datetime.now(UTC)
 
-                with col2:
-                    st.subheader("🤖 Agent Conversations")
-                    conversations_container = st.container()
+    # Create layout inside the fragment to avoid duplicate elements
+    if (
+        st.session_state.dashboard_mode == "Real Strands Agents Mode"
+        and st.session_state.api_key_validated
+    ):
+        # Real mode: Show agent conversations prominently
+        col1, col2 = st.columns([1, 1])
 
-                    # Manual agent triggers
-                    st.subheader("🎯 Trigger Agent Activity")
-                    trigger_container = st.container()
+        with col1:
+            st.subheader("📊 Real-time Metrics")
+            metrics_container = st.container()
 
-                # Full width for activity stream in real mode
-                st.subheader("🚨 Live Agent Activity Stream")
-                activity_container = st.container()
+            st.subheader("🤝 Swarm Visualization")
+            swarm_container = st.container()
 
-            else:
-                # Mock mode: Original 4-panel layout
-                col1, col2 = st.columns(2)
+        with col2:
+            st.subheader("🤖 Agent Conversations")
+            conversations_container = st.container()
 
-                with col1:
-                    st.subheader("📊 Real-time Metrics")
-                    metrics_container = st.container()
+            # Manual agent triggers
+            st.subheader("🎯 Trigger Agent Activity")
+            trigger_container = st.container()
 
-                    st.subheader("🤝 Swarm Visualization")
-                    swarm_container = st.container()
+        # Full width for activity stream in real mode
+        st.subheader("🚨 Live Agent Activity Stream")
+        activity_container = st.container()
 
-                with col2:
-                    st.subheader("🚨 Agent Activity Stream")
-                    activity_container = st.container()
+    else:
+        # Mock mode: Original 4-panel layout
+        col1, col2 = st.columns(2)
 
-                    st.subheader("📈 Performance Analytics")
-                    analytics_container = st.container()
-            # Generate data based on dashboard mode
-            if (
-                st.session_state.dashboard_mode == "Real Strands Agents Mode"
-                and st.session_state.api_key_validated
-                and st.session_state.swarm_coordinator
-            ):
-                # Real mode with validated API key
-                try:
-                    with st.spinner("🤖 Fetching real agent data..."):
-                        metrics_data = get_real_metrics_data(
-                            st.session_state.swarm_coordinator, mode
-                        )
-                        swarm_data = get_real_swarm_data(
-                            st.session_state.swarm_coordinator, selected_sites
-                        )
-                        activity_data = get_real_activity_data(
-                            st.session_state.swarm_coordinator
-                        )
+        with col1:
+            st.subheader("📊 Real-time Metrics")
+            metrics_container = st.container()
 
-                    # Show success indicator for real mode
-                    if metrics_data.get("real_mode"):
-                        st.sidebar.success("🟢 Real agents active")
+            st.subheader("🤝 Swarm Visualization")
+            swarm_container = st.container()
 
-                except Exception as e:
-                    # Handle API failures with graceful fallback
-                    error_msg = str(e)
-                    st.sidebar.error(f"❌ API Error: {error_msg[:50]}...")
+        with col2:
+            st.subheader("🚨 Agent Activity Stream")
+            activity_container = st.container()
 
-                    # Check if it's an API key issue
-                    if "api" in error_msg.lower() or "auth" in error_msg.lower():
-                        st.sidebar.warning("🔄 Falling back to Mock Mode")
-                        st.session_state.api_key_validated = False
-                        st.session_state.swarm_coordinator = None
+            st.subheader("📈 Performance Analytics")
+            analytics_container = st.container()
+    # Generate data based on dashboard mode
+    if (
+        st.session_state.dashboard_mode == "Real Strands Agents Mode"
+        and st.session_state.api_key_validated
+        and st.session_state.swarm_coordinator
+    ):
+        # Real mode with validated API key
+        try:
+            with st.spinner("🤖 Fetching real agent data..."):
+                # One concurrent round trip for the three bridge reads
+                bridge_metrics, bridge_swarm, bridge_activity = _run_bridge(
+                    _fetch_bridge_data()
+                )
+                metrics_data = get_real_metrics_data(
+                    st.session_state.swarm_coordinator, mode, bridge_metrics
+                )
+                swarm_data = get_real_swarm_data(
+                    st.session_state.swarm_coordinator, selected_sites, bridge_swarm
+                )
+                activity_data = get_real_activity_data(
+                    st.session_state.swarm_coordinator, bridge_activity
+                )
 
-                    # Fallback to mock data
-                    metrics_data = generate_metrics_data(mode)
-                    swarm_data = generate_swarm_data(selected_sites, mode)
-                    activity_data = generate_activity_data(mode)
+            # Show success indicator for real mode (fragments cannot write
+            # to the sidebar, so status is shown inline)
+            if metrics_data.get("real_mode"):
+                st.success("🟢 Real agents active")
 
-                    # Add error indicator to data
-                    metrics_data["fallback_mode"] = True
-                    swarm_data["fallback_mode"] = True
+        except Exception as e:
+            # Handle API failures with graceful fallback
+            error_msg = str(e)
+            st.error(f"❌ API Error: {error_msg[:50]}...")
 
-            # Periodic agent activity in Real mode (every 30 seconds)
-            if (
-                st.session_state.dashboard_mode == "Real Strands Agents Mode"
-                and st.session_state.api_key_validated
-                and st.session_state.swarm_coordinator
-            ):
+            # Check if it's an API key issue
+            if "api" in error_msg.lower() or "auth" in error_msg.lower():
+                st.warning("🔄 Falling back to Mock Mode")
+                st.session_state.api_key_validated = False
+                st.session_state.swarm_coordinator = None
 
-                current_time = time.time()
-                last_activity = st.session_state.get("last_agent_activity", 0)
+            # Fallback to mock data
+            metrics_data = generate_metrics_data(mode, now)
+            swarm_data = generate_swarm_data(selected_sites, mode)
+            activity_data = generate_activity_data(mode, now)
 
-                if current_time - last_activity > 30:  # 30 seconds
-                    try:
-                        # Trigger background agent activity
-                        simulation_result = asyncio.run(
-                            dashboard_bridge.simulate_agent_mcp_calls()
-                        )
+            # Add error indicator to data
+            metrics_data["fallback_mode"] = True
+            swarm_data["fallback_mode"] = True
 
-                        if simulation_result.get("success"):
-                            # Add simulated conversation
-                            st.session_state.agent_conversations.append(
-                                {
-                                    "agent": "BackgroundOrchestrator",
-                                    "message": f"Completed {len(simulation_result.get('simulation_results', []))} MCP tool calls for system monitoring",
-                                    "timestamp": datetime.now(UTC).isoformat(),
-                                    "type": "background_activity",
-                                }
-                            )
+    # Periodic agent activity in Real mode (every 30 seconds)
+    if (
+        st.session_state.dashboard_mode == "Real Strands Agents Mode"
+        and st.session_state.api_key_validated
+        and st.session_state.swarm_coordinator
+    ):
 
-                        st.session_state.last_agent_activity = current_time
+        # The simulation runs as one task on the bridge loop; the panels only
+        # drain its finished results and never wait on an MCP call here
+        simulation = st.session_state.get("background_simulation")
+        if simulation is None or simulation["future"].done():
+            simulation = {
+                "results": queue.SimpleQueue(),
+                "last_poll": time.monotonic(),
+                "stopped": False,
+                "wake": asyncio.Event(),
+            }
+            simulation["future"] = asyncio.run_coroutine_threadsafe(
+                _periodic_simulate(simulation), _get_bridge_loop()
+            )
+            st.session_state.background_simulation = simulation
+        simulation["last_poll"] = time.monotonic()
 
-                    except Exception as e:
-                        print(f"Background agent activity error: {e}")
-            else:
-                # Mock mode (default)
-                metrics_data = generate_metrics_data(mode)
-                swarm_data = generate_swarm_data(selected_sites, mode)
-                activity_data = generate_activity_data(mode)
-
-            # Handle automated demo sequence
-            if st.session_state.get("auto_demo_active", False):
-                trigger_automated_demo_sequence()
-
-                # Add demo activities to activity stream
-                demo_activities = st.session_state.get("demo_activities", [])
-                activity_data.extend(demo_activities[-5:])  # Add last 5 demo activities
-
-            # Apply demo scenario modifications (works for both modes)
-            if st.session_state.demo_scenario != "normal":
-                metrics_data = apply_demo_scenario(
-                    metrics_data, st.session_state.demo_scenario, "metrics"
-                )
-                activity_data = apply_demo_scenario(
-                    activity_data, st.session_state.demo_scenario, "activity"
-                )
+        while True:
+            try:
+                simulation_result = simulation["results"].get_nowait()
+            except queue.Empty:
+                break
 
-                # Apply scenario-specific swarm behaviors
-                swarm_data = apply_scenario_swarm_behaviors(
-                    swarm_data, st.session_state.demo_scenario
+            if simulation_result.get("success"):
+                # Add simulated conversation
+                st.session_state.agent_conversations.append(
+                    {
+                        "agent": "BackgroundOrchestrator",
+                        "message": f"Completed {len(simulation_result.get('simulation_results', []))} MCP tool calls for system monitoring",
+                        "timestamp": now.isoformat(),
+                        "type": "background_activity",
+                    }
                 )
+    else:
+        # Mock mode (default); a simulation left over from Real mode is woken
+        # so it exits now rather than idling until its liveness timeout
+        _stop_background_simulation()
+        metrics_data = generate_metrics_data(mode, now)
+        swarm_data = generate_swarm_data(selected_sites, mode)
+        activity_data = _push_activity(mode, now)
+
+    # Handle automated demo sequence
+    if st.session_state.get("auto_demo_active", False):
+        trigger_automated_demo_sequence()
+
+        # Add demo activities to activity stream
+        demo_activities = st.session_state.get("demo_activities", [])
+        activity_data.extend(demo_activities[-5:])  # Add last 5 demo activities
+
+    # Apply demo scenario modifications (works for both modes)
+    scenario = st.session_state.demo_scenario
+    if scenario != "normal":
+        metrics_data = apply_demo_scenario(metrics_data, scenario, "metrics", now)
+        activity_data = apply_demo_scenario(activity_data, scenario, "activity", now)
+
+        # Apply scenario-specific swarm behaviors
+        swarm_data = apply_scenario_swarm_behaviors(swarm_data, scenario)
+
+    # Update metrics panel
+    with metrics_container:
+        display_metrics(metrics_data, latency_threshold, cpu_threshold)
+
+    # Update swarm visualization
+    with swarm_container:
+        display_swarm_network(swarm_data)
+
+    # Update activity stream
+    with activity_container:
+        display_activity_stream(activity_data)
+
+    # Real mode specific panels
+    if (
+        st.session_state.dashboard_mode == "Real Strands Agents Mode"
+        and st.session_state.api_key_validated
+    ):
 
-            # Update metrics panel
-            with metrics_container:
-                display_metrics(metrics_data, latency_threshold, cpu_threshold)
-
-            # Update swarm visualization
-            with swarm_container:
-                display_swarm_network(swarm_data)
-
-            # Update activity stream
-            with activity_container:
-                display_activity_stream(activity_data)
-
-            # Real mode specific panels
-            if (
-                st.session_state.dashboard_mode == "Real Strands Agents Mode"
-                and st.session_state.api_key_validated
-            ):
-
-                # Display agent conversations
-                with conversations_container:
-                    conversations = st.session_state.get("agent_conversations", [])
-                    display_agent_conversations(conversations)
-
-                # Display agent triggers (outside refresh loop to avoid duplicates)
-                with trigger_container:
-                    if st.session_state.get("show_triggers", True):
-                        st.write("🎯 **Manual Agent Triggers:**")
-                        st.write(
-                            "Use the sidebar controls to trigger agent activities."
-                        )
-            else:
-                # Mock mode analytics
-                with analytics_container:
-                    display_analytics()
-
-        time.sleep(refresh_rate)
-
+        # Display agent conversations
+        with conversations_container:
+            conversations = st.session_state.get("agent_conversations", [])
+            display_agent_conversations(conversations)
 
-def generate_metrics_data(mode):
+        # Display agent triggers (outside refresh loop to avoid duplicates)
+        with trigger_container:
+            if st.session_state.get("show_triggers", True):
+                st.write("🎯 **Manual Agent Triggers:**")
+                st.write("Use the sidebar controls to trigger agent activities.")
+    else:
+        # Mock mode analytics
+        with analytics_container:
+            display_analytics()
+
+
+# Mock metric bases per mode as (latency, CPU, GPU, queue depth) arrays; the
+# None entry covers every mode without its own bases
+_MOCK_METRIC_BASES = {
+    "Threshold Breach": np.array((120, 85, 70, 60)),
+    "Swarm Active": np.array((35, 55, 70, 15)),
+    None: np.array((45, 65, 70, 25)),
+}
+
+# Number of mock activities kept in the per-session ring buffer
+_ACTIVITY_BUFFER_SIZE = 10
+
+# Mock activity stream per mode: (agent, action, level, seconds ago); the
+# None entry covers every mode without its own stream
+_MODE_ACTIVITY_TEMPLATES = {
+    "Threshold Breach": (
+        ("Orchestrator", "THRESHOLD_BREACH_DETECTED", "warning", 0),
+        ("SwarmCoordinator", "SWARM_ACTIVATION", "info", 5),
+        ("LoadBalancer", "ROUTE_OPTIMIZATION", "info", 10),
+    ),
+    "Swarm Active": (
+        ("SwarmCoordinator", "CONSENSUS_ACHIEVED", "success", 0),
+        ("LoadBalancer", "LOAD_DISTRIBUTED", "info", 3),
+        ("ResourceMonitor", "METRICS_UPDATED", "info", 7),
+    ),
+    None: (
+        ("Orchestrator", "REQUEST_PROCESSED", "info", 0),
+        ("CacheManager", "CACHE_HIT", "success", 2),
+        ("ResourceMonitor", "HEALTH_CHECK", "info", 5),
+    ),
+}
+
+
+def generate_metrics_data(mode, now: datetime | None = None):
     """Generate mock metrics data"""
-    base_latency = 45
-    base_cpu = 65
-    base_gpu = 70
-    base_queue = 25
-
-    if mode == "Threshold Breach":
-        base_latency = 120
-        base_cpu = 85
-        base_queue = 60
-    elif mode == "Swarm Active":
-        base_latency = 35
-        base_cpu = 55
-        base_queue = 15
+    # Base values plus one vectorized jitter draw for all four metrics
+    latency, cpu_usage, gpu_usage, queue_depth = (
+        _MOCK_METRIC_BASES.get(mode, _MOCK_METRIC_BASES[None])
+        + _RNG.integers(_MOCK_JITTER_LOW, _MOCK_JITTER_HIGH)
+    ).tolist()
 
     return {
-        "latency": base_latency + random.randint(-10, 10),
-        "cpu_usage": base_cpu + random.randint(-5, 15),
-        "gpu_usage": base_gpu + random.randint(-10, 20),
-        "queue_depth": base_queue + random.randint(-5, 25),
-        "timestamp": datetime.now(UTC),
+        "latency": latency,
+        "cpu_usage": cpu_usage,
+        "gpu_usage": gpu_usage,
+        "queue_depth": queue_depth,
+        "timestamp": now or datetime.now(UTC),
     }
 
 
@@ -1656,111 +1846,134 @@ def generate_swarm_data(sites, mode):
     """Generate mock swarm coordination data with scenario-specific behaviors"""
     swarm_data = {}
 
-    for site in sites:
+    # Default loads and connections for every site in one draw each
+    loads = _RNG.integers(20, 60, size=len(sites), endpoint=True).tolist()
+    connections = _RNG.integers(5, 25, size=len(sites), endpoint=True).tolist()
+
+    for site, base_load, base_connections in zip(
+        sites,
+        loads,
+        connections,
+        strict=True,
+    ):
         status = "active"
-        base_load = random.randint(20, 60)
-        base_connections = random.randint(5, 25)
+        load = base_load
+        site_connections = base_connections
 
         # Apply mode-specific modifications
         if mode == "Threshold Breach" and site == "MEC-Site-A":
             status = "overloaded"
-            base_load = random.randint(85, 95)
+            load = int(_RNG.integers(85, 95, endpoint=True))
         elif mode == "Failover Test" and site == "MEC-Site-B":
             status = "failed"
-            base_load = 0
-            base_connections = 0
+            load = 0
+            site_connections = 0
         elif mode == "Swarm Active":
             # Show coordinated load balancing
             if site == "MEC-Site-A":
-                base_load = random.randint(45, 65)  # Balanced
+                load = int(_RNG.integers(45, 65, endpoint=True))  # Balanced
             elif site == "MEC-Site-B":
-                base_load = random.randint(30, 50)  # Lower load
+                load = int(_RNG.integers(30, 50, endpoint=True))  # Lower load
             else:
-                base_load = random.randint(55, 75)  # Higher load
+                load = int(_RNG.integers(55, 75, endpoint=True))  # Higher load
 
         swarm_data[site] = {
             "status": status,
-            "load": base_load,
-            "connections": base_connections,
+            "load": load,
+            "connections": site_connections,
             "is_healthy": status == "active",
         }
 
     return swarm_data
 
 
-def generate_activity_data(mode):
+def generate_activity_data(mode, now: datetime | None = None):
     """Generate mock agent activity data"""
-    now = datetime.now(UTC)
+    now = now or datetime.now(UTC)
+    templates = _MODE_ACTIVITY_TEMPLATES.get(mode, _MODE_ACTIVITY_TEMPLATES[None])
+
+    return [
+        {
+            "time": now - timedelta(seconds=seconds_ago),
+            "agent": agent,
+            "action": action,
+            "level": level,
+        }
+        for agent, action, level, seconds_ago in templates
+    ]
+
+
+def _push_activity(mode: str, now: datetime) -> list:
+    """Append this tick's mock activity to the session ring buffer"""
+    # Rotates through the mode's templates, one entry per panel refresh; the
+    # returned list is a copy since scenario handlers extend it. A mode switch
+    # starts a fresh stream at the top of the new rotation
+    buffer = st.session_state.activity_buffer
+    if st.session_state.get("activity_mode") != mode:
+        buffer.clear()
+        st.session_state.activity_tick = 0
+        st.session_state.activity_mode = mode
+
+    templates = _MODE_ACTIVITY_TEMPLATES.get(mode, _MODE_ACTIVITY_TEMPLATES[None])
+    agent, action, level, _ = templates[st.session_state.activity_tick % len(templates)]
+    st.session_state.activity_tick += 1
+    buffer.appendleft({"time": now, "agent": agent, "action": action, "level": level})
+    return list(buffer)
+
+
+def _gaming_context_captions(context: dict) -> tuple:
+    """Caption row for the gaming scenario context"""
+    return (
+        f"🎮 Players: {context.get('active_players', 'N/A')}",
+        f"🤖 NPC AI: {context.get('npc_ai_load', 'N/A')}",
+        f"⚡ Physics: {context.get('physics_calculations', 'N/A')}",
+    )
+
+
+def _automotive_context_captions(context: dict) -> tuple:
+    """Caption row for the automotive scenario context"""
+    alerts = context.get("safety_alerts_active", 0)
+    alert_color = "🔴" if alerts > 0 else "🟢"
+    return (
+        f"🚗 Vehicles: {context.get('connected_vehicles', 'N/A')}",
+        f"📡 Sensors: {context.get('sensor_data_rate', 'N/A')}",
+        f"{alert_color} Alerts: {alerts}",
+    )
+
+
+def _healthcare_context_captions(context: dict) -> tuple:
+    """Caption row for the healthcare scenario context"""
+    alerts = context.get("alert_conditions", 0)
+    alert_color = "🔴" if alerts > 2 else "🟡" if alerts > 0 else "🟢"
+    return (
+        f"🏥 Patients: {context.get('monitored_patients', 'N/A')}",
+        f"💓 Vitals: {context.get('vital_signs_processed', 'N/A')}",
+        f"{alert_color} Conditions: {alerts}",
+    )
+
+
+_SCENARIO_CONTEXT_CAPTIONS = {
+    "gaming": _gaming_context_captions,
+    "automotive": _automotive_context_captions,
+    "healthcare": _healthcare_context_captions,
+}
+
+
+# Metric fields tracked between refreshes for the st.metric deltas
+_METRIC_FIELDS = ("latency", "cpu_usage", "gpu_usage", "queue_depth")
 
-    if mode == "Threshold Breach":
-        activities = [
-            {
-                "time": now,
-                "agent": "Orchestrator",
-                "action": "THRESHOLD_BREACH_DETECTED",
-                "level": "warning",
-            },
-            {
-                "time": now - timedelta(seconds=5),
-                "agent": "SwarmCoordinator",
-                "action": "SWARM_ACTIVATION",
-                "level": "info",
-            },
-            {
-                "time": now - timedelta(seconds=10),
-                "agent": "LoadBalancer",
-                "action": "ROUTE_OPTIMIZATION",
-                "level": "info",
-            },
-        ]
-    elif mode == "Swarm Active":
-        activities = [
-            {
-                "time": now,
-                "agent": "SwarmCoordinator",
-                "action": "CONSENSUS_ACHIEVED",
-                "level": "success",
-            },
-            {
-                "time": now - timedelta(seconds=3),
-                "agent": "LoadBalancer",
-                "action": "LOAD_DISTRIBUTED",
-                "level": "info",
-            },
-            {
-                "time": now - timedelta(seconds=7),
-                "agent": "ResourceMonitor",
-                "action": "METRICS_UPDATED",
-                "level": "info",
-            },
-        ]
-    else:
-        activities = [
-            {
-                "time": now,
-                "agent": "Orchestrator",
-                "action": "REQUEST_PROCESSED",
-                "level": "info",
-            },
-            {
-                "time": now - timedelta(seconds=2),
-                "agent": "CacheManager",
-                "action": "CACHE_HIT",
-                "level": "success",
-            },
-            {
-                "time": now - timedelta(seconds=5),
-                "agent": "ResourceMonitor",
-                "action": "HEALTH_CHECK",
-                "level": "info",
-            },
-        ]
 
-    return activities
+def _metric_delta(data: dict, prev: dict | None, field: str, unit: str):
+    """Change in a metric since the last refresh, or None when unchanged"""
+    if prev is None:
+        return None
+    delta = data[field] - prev[field]
+    return f"{delta:+}{unit}" if delta else None
 
 
 def display_metrics(data, latency_threshold, cpu_threshold):
     """Display real-time metrics with mode indicators and scenario context"""
+    scenario = st.session_state.get("demo_scenario", "normal")
 
     # Add mode indicator banner
     if data.get("real_mode"):
@@ -1778,56 +1991,18 @@ def display_metrics(data, latency_threshold, cpu_threshold):
     # Show scenario-specific context if available
     scenario_context = data.get("scenario_context", {})
     if scenario_context:
-        scenario = st.session_state.get("demo_scenario", "normal")
-
-        if scenario == "gaming":
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.caption(
-                    f"🎮 Players: {scenario_context.get('active_players', 'N/A')}"
-                )
-            with col2:
-                st.caption(f"🤖 NPC AI: {scenario_context.get('npc_ai_load', 'N/A')}")
-            with col3:
-                st.caption(
-                    f"⚡ Physics: {scenario_context.get('physics_calculations', 'N/A')}"
-                )
-
-        elif scenario == "automotive":
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.caption(
-                    f"🚗 Vehicles: {scenario_context.get('connected_vehicles', 'N/A')}"
-                )
-            with col2:
-                st.caption(
-                    f"📡 Sensors: {scenario_context.get('sensor_data_rate', 'N/A')}"
-                )
-            with col3:
-                alerts = scenario_context.get("safety_alerts_active", 0)
-                alert_color = "🔴" if alerts > 0 else "🟢"
-                st.caption(f"{alert_color} Alerts: {alerts}")
-
-        elif scenario == "healthcare":
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.caption(
-                    f"🏥 Patients: {scenario_context.get('monitored_patients', 'N/A')}"
-                )
-            with col2:
-                st.caption(
-                    f"💓 Vitals: {scenario_context.get('vital_signs_processed', 'N/A')}"
-                )
-            with col3:
-                alerts = scenario_context.get("alert_conditions", 0)
-                alert_color = "🔴" if alerts > 2 else "🟡" if alerts > 0 else "🟢"
-                st.caption(f"{alert_color} Conditions: {alerts}")
+        captions = _SCENARIO_CONTEXT_CAPTIONS.get(scenario)
+        if captions:
+            for col, caption in zip(
+                st.columns(3),
+                captions(scenario_context),
+                strict=True,
+            ):
+                with col:
+                    st.caption(caption)
 
     col1, col2, col3, col4 = st.columns(4)
 
-    # Scenario-specific threshold adjustments
-    scenario = st.session_state.get("demo_scenario", "normal")
-
     # Adjust thresholds based on scenario
     if scenario == "automotive":
         latency_threshold = min(latency_threshold, 30)  # Stricter for safety
@@ -1836,6 +2011,10 @@ def display_metrics(data, latency_threshold, cpu_threshold):
     elif scenario == "healthcare":
         latency_threshold = min(latency_threshold, 50)  # Moderate for reliability
 
+    # Deltas are the real change since the previous refresh of this session
+    prev = st.session_state.get("prev_metrics")
+    st.session_state.prev_metrics = {field: data[field] for field in _METRIC_FIELDS}
+
     # Determine threshold breach status
     latency_breach = data["latency"] > latency_threshold
     cpu_breach = data["cpu_usage"] > cpu_threshold
@@ -1856,7 +2035,7 @@ def display_metrics(data, latency_threshold, cpu_threshold):
         st.metric(
             f"Latency{latency_icon}",
             f"{data['latency']}ms",
-            delta=f"{random.randint(-5, 5)}ms",
+            delta=_metric_delta(data, prev, "latency", "ms"),
             delta_color=delta_color,
         )
 
@@ -1872,7 +2051,7 @@ def display_metrics(data, latency_threshold, cpu_threshold):
         st.metric(
             f"CPU Usage{cpu_icon}",
             f"{data['cpu_usage']}%",
-            delta=f"{random.randint(-3, 8)}%",
+            delta=_metric_delta(data, prev, "cpu_usage", "%"),
             delta_color=delta_color,
         )
 
@@ -1889,7 +2068,7 @@ def display_metrics(data, latency_threshold, cpu_threshold):
         st.metric(
             f"GPU Usage{gpu_icon}",
             f"{data['gpu_usage']}%",
-            delta=f"{random.randint(-5, 10)}%",
+            delta=_metric_delta(data, prev, "gpu_usage", "%"),
             delta_color=delta_color,
         )
 
@@ -1906,7 +2085,7 @@ def display_metrics(data, latency_threshold, cpu_threshold):
         st.metric(
             f"Queue Depth{queue_icon}",
             f"{data['queue_depth']}",
-            delta=f"{random.randint(-2, 5)}",
+            delta=_metric_delta(data, prev, "queue_depth", ""),
             delta_color=delta_color,
         )
 
@@ -1925,130 +2104,158 @@ def display_metrics(data, latency_threshold, cpu_threshold):
         )
 
 
-def display_swarm_network(swarm_data):
-    """Display enhanced swarm network visualization with scenario context"""
+# Per-site fields the swarm panel reads from the swarm data
+_SWARM_NODE_COLUMNS = ["status", "load", "connections"]
 
-    # Show scenario-specific swarm behavior summary
-    scenario = st.session_state.get("demo_scenario", "normal")
+# Swarm node marker colors; priority modes and unknown statuses draw green
+_STATUS_COLOR = {
+    "active": "green",
+    "overloaded": "red",
+    "failed": "gray",
+    "consensus": "blue",
+}
+
+# Static part of the swarm network layout; title and annotations are per build
+_SWARM_LAYOUT_BASE = {
+    "showlegend": False,
+    "xaxis": {"showgrid": False, "zeroline": False, "showticklabels": False},
+    "yaxis": {"showgrid": False, "zeroline": False, "showticklabels": False},
+    "height": 350,
+    "plot_bgcolor": "rgba(0,0,0,0)",
+    "paper_bgcolor": "rgba(0,0,0,0)",
+}
 
-    if scenario == "gaming":
-        st.caption(
-            "🎮 **Gaming Swarm Behavior**: Load balancing for multiplayer sessions and NPC AI processing"
-        )
-    elif scenario == "automotive":
-        st.caption(
-            "🚗 **Automotive Swarm Behavior**: Priority routing for safety-critical vehicle communications"
-        )
-    elif scenario == "healthcare":
-        st.caption(
-            "🏥 **Healthcare Swarm Behavior**: Reliable patient data processing with compliance monitoring"
-        )
-    else:
-        st.caption(
-            "🔄 **Standard Swarm Behavior**: Balanced load distribution across MEC sites"
-        )
 
-    # Create a simple network graph
-    graph = nx.Graph()
+# Swarm edge (width, color) per scenario: thicker orange for safety-critical
+# automotive links, purple gaming data flows, blue medical data flows
+_SCENARIO_EDGE_STYLE = {
+    "automotive": (3, "orange"),
+    "gaming": (2, "purple"),
+    "healthcare": (1, "blue"),
+}
 
-    # Add nodes for each MEC site
-    for site, data in swarm_data.items():
-        graph.add_node(site, status=data["status"], load=data["load"])
 
-    # Add edges between sites
-    sites = list(swarm_data.keys())
-    for i in range(len(sites)):
-        for j in range(i + 1, len(sites)):
-            # Vary edge thickness based on scenario
-            weight = 1
-            if scenario == "automotive":
-                weight = 3  # Thicker edges for critical communications
-            elif scenario == "gaming":
-                weight = 2  # Medium thickness for multiplayer sync
-            graph.add_edge(sites[i], sites[j], weight=weight)
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _swarm_layout(sites: tuple) -> dict:
+    """Spring layout for a fully connected site set; do not mutate the result"""
+    # networkx is only needed here, on the first layout of each site set
+    import networkx as nx
 
-    # Create positions for visualization
-    pos = nx.spring_layout(graph, seed=42)  # Fixed seed for consistent layout
+    # Fixed seed for consistent layout
+    return nx.spring_layout(nx.complete_graph(sites), seed=42)
+
+
+def _build_swarm_figure(sites: tuple, scenario: str) -> go.Figure:
+    """Build the static swarm figure: layout, edges and an empty node trace"""
+    # Positions depend only on the site set, shared read-only across sessions
+    pos = _swarm_layout(sites)
+    coords = np.array([pos[site] for site in sites], dtype=float).reshape(-1, 2)
 
     # Create plotly figure
     fig = go.Figure()
 
-    # Add edges with scenario-specific styling
-    for edge in graph.edges(data=True):
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-
-        # Edge color and width based on scenario
-        edge_color = "gray"
-        edge_width = edge[2].get("weight", 1)
-
-        if scenario == "automotive":
-            edge_color = "orange"  # Safety-critical communications
-        elif scenario == "gaming":
-            edge_color = "purple"  # Gaming data flows
-        elif scenario == "healthcare":
-            edge_color = "blue"  # Medical data flows
-
-        fig.add_trace(
-            go.Scatter(
-                x=[x0, x1, None],
-                y=[y0, y1, None],
-                mode="lines",
-                line={"width": edge_width, "color": edge_color},
-                showlegend=False,
-                hoverinfo="skip",
-            ),
-        )
+    # Every edge shares the scenario styling, so all of them go into one
+    # trace: preallocated (x0, x1, NaN) triples, NaN breaking the line
+    pairs = np.array(
+        list(itertools.combinations(range(len(sites)), 2)), dtype=np.intp
+    ).reshape(-1, 2)
+    edge_x = np.full(3 * len(pairs), np.nan)
+    edge_y = np.full(3 * len(pairs), np.nan)
+    edge_x[0::3], edge_y[0::3] = coords[pairs[:, 0]].T
+    edge_x[1::3], edge_y[1::3] = coords[pairs[:, 1]].T
+
+    # Edge color and width based on scenario
+    edge_width, edge_color = _SCENARIO_EDGE_STYLE.get(scenario, (1, "gray"))
+
+    fig.add_trace(
+        go.Scatter(
+            x=edge_x,
+            y=edge_y,
+            mode="lines",
+            line={"width": edge_width, "color": edge_color},
+            showlegend=False,
+            hoverinfo="skip",
+        ),
+    )
+
+    # All nodes go in one WebGL trace, drawn last; positions only depend on
+    # the site set, the marker arrays are filled by _update_swarm_figure
+    fig.add_trace(
+        go.Scattergl(
+            x=coords[:, 0],
+            y=coords[:, 1],
+            mode="markers",
+            marker={"line": {"width": 2, "color": "white"}},
+            hoverinfo="text",
+            showlegend=False,
+        ),
+    )
 
-    # Add nodes with enhanced information
-    for node in graph.nodes():
-        x, y = pos[node]
-        data = swarm_data[node]
-        status = data["status"]
-        load = data["load"]
-
-        # Node color based on status
-        color_map = {
-            "active": "green",
-            "overloaded": "red",
-            "failed": "gray",
-            "consensus": "blue",
+    fig.update_layout(
+        {
+            **_SWARM_LAYOUT_BASE,
+            "title": f"MEC Site Network Status - {scenario.title()} Mode",
         }
-        color = color_map.get(status, "green")
+    )
 
-        # Node size based on load
-        size = max(15, min(40, 15 + (load / 100) * 25))
+    return fig
 
-        # Hover text with detailed information
-        hover_text = f"{node}<br>Status: {status}<br>Load: {load}%<br>Connections: {data.get('connections', 0)}"
 
-        if scenario != "normal":
-            hover_text += f"<br>Scenario: {scenario.title()}"
-
-        fig.add_trace(
-            go.Scatter(
-                x=[x],
-                y=[y],
-                mode="markers+text",
-                marker={
-                    "size": size,
-                    "color": color,
-                    "line": {"width": 2, "color": "white"},
-                },
-                text=[f"{node}<br>{load}%"],
-                textposition="middle center",
-                textfont={"size": 10, "color": "white"},
-                hovertext=hover_text,
-                hoverinfo="text",
-                showlegend=False,
-            ),
+def _update_swarm_figure(
+    fig: go.Figure, nodes: pd.DataFrame, scenario: str, show_labels: bool
+) -> None:
+    """Refresh the node trace and annotations of a swarm figure in place"""
+    statuses = nodes["status"].to_numpy()
+    loads = nodes["load"].to_numpy()
+
+    # Annotation flags are column reductions over the node frame
+    has_overloaded = bool((statuses == "overloaded").any())
+    has_high_load = bool((loads > 80).any())
+
+    # Node color based on status, mapped over the whole column at once
+    colors = nodes["status"].map(_STATUS_COLOR).fillna("green").tolist()
+
+    # Node size based on load, clipped to the 15-40 px range in one ufunc call
+    sizes = np.clip(15.0 + loads.astype(np.float32) * 0.25, 15.0, 40.0)
+
+    # Hover text with detailed information; the scenario suffix is formatted
+    # once and skipped entirely on the normal path
+    hovers = [
+        f"{node}<br>Status: {status}<br>Load: {load}%<br>Connections: {connections}"
+        for node, status, load, connections in zip(
+            nodes.index,
+            statuses,
+            loads,
+            nodes["connections"].to_numpy(),
+            strict=True,
+        )
+    ]
+    if scenario != "normal":
+        suffix = f"<br>Scenario: {scenario.title()}"
+        hovers = [hover_text + suffix for hover_text in hovers]
+
+    # Node and load stay in the hover; text labels are opt-in since glyph
+    # layout dominates paint time as the swarm grows
+    node_trace = fig.data[-1]
+    node_trace.marker.size = sizes
+    node_trace.marker.color = colors
+    node_trace.hovertext = hovers
+    if show_labels:
+        node_trace.update(
+            mode="markers+text",
+            text=[
+                f"{node}<br>{load}%"
+                for node, load in zip(nodes.index, loads, strict=True)
+            ],
+            textposition="middle center",
+            textfont={"size": 10, "color": "white"},
         )
+    else:
+        node_trace.update(mode="markers", text=None)
 
     # Add scenario-specific annotations
     annotations = []
-    if scenario == "automotive" and any(
-        data["status"] == "overloaded" for data in swarm_data.values()
-    ):
+    if scenario == "automotive" and has_overloaded:
         annotations.append(
             {
                 "text": "⚠️ Safety Alert: Rerouting critical traffic",
@@ -2060,9 +2267,7 @@ def display_swarm_network(swarm_data):
                 "font": {"color": "red", "size": 12},
             }
         )
-    elif scenario == "gaming" and any(
-        data["load"] > 80 for data in swarm_data.values()
-    ):
+    elif scenario == "gaming" and has_high_load:
         annotations.append(
             {
                 "text": "🎮 High Load: Scaling multiplayer instances",
@@ -2074,27 +2279,72 @@ def display_swarm_network(swarm_data):
                 "font": {"color": "purple", "size": 12},
             }
         )
+    fig.layout.annotations = annotations
 
-    fig.update_layout(
-        title=f"MEC Site Network Status - {scenario.title()} Mode",
-        showlegend=False,
-        xaxis={"showgrid": False, "zeroline": False, "showticklabels": False},
-        yaxis={"showgrid": False, "zeroline": False, "showticklabels": False},
-        height=350,
-        annotations=annotations,
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
+
+@st.fragment
+def display_swarm_network(swarm_data):
+    """Display enhanced swarm network visualization with scenario context"""
+
+    # Show scenario-specific swarm behavior summary
+    scenario = st.session_state.get("demo_scenario", "normal")
+
+    if scenario == "gaming":
+        st.caption(
+            "🎮 **Gaming Swarm Behavior**: Load balancing for multiplayer sessions and NPC AI processing"
+        )
+    elif scenario == "automotive":
+        st.caption(
+            "🚗 **Automotive Swarm Behavior**: Priority routing for safety-critical vehicle communications"
+        )
+    elif scenario == "healthcare":
+        st.caption(
+            "🏥 **Healthcare Swarm Behavior**: Reliable patient data processing with compliance monitoring"
+        )
+    else:
+        st.caption(
+            "🔄 **Standard Swarm Behavior**: Balanced load distribution across MEC sites"
+        )
+
+    # Struct-of-arrays view of the swarm, one row per site, so the figure
+    # arrays and the aggregates below are column operations
+    nodes = (
+        pd.DataFrame.from_dict(swarm_data, orient="index")
+        .reindex(columns=_SWARM_NODE_COLUMNS)
+        .fillna({"connections": 0})
+        .astype({"connections": int})
+        .sort_index()
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    # The panel is its own fragment, so toggling labels reruns only this panel
+    show_labels = st.checkbox(
+        "🏷️ Node Labels",
+        value=False,
+        help="Draw site name and load on the swarm nodes (small swarms only)",
+        key="show_node_labels",
+    ) and (len(nodes) < 10)
+
+    # The figure persists in session state and is rebuilt only when the site
+    # set or scenario changes; otherwise just its node arrays are refreshed
+    figure_key = (tuple(nodes.index), scenario)
+    cached = st.session_state.get("swarm_fig")
+    if cached is None or cached[0] != figure_key:
+        cached = (figure_key, _build_swarm_figure(*figure_key))
+        st.session_state.swarm_fig = cached
+    fig = cached[1]
+    _update_swarm_figure(fig, nodes, scenario, show_labels)
+
+    # A stable key keeps the chart element (and its zoom state) across reruns
+    st.plotly_chart(fig, use_container_width=True, key="swarm_network")
 
     # Show swarm coordination status
-    active_sites = sum(1 for data in swarm_data.values() if data["status"] == "active")
-    total_sites = len(swarm_data)
-    avg_load = (
-        sum(data["load"] for data in swarm_data.values()) / total_sites
-        if total_sites > 0
-        else 0
+    total_sites = len(nodes)
+    active_sites = int((nodes["status"] == "active").sum())
+    avg_load = float(nodes["load"].mean()) if total_sites > 0 else 0
+    coordination_status = (
+        "🟢 Optimal"
+        if avg_load < 70
+        else "🟡 Busy" if avg_load < 85 else "🔴 Overloaded"
     )
 
     col1, col2, col3 = st.columns(3)
@@ -2103,56 +2353,66 @@ def display_swarm_network(swarm_data):
     with col2:
         st.metric("Avg Load", f"{avg_load:.1f}%")
     with col3:
-        coordination_status = (
-            "🟢 Optimal"
-            if avg_load < 70
-            else "🟡 Busy" if avg_load < 85 else "🔴 Overloaded"
-        )
         st.metric("Coordination", coordination_status)
 
 
+def _summarize_activities(activities: list, scenario: str) -> tuple:
+    """Return (total, scenario, success) counts for the activity panel"""
+    # Count scenario and success events in one pass for the header and stats
+    scenario_count = 0
+    success_count = 0
+    for activity in activities:
+        if activity.get("scenario") == scenario:
+            scenario_count += 1
+        if activity.get("level") == "success":
+            success_count += 1
+
+    return len(activities), scenario_count, success_count
+
+
+@st.fragment
 def display_activity_stream(activities):
     """Display enhanced agent activity stream with scenario context"""
 
     # Show scenario-specific activity summary
     scenario = st.session_state.get("demo_scenario", "normal")
-    scenario_activities = [a for a in activities if a.get("scenario") == scenario]
 
-    if scenario_activities and scenario != "normal":
+    total_activities, scenario_count, success_count = _summarize_activities(
+        activities, scenario
+    )
+
+    if scenario_count and scenario != "normal":
         st.caption(
-            f"🎯 **{scenario.title()} Activities**: {len(scenario_activities)} scenario-specific events"
+            f"🎯 **{scenario.title()} Activities**: {scenario_count} scenario-specific events"
         )
 
+    # Plain rows are joined into one markdown block; the block is flushed
+    # before each expander so the stream keeps its chronological order
+    simple_rows = []
     for activity in activities[:12]:  # Show last 12 activities
-        level_colors = {
-            "info": "🔵",
-            "success": "🟢",
-            "warning": "🟡",
-            "error": "🔴",
-        }
-
-        icon = level_colors.get(activity["level"], "⚪")
-        time_str = activity["time"].strftime("%H:%M:%S")
+        icon = _LEVEL_COLORS.get(activity["level"], "⚪")
+        t = activity["time"]
+        time_str = f"{t.hour:02d}:{t.minute:02d}:{t.second:02d}"
 
         # Add scenario-specific icons
         scenario_icon = ""
         if activity.get("scenario"):
-            scenario_icons = {
-                "gaming": "🎮",
-                "automotive": "🚗",
-                "healthcare": "🏥",
-            }
-            scenario_icon = f" {scenario_icons.get(activity['scenario'], '')}"
+            scenario_icon = f" {_SCENARIO_ICONS.get(activity['scenario'], '')}"
 
         # Enhanced display for real mode
         if activity.get("real_mode"):
             mode_indicator = " 🤖"
+            row = (
+                f"{icon} **{time_str}** - {activity['agent']}: "
+                f"{activity['action']}{scenario_icon}{mode_indicator}"
+            )
 
             # Show more details for real agent activities
             if activity.get("mcp_source") or activity.get("swarm_source"):
-                with st.expander(
-                    f"{icon} **{time_str}** - {activity['agent']}: {activity['action']}{scenario_icon}{mode_indicator}"
-                ):
+                if simple_rows:
+                    st.markdown("\n\n".join(simple_rows))
+                    simple_rows = []
+                with st.expander(row):
                     if activity.get("details"):
                         if isinstance(activity["details"], dict):
                             st.json(activity["details"])
@@ -2165,59 +2425,98 @@ def display_activity_stream(activities):
                             "*Real agent activity - click triggers above to see detailed conversations*"
                         )
             else:
-                st.write(
-                    f"{icon} **{time_str}** - {activity['agent']}: "
-                    f"{activity['action']}{scenario_icon}{mode_indicator}"
-                )
+                simple_rows.append(row)
         else:
             # Enhanced mock mode display with scenario details
+            row = (
+                f"{icon} **{time_str}** - {activity['agent']}: "
+                f"{activity['action']}{scenario_icon}"
+            )
             if activity.get("details"):
-                with st.expander(
-                    f"{icon} **{time_str}** - {activity['agent']}: {activity['action']}{scenario_icon}"
-                ):
+                if simple_rows:
+                    st.markdown("\n\n".join(simple_rows))
+                    simple_rows = []
+                with st.expander(row):
                     st.markdown(f"**Details:** {activity['details']}")
             else:
-                st.write(
-                    f"{icon} **{time_str}** - {activity['agent']}: {activity['action']}{scenario_icon}"
-                )
+                simple_rows.append(row)
+
+    if simple_rows:
+        st.markdown("\n\n".join(simple_rows))
 
     # Show activity statistics
-    if len(activities) > 0:
-        total_activities = len(activities)
-        scenario_count = len(
-            [
-                a
-                for a in activities
-                if a.get("scenario") == scenario and scenario != "normal"
-            ]
-        )
-        success_count = len([a for a in activities if a.get("level") == "success"])
+    if total_activities > 0:
+        if scenario != "normal":
+            count_caption = f"🎯 {scenario.title()}: {scenario_count}"
+        else:
+            count_caption = f"✅ Success: {success_count}"
+        success_rate = success_count / total_activities * 100
 
         col1, col2, col3 = st.columns(3)
         with col1:
             st.caption(f"📊 Total: {total_activities}")
         with col2:
-            if scenario != "normal":
-                st.caption(f"🎯 {scenario.title()}: {scenario_count}")
-            else:
-                st.caption(f"✅ Success: {success_count}")
+            st.caption(count_caption)
         with col3:
-            success_rate = (
-                (success_count / total_activities * 100) if total_activities > 0 else 0
-            )
             st.caption(f"📈 Success: {success_rate:.0f}%")
 
 
-def display_analytics():
-    """Display performance analytics"""
-    # Generate some time series data for demo
-    now = datetime.now(UTC)
-    times = [now - timedelta(minutes=x) for x in range(30, 0, -1)]
-    latencies = [45 + random.randint(-10, 15) for _ in times]
+# Upper bound on points sent to the browser per line trace
+_MAX_LINE_POINTS = 1000
+
 
-    df = pd.DataFrame({"Time": times, "Latency": latencies})
+def _minmax_downsample(x, y, max_points: int) -> tuple:
+    """Reduce a series to per-bucket min/max points, keeping both endpoints"""
+    y = np.asarray(y)
+    n = len(y)
+    if n <= max_points:
+        return x, y
 
-    fig = px.line(df, x="Time", y="Latency", title="Latency Trend (30 min)")
+    # Each bucket contributes its min and max sample, so spikes survive; the
+    # edges span the whole series so no tail samples fall outside a bucket
+    n_bins = max_points // 2
+    edges = np.linspace(0, n, n_bins + 1).astype(int)
+    bins = np.repeat(np.arange(n_bins), np.diff(edges))
+    picks = [np.array([0, n - 1])]
+    for extremes in (
+        np.minimum.reduceat(y, edges[:-1]),
+        np.maximum.reduceat(y, edges[:-1]),
+    ):
+        # First sample in each bucket that equals the bucket extreme
+        hits = np.flatnonzero(y == extremes[bins])
+        picks.append(hits[np.unique(bins[hits], return_index=True)[1]])
+    idx = np.unique(np.concatenate(picks))
+    return np.asarray(x)[idx], y[idx]
+
+
+def _make_line(x, y, **kwargs) -> go.Figure:
+    """Build a single-series WebGL line figure, downsampled for the browser"""
+    x, y = _minmax_downsample(x, y, _MAX_LINE_POINTS)
+    return go.Figure(data=[go.Scattergl(x=x, y=y, mode="lines", **kwargs)])
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _latency_series(bucket_minute: int) -> tuple:
+    """Build the latency trend series; keyed to the minute so it refreshes"""
+    # Generate some time series data for demo (30 one-minute samples
+    # ending a minute ago)
+    n = 30
+    times = pd.date_range(
+        end=pd.Timestamp.now(tz="UTC") - pd.Timedelta(minutes=1),
+        periods=n,
+        freq="1min",
+    )
+    latencies = 45 + _RNG.integers(-10, 16, size=n)
+
+    return _minmax_downsample(times, latencies, _MAX_LINE_POINTS)
+
+
+def _build_latency_figure() -> go.Figure:
+    """Build the empty latency trend figure with its threshold line"""
+    fig = _make_line([], [], name="Latency")
+    fig.update_layout(
+        title="Latency Trend (30 min)", xaxis_title="Time", yaxis_title="Latency"
+    )
     fig.add_hline(
         y=100,
         line_dash="dash",
@@ -2225,7 +2524,25 @@ def display_analytics():
         annotation_text="Threshold",
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+
+@st.fragment
+def display_analytics():
+    """Display performance analytics"""
+    # The figure persists in session state; only its series is swapped when
+    # the minute bucket rolls over
+    bucket_minute = int(datetime.now(UTC).timestamp() // 60)
+    cached = st.session_state.get("latency_fig")
+    if cached is None:
+        cached = {"bucket": None, "figure": _build_latency_figure()}
+        st.session_state.latency_fig = cached
+    fig = cached["figure"]
+    if cached["bucket"] != bucket_minute:
+        fig.data[0].x, fig.data[0].y = _latency_series(bucket_minute)
+        cached["bucket"] = bucket_minute
+
+    st.plotly_chart(fig, use_container_width=True, key="latency_analytics")
 
 
 if __name__ == "__main__":
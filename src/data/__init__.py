@@ -8,6 +8,7 @@ and session management functionality.
 from .data_store import DataStore, StreamlitSessionManager
 from .metrics_generator import (
     MECMetrics,
+    MECMetricsBatch,
     MECMetricsGenerator,
     MetricType,
     OperationMode,
@@ -16,6 +17,7 @@ from .metrics_generator import (
 __all__ = [
     "DataStore",
     "MECMetrics",
+    "MECMetricsBatch",
     "MECMetricsGenerator",
     "MetricType",
     "OperationMode",
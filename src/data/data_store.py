@@ -1,25 +1,162 @@
 """
 Data persistence layer for EdgeMind MEC orchestration system.
 
-This module provides JSON-based data storage for metrics history,
-session state management for Streamlit continuity, and data export
-functionality for analysis.
+This module provides JSON-based data storage for current metrics, an
+append-only frame log for metrics history, session state management for
+Streamlit continuity, and data export functionality for analysis.
+
+Primary files (config.json, exports) are written atomically through a
+temporary file and rename. Derived files that are rewritten on every
+update (per-site current metrics, session state) are overwritten in place;
+a reader that catches one mid-write sees an empty result, and the next
+update repairs it.
 """
 
+import atexit
 import csv
+import gzip
 import json
-import shutil
+import os
+import re
+import struct
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 try:
-    import streamlit as st
+    import msgspec  # optional: C JSON codec for the hot metrics/session files
 except ImportError:
-    st = None
+    msgspec = None
+
+try:
+    import zstandard  # optional: faster, tighter compression for archives
+except ImportError:
+    zstandard = None
 
 from .metrics_generator import MECMetrics
 
+# Compact JSON codec for the files rewritten on every store; msgspec when
+# installed, otherwise the stdlib encoder without indentation
+if msgspec is not None:
+    _json_encode = msgspec.json.Encoder(enc_hook=str).encode
+    _json_decode = msgspec.json.Decoder().decode
+    _JSON_DECODE_ERRORS = (ValueError, msgspec.DecodeError)
+else:
+
+    def _json_encode(data: Any) -> bytes:
+        """Encode data as compact UTF-8 JSON."""
+        return json.dumps(
+            data, ensure_ascii=False, separators=(",", ":"), default=str
+        ).encode("utf-8")
+
+    _json_decode = json.loads
+    _JSON_DECODE_ERRORS = (ValueError,)
+
+# Compressor for archived exports; zstd level 3 when installed, else gzip
+if zstandard is not None:
+    _ARCHIVE_SUFFIX = ".zst"
+    _archive_compress = zstandard.ZstdCompressor(level=3).compress
+else:
+    _ARCHIVE_SUFFIX = ".gz"
+    _archive_compress = gzip.compress
+
+# Metrics history frame header: 4-byte big-endian payload length
+_FRAME_HEADER = struct.Struct(">I")
+
+# Frames appended by this store end with a numeric "_ts" key
+_NUMERIC_TAIL_TS = re.compile(rb',"_ts":-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\}\Z')
+
+# History index entry: hour bucket and byte offset of the first frame that
+# reaches it; entries are only added when the bucket exceeds all earlier ones
+_INDEX_ENTRY = struct.Struct(">qQ")
+_INDEX_BUCKET_S = 3600
+
+# Leading bytes of every frame payload, which starts with the site_id key
+_SITE_ID_PREFIX = b'{"site_id":'
+
+# History log size that triggers a background compaction pass
+_HISTORY_COMPACT_BYTES = 8 * 1024 * 1024
+
+# Appends between background compaction passes, so stale records are
+# trimmed even when the log stays small
+_HISTORY_COMPACT_APPENDS = 10_000
+
+# Write buffer for streamed exports
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# CSV export columns; network latency is a JSON string for complex data
+_CSV_HEADER = (
+    "site_id",
+    "timestamp",
+    "cpu_utilization",
+    "gpu_utilization",
+    "memory_utilization",
+    "queue_depth",
+    "response_time_ms",
+    "requests_per_second",
+    "active_connections",
+    "cache_hit_ratio",
+    "network_latency_json",
+)
+
+# Session state keys holding flat settings dicts
+_SESSION_SETTINGS_KEYS = frozenset({"simulation_settings", "dashboard_settings"})
+
+# Minimum seconds between session file writes that only touch last_accessed
+_SESSION_TOUCH_FLUSH_S = 30.0
+
+# Delay before cached current metrics updates are written to disk
+_CURRENT_FLUSH_INTERVAL_S = 1.0
+
+
+def _record_ts(metric_data: dict[str, Any]) -> float:
+    """Epoch seconds of a history record, parsing records written without _ts."""
+    if "_ts" not in metric_data:
+        metric_data["_ts"] = datetime.fromisoformat(
+            metric_data["timestamp"]
+        ).timestamp()
+    return metric_data["_ts"]
+
+
+def _scan_files(directory: Path | str) -> Iterator[os.DirEntry]:
+    """Recursively yield file entries under a directory."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
+def _index_append(
+    buckets: list[int],
+    offsets: list[int],
+    bucket: int,
+    offset: int,
+) -> bool:
+    """Add a history index entry if the bucket exceeds every earlier one."""
+    if buckets and bucket <= buckets[-1]:
+        return False
+    buckets.append(bucket)
+    offsets.append(offset)
+    return True
+
+
+def _copy_state(state: dict[str, Any]) -> dict[str, Any]:
+    """Copy session state down to its settings dicts so callers can't alias it."""
+    return {k: dict(v) if isinstance(v, dict) else v for k, v in state.items()}
+
+
+def _copy_record(record: dict[str, Any]) -> dict[str, Any]:
+    """Copy a current-metrics record with its own network_latency dict."""
+    return {**record, "network_latency": dict(record.get("network_latency", {}))}
+
 
 class DataStore:
     """
@@ -33,43 +170,80 @@ class DataStore:
     - Thread-safe operations
     """
 
-    def __init__(self, data_dir: str = "data", max_history_days: int = 7):
+    def __init__(
+        self,
+        data_dir: str = "data",
+        max_history_days: int = 7,
+        flush_interval_s: float = _CURRENT_FLUSH_INTERVAL_S,
+    ):
         """
         Initialize the data store.
 
         Args:
             data_dir: Directory for data storage
             max_history_days: Maximum days to keep historical data
+            flush_interval_s: Seconds to coalesce current metrics writes
         """
         self.data_dir = Path(data_dir)
         self.max_history_days = max_history_days
+        self.flush_interval_s = flush_interval_s
 
         # Create directory structure
         self.data_dir.mkdir(exist_ok=True)
         (self.data_dir / "metrics").mkdir(exist_ok=True)
+        (self.data_dir / "metrics" / "current").mkdir(exist_ok=True)
         (self.data_dir / "sessions").mkdir(exist_ok=True)
         (self.data_dir / "exports").mkdir(exist_ok=True)
         (self.data_dir / "archive").mkdir(exist_ok=True)
 
         # File paths
-        self.metrics_file = self.data_dir / "metrics" / "current_metrics.json"
-        self.history_file = self.data_dir / "metrics" / "metrics_history.json"
+        self.current_dir = self.data_dir / "metrics" / "current"
+        self.history_file = self.data_dir / "metrics" / "metrics_history.log"
         self.session_file = self.data_dir / "sessions" / "session_state.json"
         self.config_file = self.data_dir / "config.json"
+        self._history_compact_at = _HISTORY_COMPACT_BYTES
 
         # Initialize files if they don't exist
         self._initialize_files()
 
+        # Hour-bucket index over the history log, mirrored in a sidecar file
+        self.history_index_file = self.history_file.with_suffix(".idx")
+        self._history_lock = threading.RLock()
+        self._load_history_index()
+        self._open_history()
+
+        # Compaction runs on a single background worker, one pass at a time
+        self._compaction_lock = threading.Lock()
+        self._compactor: ThreadPoolExecutor | None = None
+        self._compaction: Future | None = None
+        self._appends_since_compaction = 0
+
+        # Current metrics are served from memory and written back on a timer
+        self._current_lock = threading.Lock()
+        self._current = {
+            site_file.stem: metric_data
+            for site_file in sorted(self.current_dir.glob("*.json"))
+            if (metric_data := self._read_json(site_file))
+        }
+        self._dirty_sites: set[str] = set()
+        self._flush_timer: threading.Timer | None = None
+
+        # Session state is cached; last_accessed alone is flushed at most
+        # every _SESSION_TOUCH_FLUSH_S seconds
+        self._session = self._read_json(self.session_file)
+        self._session_dirty = False
+        self._session_flushed_at = time.monotonic()
+        atexit.register(self.close)
+
     def _initialize_files(self) -> None:
         """Initialize data files with default structures."""
-        if not self.metrics_file.exists():
-            self._write_json(self.metrics_file, {})
+        self._migrate_legacy_current()
 
         if not self.history_file.exists():
-            self._write_json(self.history_file, {"metrics": [], "last_updated": None})
+            self._migrate_legacy_history()
 
         if not self.session_file.exists():
-            self._write_json(
+            self._write_json_fast(
                 self.session_file,
                 {
                     "session_id": None,
@@ -80,7 +254,7 @@ class DataStore:
             )
 
         if not self.config_file.exists():
-            self._write_json(
+            self._write_json_atomic(
                 self.config_file,
                 {
                     "version": "1.0",
@@ -91,23 +265,44 @@ class DataStore:
                         "export_format": "json",
                     },
                 },
+                pretty=True,
             )
 
     def _read_json(self, file_path: Path) -> dict[str, Any]:
         """Safely read JSON file."""
         try:
-            with file_path.open(encoding="utf-8") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            return _json_decode(file_path.read_bytes())
+        except (FileNotFoundError, *_JSON_DECODE_ERRORS):
             return {}
 
-    def _write_json(self, file_path: Path, data: dict[str, Any]) -> None:
-        """Safely write JSON file."""
+    def _write_json_fast(self, file_path: Path, data: dict[str, Any]) -> None:
+        """Overwrite a derived JSON file in place with compact JSON."""
+        file_path.write_bytes(_json_encode(data))
+
+    def _write_json_atomic(
+        self,
+        file_path: Path,
+        data: dict[str, Any],
+        *,
+        pretty: bool = False,
+    ) -> None:
+        """
+        Safely write a primary JSON file via a temporary file and rename.
+
+        Output is compact; pretty=True keeps the indented stdlib output for
+        hand-edited files such as config.json.
+        """
+        if pretty:
+            payload = json.dumps(
+                data, indent=2, ensure_ascii=False, default=str
+            ).encode("utf-8")
+        else:
+            payload = _json_encode(data)
+
         # Write to temporary file first, then rename for atomicity
         temp_file = file_path.with_suffix(".tmp")
         try:
-            with temp_file.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            temp_file.write_bytes(payload)
             temp_file.replace(file_path)
         except Exception:
             if temp_file.exists():
@@ -121,16 +316,12 @@ class DataStore:
         Args:
             metrics: MECMetrics object to store
         """
-        current_data = self._read_json(self.metrics_file)
-
-        # Store current metrics by site_id
-        current_data[metrics.site_id] = metrics.to_dict()
-        current_data["last_updated"] = datetime.now(UTC).isoformat()
-
-        self._write_json(self.metrics_file, current_data)
+        # The record outlives this call in the current-metrics cache
+        record = metrics.to_dict(deep=True)
+        self._update_current({metrics.site_id: record})
 
         # Also add to history
-        self._add_to_history(metrics)
+        self._append_history_many(((metrics, record),))
 
     def store_metrics_batch(self, metrics_list: list[MECMetrics]) -> None:
         """
@@ -142,53 +333,356 @@ class DataStore:
         if not metrics_list:
             return
 
-        current_data = self._read_json(self.metrics_file)
+        # Each sample is converted once and shared by both stores
+        records = [(metrics, metrics.to_dict(deep=True)) for metrics in metrics_list]
 
-        # Update current metrics for all sites
-        for metrics in metrics_list:
-            current_data[metrics.site_id] = metrics.to_dict()
+        # Update current metrics, keeping only the last sample per site
+        self._update_current({m.site_id: record for m, record in records})
 
-        current_data["last_updated"] = datetime.now(UTC).isoformat()
-        self._write_json(self.metrics_file, current_data)
+        # Add all to history in a single write
+        self._append_history_many(records)
 
-        # Add all to history
-        for metrics in metrics_list:
-            self._add_to_history(metrics)
+    def _update_current(self, updates: dict[str, dict[str, Any]]) -> None:
+        """Update cached current metrics and schedule a coalesced flush."""
+        with self._current_lock:
+            self._current.update(updates)
+            self._dirty_sites.update(updates)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    self.flush_interval_s, self._flush_current
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write pending current metrics and session state to disk."""
+        self._flush_current()
+        if self._session_dirty:
+            self._flush_session()
+
+    def close(self) -> None:
+        """Flush pending writes and release the history log descriptor."""
+        # Closed stores no longer need the exit hook, which also kept them alive
+        atexit.unregister(self.close)
+        self.flush()
+        if self._compactor is not None:
+            self._compactor.shutdown(wait=True)
+            self._compactor = None
+        with self._history_lock:
+            if self._history_fd is not None:
+                os.close(self._history_fd)
+                self._history_fd = None
+
+    def _flush_current(self) -> None:
+        """Write pending current metrics updates to their site files."""
+        with self._current_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            # Each site has its own file, so a flush never rewrites other sites
+            for site_id in self._dirty_sites:
+                self._write_json_fast(
+                    self._current_file(site_id), self._current[site_id]
+                )
+            self._dirty_sites.clear()
 
-    def _add_to_history(self, metrics: MECMetrics) -> None:
-        """Add metrics to historical data."""
-        history_data = self._read_json(self.history_file)
+    def _migrate_legacy_current(self) -> None:
+        """Split a current_metrics.json from older versions into site files."""
+        legacy_file = self.data_dir / "metrics" / "current_metrics.json"
+        if not legacy_file.exists():
+            return
 
-        if "metrics" not in history_data:
-            history_data["metrics"] = []
+        for site_id, metric_data in self._read_json(legacy_file).items():
+            if isinstance(metric_data, dict):
+                self._write_json_fast(self._current_file(site_id), metric_data)
+        legacy_file.unlink()
+
+    def _current_file(self, site_id: str) -> Path:
+        """Path of the current metrics file for a site."""
+        return self.current_dir / f"{site_id}.json"
+
+    def _migrate_legacy_history(self) -> None:
+        """Convert a metrics_history.json from older versions into the log."""
+        legacy_file = self.history_file.with_suffix(".json")
+        records = self._read_json(legacy_file).get("metrics", [])
+        self._write_frames(self.history_file, (_json_encode(r) for r in records))
+        legacy_file.unlink(missing_ok=True)
+
+    def _write_frames(self, file_path: Path, payloads: Iterable[bytes]) -> int:
+        """Atomically write length-prefixed frames, returning the frame count."""
+        count = 0
+        temp_file = file_path.with_suffix(".tmp")
+        try:
+            with temp_file.open("wb") as f:
+                for payload in payloads:
+                    f.write(_FRAME_HEADER.pack(len(payload)))
+                    f.write(payload)
+                    count += 1
+            temp_file.replace(file_path)
+        except Exception:
+            temp_file.unlink(missing_ok=True)
+            raise
+        return count
 
-        history_data["metrics"].append(metrics.to_dict())
-        history_data["last_updated"] = datetime.now(UTC).isoformat()
+    def _append_history_many(
+        self,
+        records: Iterable[tuple[MECMetrics, dict[str, Any]]],
+    ) -> None:
+        """
+        Append metrics to the history log, one frame each, in one write.
+
+        Args:
+            records: (metrics, metrics.to_dict()) pairs to append
+        """
+        payloads = []
+        marks = []
+        total = 0
+        for metrics, record in records:
+            metric_ts = metrics.timestamp.timestamp()
+            payload = _json_encode({**record, "_ts": metric_ts})
+            marks.append((int(metric_ts // _INDEX_BUCKET_S), total))
+            payloads.append(payload)
+            total += _FRAME_HEADER.size + len(payload)
+
+        # Lay every frame out in one buffer sized up front
+        frames = bytearray(total)
+        for (_, offset), payload in zip(marks, payloads, strict=True):
+            _FRAME_HEADER.pack_into(frames, offset, len(payload))
+            body = offset + _FRAME_HEADER.size
+            frames[body : body + len(payload)] = payload
+
+        with self._history_lock:
+            start = self._history_size
+            view = memoryview(frames)
+            while view:
+                view = view[os.write(self._history_fd, view) :]
+            self._history_size = size = start + total
+            self._appends_since_compaction += len(marks)
+
+            # The index is written after the log so it can trail it, never lead
+            entries = [
+                (bucket, start + offset)
+                for bucket, offset in marks
+                if self._index_frame(bucket, start + offset)
+            ]
+            if entries:
+                with self.history_index_file.open("ab") as f:
+                    f.write(b"".join(_INDEX_ENTRY.pack(*e) for e in entries))
+
+        # Compact off the append path once the log has grown well past its
+        # last compacted size or enough samples have arrived
+        if (
+            size > self._history_compact_at
+            or self._appends_since_compaction >= _HISTORY_COMPACT_APPENDS
+        ):
+            self._schedule_compaction()
+
+    def _schedule_compaction(self) -> None:
+        """Submit a background compaction unless one is already pending."""
+        with self._history_lock:
+            if self._compaction is not None and not self._compaction.done():
+                return
+            if self._compactor is None:
+                self._compactor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="history-compaction"
+                )
+            self._compaction = self._compactor.submit(self._compact_history)
 
-        # Keep only recent history to prevent file from growing too large
-        self._cleanup_old_history(history_data)
+    def _open_history(self) -> None:
+        """Open the history log for appending and keep the descriptor."""
+        self._history_fd = os.open(
+            self.history_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+        self._history_size = os.fstat(self._history_fd).st_size
 
-        self._write_json(self.history_file, history_data)
+    def _index_frame(self, bucket: int, offset: int) -> bool:
+        """Record a frame in the in-memory index if it opens a new hour."""
+        return _index_append(self._index_buckets, self._index_offsets, bucket, offset)
 
-    def _cleanup_old_history(self, history_data: dict[str, Any]) -> None:
-        """Remove old historical data beyond retention period."""
-        if "metrics" not in history_data:
+    def _load_history_index(self) -> None:
+        """Load the sidecar history index, rebuilding it if missing or stale."""
+        try:
+            raw = self.history_index_file.read_bytes()
+        except FileNotFoundError:
+            raw = b""
+        raw = raw[: len(raw) - len(raw) % _INDEX_ENTRY.size]
+        entries = list(_INDEX_ENTRY.iter_unpack(raw))
+        log_size = self.history_file.stat().st_size
+
+        if (log_size and not entries) or (entries and entries[-1][1] >= log_size):
+            self._rebuild_history_index()
             return
+        self._index_buckets = [bucket for bucket, _ in entries]
+        self._index_offsets = [offset for _, offset in entries]
+
+    def _rebuild_history_index(self) -> None:
+        """Rebuild the history index by scanning the log."""
+        self._index_buckets: list[int] = []
+        self._index_offsets: list[int] = []
+        for offset, payload in self._iter_history_frames():
+            try:
+                metric_ts = _record_ts(_json_decode(payload))
+            except (KeyError, TypeError, *_JSON_DECODE_ERRORS):
+                continue
+            self._index_frame(int(metric_ts // _INDEX_BUCKET_S), offset)
+        self._write_history_index()
+
+    def _write_history_index(self) -> None:
+        """Write the in-memory history index to its sidecar file."""
+        self.history_index_file.write_bytes(
+            b"".join(
+                _INDEX_ENTRY.pack(bucket, offset)
+                for bucket, offset in zip(
+                    self._index_buckets,
+                    self._index_offsets,
+                    strict=True,
+                )
+            )
+        )
+
+    def _history_offset_for(self, cutoff_time: datetime) -> int:
+        """Byte offset in the history log from which frames may be newer."""
+        bucket = int(cutoff_time.timestamp() // _INDEX_BUCKET_S)
+        with self._history_lock:
+            i = bisect_left(self._index_buckets, bucket)
+            if i < len(self._index_offsets):
+                return self._index_offsets[i]
+            # Nothing indexed reaches the cutoff; scan only the newest hour
+            return self._index_offsets[-1] if self._index_offsets else 0
+
+    def _iter_history_frames(
+        self,
+        cutoff_time: datetime | None = None,
+        start: int = 0,
+        end: int | None = None,
+    ) -> Iterator[tuple[int, bytes]]:
+        """
+        Yield (offset, payload) for history log frames, oldest first.
 
-        cutoff_date = datetime.now(UTC) - timedelta(days=self.max_history_days)
+        Args:
+            cutoff_time: Seek to the indexed hour of this time instead of start
+            start: Byte offset to start reading from
+            end: Byte offset to stop reading at, defaults to end of file
+        """
+        # Resolve the offset and open the file together so a compaction
+        # swapping the log cannot slip in between
+        with self._history_lock:
+            if cutoff_time is not None:
+                start = self._history_offset_for(cutoff_time)
+            try:
+                f = self.history_file.open("rb")
+            except FileNotFoundError:
+                return
+
+        with f:
+            f.seek(start)
+            offset = start
+            while (end is None or offset < end) and (
+                header := f.read(_FRAME_HEADER.size)
+            ):
+                if len(header) < _FRAME_HEADER.size:
+                    return
+                (size,) = _FRAME_HEADER.unpack(header)
+                payload = f.read(size)
+                if len(payload) < size:
+                    # Torn write at the tail; stop at the last complete frame
+                    return
+                yield offset, payload
+                offset += _FRAME_HEADER.size + size
+
+    def _iter_history(self) -> Iterator[dict[str, Any]]:
+        """Yield decoded history records, oldest first."""
+        for _, payload in self._iter_history_frames():
+            try:
+                yield _json_decode(payload)
+            except _JSON_DECODE_ERRORS:
+                continue
 
-        # Filter out old metrics
-        filtered_metrics = []
-        for metric_data in history_data["metrics"]:
+    def _compact_history(self, now: datetime | None = None) -> tuple[int, int]:
+        """
+        Rewrite the history log without records beyond the retention period.
+
+        Args:
+            now: Reference time for the retention cutoff, defaults to now
+
+        Returns:
+            Tuple of (original record count, kept record count)
+        """
+        now = now or datetime.now(UTC)
+        cutoff_date = now - timedelta(days=self.max_history_days)
+        cutoff_ts = cutoff_date.timestamp()
+        original_count = kept_count = written = 0
+        buckets: list[int] = []
+        offsets: list[int] = []
+
+        def copy_frame(f, payload: bytes, metric_ts: float | None) -> None:
+            nonlocal kept_count, written
+            if metric_ts is not None:
+                bucket = int(metric_ts // _INDEX_BUCKET_S)
+                _index_append(buckets, offsets, bucket, written)
+            f.write(_FRAME_HEADER.pack(len(payload)))
+            f.write(payload)
+            kept_count += 1
+            written += _FRAME_HEADER.size + len(payload)
+
+        with self._compaction_lock:
+            with self._history_lock:
+                # Frames before the indexed cutoff hour are expired, so those
+                # carrying a numeric _ts are dropped undecoded
+                skip_to = self._history_offset_for(cutoff_date)
+                snapshot = self._history_size
+
+            temp_file = self.history_file.with_suffix(".tmp")
             try:
-                metric_time = datetime.fromisoformat(metric_data["timestamp"])
-                if metric_time > cutoff_date:
-                    filtered_metrics.append(metric_data)
-            except (KeyError, ValueError):
-                # Keep metrics with invalid timestamps for safety
-                filtered_metrics.append(metric_data)
+                # Copy recent frames up to the snapshot while appends continue
+                with temp_file.open("wb") as f:
+                    for offset, payload in self._iter_history_frames(end=snapshot):
+                        original_count += 1
+                        if offset < skip_to and _NUMERIC_TAIL_TS.search(payload):
+                            continue
+                        try:
+                            metric_data = _json_decode(payload)
+                        except _JSON_DECODE_ERRORS:
+                            continue
+                        try:
+                            metric_ts = _record_ts(metric_data)
+                        except (KeyError, TypeError, ValueError):
+                            # Keep metrics with invalid timestamps for safety
+                            metric_ts = None
+                        if metric_ts is None or metric_ts > cutoff_ts:
+                            copy_frame(f, payload, metric_ts)
+
+                with self._history_lock:
+                    # Carry over frames appended since the snapshot, then swap
+                    with temp_file.open("ab") as f:
+                        for _, payload in self._iter_history_frames(start=snapshot):
+                            original_count += 1
+                            try:
+                                metric_ts = _record_ts(_json_decode(payload))
+                            except (KeyError, TypeError, *_JSON_DECODE_ERRORS):
+                                metric_ts = None
+                            copy_frame(f, payload, metric_ts)
+
+                    # Drop the index first so a crash mid-swap forces a rebuild
+                    self.history_index_file.unlink(missing_ok=True)
+                    temp_file.replace(self.history_file)
+                    self._index_buckets, self._index_offsets = buckets, offsets
+                    self._write_history_index()
+
+                    # The rename replaced the log, so the held descriptor is stale
+                    if self._history_fd is not None:
+                        os.close(self._history_fd)
+                    self._open_history()
+                    self._history_compact_at = max(
+                        _HISTORY_COMPACT_BYTES, 2 * self._history_size
+                    )
+                    self._appends_since_compaction = 0
+            except Exception:
+                temp_file.unlink(missing_ok=True)
+                raise
 
-        history_data["metrics"] = filtered_metrics
+        return original_count, kept_count
 
     def get_current_metrics(
         self,
@@ -203,25 +697,24 @@ class DataStore:
         Returns:
             MECMetrics object for specific site, or dict of all sites
         """
-        current_data = self._read_json(self.metrics_file)
-
-        if site_id:
-            if site_id in current_data and isinstance(current_data[site_id], dict):
-                return MECMetrics.from_dict(current_data[site_id])
-            return None
+        with self._current_lock:
+            if site_id:
+                metric_data = self._current.get(site_id)
+                # from_dict parses the timestamp in place, so hand it a copy
+                return (
+                    MECMetrics.from_dict(_copy_record(metric_data))
+                    if metric_data
+                    else None
+                )
 
-        # Return all current metrics (excluding metadata)
-        return {
-            k: v
-            for k, v in current_data.items()
-            if k not in ["last_updated"] and isinstance(v, dict)
-        }
+            return {k: _copy_record(v) for k, v in self._current.items()}
 
     def get_metrics_history(
         self,
         site_id: str | None = None,
         hours: int = 24,
         limit: int | None = None,
+        now: datetime | None = None,
     ) -> list[MECMetrics]:
         """
         Get historical metrics for analysis.
@@ -230,43 +723,67 @@ class DataStore:
             site_id: Specific site ID, or None for all sites
             hours: Number of hours of history to retrieve
             limit: Maximum number of records to return
+            now: End of the history window, defaults to now
 
         Returns:
             List of MECMetrics objects
         """
-        history_data = self._read_json(self.history_file)
+        filtered_metrics = []
+        for metric_data in self._history_records(site_id, hours, now)[:limit]:
+            try:
+                filtered_metrics.append(MECMetrics.from_dict(metric_data))
+            except (TypeError, ValueError):
+                # Skip invalid metric data
+                continue
 
-        if "metrics" not in history_data:
-            return []
+        return filtered_metrics
 
-        cutoff_time = datetime.now(UTC) - timedelta(hours=hours)
-        filtered_metrics = []
+    def _history_records(
+        self,
+        site_id: str | None,
+        hours: int,
+        now: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Decoded history records in a time window, newest first."""
+        cutoff_time = (now or datetime.now(UTC)) - timedelta(hours=hours)
+        cutoff_ts = cutoff_time.timestamp()
+        records = []
+
+        # Frames before the cutoff hour are never read, and frames for other
+        # sites are skipped on their leading bytes without decoding
+        site_prefix = (
+            _SITE_ID_PREFIX + _json_encode(site_id) + b"," if site_id else None
+        )
+        for _, payload in self._iter_history_frames(cutoff_time):
+            if (
+                site_prefix
+                and payload.startswith(_SITE_ID_PREFIX)
+                and not payload.startswith(site_prefix)
+            ):
+                continue
 
-        for metric_data in history_data["metrics"]:
             try:
-                # Filter by time
-                metric_time = datetime.fromisoformat(metric_data["timestamp"])
-                if metric_time < cutoff_time:
+                metric_data = _json_decode(payload)
+                # Filter by time on the stored epoch seconds
+                if _record_ts(metric_data) < cutoff_ts:
                     continue
 
                 # Filter by site if specified
                 if site_id and metric_data.get("site_id") != site_id:
                     continue
 
-                filtered_metrics.append(MECMetrics.from_dict(metric_data))
+                records.append(metric_data)
 
-            except (KeyError, ValueError):
+            except (KeyError, TypeError, *_JSON_DECODE_ERRORS):
                 # Skip invalid metric data
                 continue
 
-        # Sort by timestamp (newest first)
-        filtered_metrics.sort(key=lambda m: m.timestamp, reverse=True)
-
-        # Apply limit if specified
-        if limit:
-            filtered_metrics = filtered_metrics[:limit]
-
-        return filtered_metrics
+        # Sort by timestamp (newest first); frames are appended in time
+        # order, so this is a linear pass in the usual case
+        records.sort(key=itemgetter("_ts"), reverse=True)
+        for metric_data in records:
+            del metric_data["_ts"]
+        return records
 
     def get_session_state(self, session_id: str) -> dict[str, Any]:
         """
@@ -278,18 +795,28 @@ class DataStore:
         Returns:
             Session state dictionary
         """
-        session_data = self._read_json(self.session_file)
-
-        if session_data.get("session_id") == session_id:
-            # Update last accessed time
-            session_data["last_accessed"] = datetime.now(UTC).isoformat()
-            self._write_json(self.session_file, session_data)
-            return session_data.get("state", {})
+        if self._session.get("session_id") == session_id:
+            # Update last accessed time, writing it out only occasionally
+            self._session["last_accessed"] = datetime.now(UTC).isoformat()
+            self._session_dirty = True
+            if time.monotonic() - self._session_flushed_at >= _SESSION_TOUCH_FLUSH_S:
+                self._flush_session()
+            return _copy_state(self._session.get("state", {}))
 
         # Create new session
         return self._create_new_session(session_id)
 
-    def _create_new_session(self, session_id: str) -> dict[str, Any]:
+    def _flush_session(self) -> None:
+        """Write the cached session state to disk."""
+        self._write_json_fast(self.session_file, self._session)
+        self._session_dirty = False
+        self._session_flushed_at = time.monotonic()
+
+    def _create_new_session(
+        self,
+        session_id: str,
+        now: datetime | None = None,
+    ) -> dict[str, Any]:
         """Create a new session with default state."""
         default_state = {
             "operation_mode": "normal",
@@ -308,15 +835,16 @@ class DataStore:
             },
         }
 
-        session_data = {
+        now_iso = (now or datetime.now(UTC)).isoformat()
+        self._session = {
             "session_id": session_id,
-            "created_at": datetime.now(UTC).isoformat(),
-            "last_accessed": datetime.now(UTC).isoformat(),
+            "created_at": now_iso,
+            "last_accessed": now_iso,
             "state": default_state,
         }
 
-        self._write_json(self.session_file, session_data)
-        return default_state
+        self._flush_session()
+        return _copy_state(default_state)
 
     def update_session_state(
         self,
@@ -330,21 +858,45 @@ class DataStore:
             session_id: Session identifier
             state_updates: Dictionary of state updates to apply
         """
-        session_data = self._read_json(self.session_file)
+        now = datetime.now(UTC)
 
-        if session_data.get("session_id") != session_id:
+        if self._session.get("session_id") != session_id:
             # Create new session if it doesn't exist
-            self._create_new_session(session_id)
-            session_data = self._read_json(self.session_file)
+            self._create_new_session(session_id, now)
+
+        # Merge state updates; a real state change is written immediately
+        current_state = self._session.get("state", {})
+        updated_state = self._merge_session_state(current_state, state_updates)
 
-        # Deep merge state updates
-        current_state = session_data.get("state", {})
-        updated_state = self._deep_merge(current_state, state_updates)
+        self._session["state"] = updated_state
+        self._session["last_accessed"] = now.isoformat()
 
-        session_data["state"] = updated_state
-        session_data["last_accessed"] = datetime.now(UTC).isoformat()
+        self._flush_session()
 
-        self._write_json(self.session_file, session_data)
+    def _merge_session_state(
+        self,
+        base: dict[str, Any],
+        updates: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Merge session state updates.
+
+        The known settings dicts hold only scalars, so they are merged one
+        level deep without recursion; any other nested dict falls back to
+        _deep_merge.
+        """
+        result = {**base, **updates}
+
+        for key, value in updates.items():
+            base_value = base.get(key)
+            if not (isinstance(value, dict) and isinstance(base_value, dict)):
+                continue
+            if key in _SESSION_SETTINGS_KEYS:
+                result[key] = {**base_value, **value}
+            else:
+                result[key] = self._deep_merge(base_value, value)
+
+        return result
 
     def _deep_merge(
         self,
@@ -383,110 +935,107 @@ class DataStore:
         Returns:
             Path to exported file
         """
-        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+        now = datetime.now(UTC)
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         site_suffix = f"_{site_id}" if site_id else "_all_sites"
 
         if format_type.lower() == "csv":
             filename = f"metrics_export{site_suffix}_{timestamp}.csv"
-            return self._export_csv(filename, site_id, hours)
+            return self._export_csv(filename, site_id, hours, now)
         filename = f"metrics_export{site_suffix}_{timestamp}.json"
-        return self._export_json(filename, site_id, hours)
+        return self._export_json(filename, site_id, hours, now)
 
-    def _export_json(self, filename: str, site_id: str | None, hours: int) -> str:
+    def _export_json(
+        self,
+        filename: str,
+        site_id: str | None,
+        hours: int,
+        now: datetime,
+    ) -> str:
         """Export data in JSON format."""
         export_path = self.data_dir / "exports" / filename
 
-        # Get historical data
-        metrics_history = self.get_metrics_history(site_id, hours)
+        # Get historical data as stored, without a round trip through MECMetrics
+        history_records = self._history_records(site_id, hours, now)
 
         # Get current data
-        current_metrics = self.get_current_metrics(site_id)
-
-        export_data = {
-            "export_info": {
-                "timestamp": datetime.now(UTC).isoformat(),
-                "site_id": site_id,
-                "hours": hours,
-                "total_records": len(metrics_history),
-            },
-            "current_metrics": (
-                current_metrics.to_dict()
-                if isinstance(current_metrics, MECMetrics)
-                else current_metrics
-            ),
-            "historical_metrics": [m.to_dict() for m in metrics_history],
+        with self._current_lock:
+            current_metrics = (
+                self._current.get(site_id) if site_id else dict(self._current)
+            )
+
+        export_info = {
+            "timestamp": now.isoformat(),
+            "site_id": site_id,
+            "hours": hours,
+            "total_records": len(history_records),
         }
 
-        self._write_json(export_path, export_data)
+        # Stream the document record by record instead of encoding it whole;
+        # still written to a temporary file and renamed for atomicity
+        temp_file = export_path.with_suffix(".tmp")
+        try:
+            with temp_file.open("wb", buffering=_EXPORT_BUFFER_SIZE) as f:
+                f.write(b'{"export_info":')
+                f.write(_json_encode(export_info))
+                f.write(b',"current_metrics":')
+                f.write(_json_encode(current_metrics))
+                f.write(b',"historical_metrics":[')
+                for i, metric_data in enumerate(history_records):
+                    if i:
+                        f.write(b",")
+                    f.write(_json_encode(metric_data))
+                f.write(b"]}")
+            temp_file.replace(export_path)
+        except Exception:
+            temp_file.unlink(missing_ok=True)
+            raise
+
         return str(export_path)
 
-    def _export_csv(self, filename: str, site_id: str | None, hours: int) -> str:
+    def _export_csv(
+        self,
+        filename: str,
+        site_id: str | None,
+        hours: int,
+        now: datetime,
+    ) -> str:
         """Export data in CSV format."""
 
         export_path = self.data_dir / "exports" / filename
-        metrics_history = self.get_metrics_history(site_id, hours)
-
-        if not metrics_history:
-            # Create empty CSV with headers
-            with open(export_path, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(
-                    [
-                        "site_id",
-                        "timestamp",
-                        "cpu_utilization",
-                        "gpu_utilization",
-                        "memory_utilization",
-                        "queue_depth",
-                        "response_time_ms",
-                        "requests_per_second",
-                        "active_connections",
-                        "cache_hit_ratio",
-                    ],
-                )
-            return str(export_path)
-
-        with open(export_path, "w", newline="", encoding="utf-8") as csvfile:
+        metrics_history = self.get_metrics_history(site_id, hours, now=now)
+
+        with open(
+            export_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=_EXPORT_BUFFER_SIZE,
+        ) as csvfile:
             writer = csv.writer(csvfile)
-
-            # Write header
-            writer.writerow(
-                [
-                    "site_id",
-                    "timestamp",
-                    "cpu_utilization",
-                    "gpu_utilization",
-                    "memory_utilization",
-                    "queue_depth",
-                    "response_time_ms",
-                    "requests_per_second",
-                    "active_connections",
-                    "cache_hit_ratio",
-                    "network_latency_json",  # JSON string for complex data
-                ],
-            )
-
-            # Write data rows
-            for metrics in metrics_history:
-                writer.writerow(
-                    [
-                        metrics.site_id,
-                        metrics.timestamp.isoformat(),
-                        metrics.cpu_utilization,
-                        metrics.gpu_utilization,
-                        metrics.memory_utilization,
-                        metrics.queue_depth,
-                        metrics.response_time_ms,
-                        metrics.requests_per_second,
-                        metrics.active_connections,
-                        metrics.cache_hit_ratio,
-                        json.dumps(metrics.network_latency),
-                    ],
-                )
+            writer.writerow(_CSV_HEADER)
+            writer.writerows(self._csv_rows(metrics_history))
 
         return str(export_path)
 
-    def cleanup_old_data(self) -> dict[str, int]:
+    def _csv_rows(self, metrics_history: Iterable[MECMetrics]) -> Iterator[tuple]:
+        """Yield CSV rows, encoding latency maps with the shared codec."""
+        for metrics in metrics_history:
+            yield (
+                metrics.site_id,
+                metrics.timestamp.isoformat(),
+                metrics.cpu_utilization,
+                metrics.gpu_utilization,
+                metrics.memory_utilization,
+                metrics.queue_depth,
+                metrics.response_time_ms,
+                metrics.requests_per_second,
+                metrics.active_connections,
+                metrics.cache_hit_ratio,
+                _json_encode(metrics.network_latency).decode("utf-8"),
+            )
+
+    def cleanup_old_data(self) -> dict[str, int | float]:
         """
         Clean up old data files and archive them.
 
@@ -502,41 +1051,57 @@ class DataStore:
         # Archive old export files (older than 30 days)
         exports_dir = self.data_dir / "exports"
         archive_dir = self.data_dir / "archive"
-        cutoff_date = datetime.now(UTC) - timedelta(days=30)
+        now = datetime.now(UTC)
+        cutoff_ts = (now - timedelta(days=30)).timestamp()
+
+        # One directory read covers JSON and CSV exports; DirEntry caches stat
+        freed_bytes = 0
+        with os.scandir(exports_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith((".json", ".csv")):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff_ts:
+                        # Compress into the archive, then drop the export
+                        data = Path(entry.path).read_bytes()
+                        compressed = _archive_compress(data)
+                        archive_path = archive_dir / (entry.name + _ARCHIVE_SUFFIX)
+                        archive_path.write_bytes(compressed)
+                        os.unlink(entry.path)
+                        stats["archived_files"] += 1
+                        freed_bytes += len(data) - len(compressed)
+                except Exception:
+                    # Skip files that can't be processed
+                    continue
 
-        for export_file in exports_dir.glob("*.json"):
-            try:
-                file_time = datetime.fromtimestamp(export_file.stat().st_mtime, UTC)
-                if file_time < cutoff_date:
-                    # Move to archive
-                    archive_path = archive_dir / export_file.name
-                    shutil.move(str(export_file), str(archive_path))
-                    stats["archived_files"] += 1
-            except Exception:
-                # Skip files that can't be processed
-                continue
+        # Persist pending writes, then clean up historical metrics
+        self.flush()
+        original_count, new_count = self._compact_history(now)
+        stats["deleted_records"] = original_count - new_count
+        stats["freed_space_mb"] = round(freed_bytes / (1024 * 1024), 2)
 
-        # Clean up old CSV exports
-        for csv_file in exports_dir.glob("*.csv"):
-            try:
-                file_time = datetime.fromtimestamp(csv_file.stat().st_mtime, UTC)
-                if file_time < cutoff_date:
-                    archive_path = archive_dir / csv_file.name
-                    shutil.move(str(csv_file), str(archive_path))
-                    stats["archived_files"] += 1
-            except Exception:
-                continue
+        return stats
 
-        # Clean up historical metrics
-        history_data = self._read_json(self.history_file)
-        original_count = len(history_data.get("metrics", []))
-        self._cleanup_old_history(history_data)
-        self._write_json(self.history_file, history_data)
+    def read_archive(self, archive_path: str | Path) -> bytes:
+        """
+        Read an archived export, decompressing it by file suffix.
 
-        new_count = len(history_data.get("metrics", []))
-        stats["deleted_records"] = original_count - new_count
+        Args:
+            archive_path: Path to a file in the archive directory
 
-        return stats
+        Returns:
+            Original export file contents
+        """
+        path = Path(archive_path)
+        data = path.read_bytes()
+
+        if path.suffix == ".zst":
+            if zstandard is None:
+                raise ValueError(f"zstandard is required to read {path.name}")
+            return zstandard.ZstdDecompressor().decompress(data)
+        if path.suffix == ".gz":
+            return gzip.decompress(data)
+        return data
 
     def get_storage_stats(self) -> dict[str, Any]:
         """
@@ -555,31 +1120,31 @@ class DataStore:
         }
 
         # Calculate directory sizes
-        for path in self.data_dir.rglob("*"):
-            if path.is_file():
-                size_mb = path.stat().st_size / (1024 * 1024)
-                stats["total_size_mb"] += size_mb
+        total_bytes = 0
+        for entry in _scan_files(self.data_dir):
+            total_bytes += entry.stat().st_size
 
-                # Count files by type
-                suffix = path.suffix or "no_extension"
-                stats["file_counts"][suffix] = stats["file_counts"].get(suffix, 0) + 1
+            # Count files by type
+            suffix = os.path.splitext(entry.name)[1] or "no_extension"
+            stats["file_counts"][suffix] = stats["file_counts"].get(suffix, 0) + 1
+        stats["total_size_mb"] = total_bytes / (1024 * 1024)
 
         # Get metrics statistics
-        history_data = self._read_json(self.history_file)
-        metrics_list = history_data.get("metrics", [])
-        stats["total_metrics_records"] = len(metrics_list)
-
-        if metrics_list:
-            timestamps = []
-            for metric_data in metrics_list:
-                try:
-                    timestamps.append(datetime.fromisoformat(metric_data["timestamp"]))
-                except (KeyError, ValueError):
-                    continue
+        timestamps = []
+        for metric_data in self._iter_history():
+            stats["total_metrics_records"] += 1
+            try:
+                timestamps.append(_record_ts(metric_data))
+            except (KeyError, TypeError, ValueError):
+                continue
 
-            if timestamps:
-                stats["oldest_record"] = min(timestamps).isoformat()
-                stats["newest_record"] = max(timestamps).isoformat()
+        if timestamps:
+            stats["oldest_record"] = datetime.fromtimestamp(
+                min(timestamps), UTC
+            ).isoformat()
+            stats["newest_record"] = datetime.fromtimestamp(
+                max(timestamps), UTC
+            ).isoformat()
 
         stats["total_size_mb"] = round(stats["total_size_mb"], 2)
         return stats
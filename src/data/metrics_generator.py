@@ -6,14 +6,20 @@ threshold breach scenarios, time-series data with variance, and synthetic
 data patterns for simulation purposes.
 """
 
-import math
 import random
-from dataclasses import asdict, dataclass
-from datetime import UTC, datetime, timedelta
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
-from config import MECConfig, MECSiteConfig, ThresholdConfig
+import numpy as np
+
+try:
+    import numba  # optional: JIT-compiles the per-point metrics kernel
+except ImportError:
+    numba = None
+
+from config import MECConfig, ThresholdConfig
 
 
 class MetricType(Enum):
@@ -36,7 +42,148 @@ class OperationMode(Enum):
     MEC_FAILURE = "mec_failure"
 
 
-@dataclass
+# Column order of the base metrics kernel output
+_BASE_METRIC_KEYS = (
+    "cpu_utilization",
+    "gpu_utilization",
+    "memory_utilization",
+    "queue_depth",
+    "response_time_ms",
+    "requests_per_second",
+    "active_connections",
+    "cache_hit_ratio",
+)
+_INT_METRICS = frozenset({"queue_depth", "requests_per_second", "active_connections"})
+
+# Noise scale per base metric column, in _BASE_METRIC_KEYS order
+_BASE_METRIC_VARIANCE = np.array([5.0, 4.0, 3.0, 3.0, 5.0, 10.0, 20.0, 2.0])
+
+# Multiplier range applied to base inter-site latency, by operation mode
+_LATENCY_JITTER = {
+    OperationMode.MEC_FAILURE: (3.0, 8.0),
+    OperationMode.SWARM_ACTIVE: (1.1, 1.3),
+}
+_LATENCY_JITTER_NORMAL = (0.8, 1.2)
+
+
+def _base_metrics_kernel(
+    baseline: np.ndarray,
+    trends: np.ndarray,
+    times: np.ndarray,
+    noise: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute base metrics for an array of POSIX timestamps.
+
+    baseline holds one value per _BASE_METRIC_KEYS column and trends the cpu,
+    gpu and memory trends. noise is standard normal with one row per time and
+    is drawn by the caller, so output follows the generator's seed whether or
+    not numba is installed. Returns one row per time in _BASE_METRIC_KEYS
+    order; integer metrics are floored but left as float64.
+    """
+    noise = noise * _BASE_METRIC_VARIANCE
+
+    # Time-based factors for realistic patterns (hourly and daily)
+    time_factor = np.sin(times / 3600.0) * 0.1
+    daily_factor = np.sin(times / 86400.0) * 0.05
+
+    cpu = baseline[0] + trends[0] + time_factor * 10 + noise[:, 0]
+    cpu = np.minimum(100.0, np.maximum(0.0, cpu))
+    gpu = baseline[1] + trends[1] + time_factor * 8 + noise[:, 1]
+    gpu = np.minimum(100.0, np.maximum(0.0, gpu))
+    memory = baseline[2] + trends[2] + daily_factor * 5 + noise[:, 2]
+    memory = np.minimum(100.0, np.maximum(0.0, memory))
+
+    # Queue depth correlates with CPU usage
+    queue = baseline[3] + (cpu - 30) * 0.5 + noise[:, 3]
+    queue = np.floor(np.minimum(200.0, np.maximum(0.0, queue)))
+
+    # Response time correlates with queue depth and CPU
+    response = baseline[4] + queue * 0.8 + (cpu - 30) * 0.3 + noise[:, 4]
+    response = np.minimum(500.0, np.maximum(10.0, response))
+
+    # RPS inversely correlates with response time
+    rps = baseline[5] * (50.0 / np.maximum(response, 25.0)) + noise[:, 5]
+    rps = np.floor(np.minimum(1000.0, np.maximum(1.0, rps)))
+
+    connections = baseline[6] + rps * 0.5 + noise[:, 6]
+    connections = np.floor(np.minimum(2000.0, np.maximum(10.0, connections)))
+
+    cache = baseline[7] - (cpu - 30) * 0.1 + noise[:, 7]
+    cache = np.minimum(99.0, np.maximum(50.0, cache))
+
+    out = np.empty((times.size, 8))
+    out[:, 0] = cpu
+    out[:, 1] = gpu
+    out[:, 2] = memory
+    out[:, 3] = queue
+    out[:, 4] = response
+    out[:, 5] = rps
+    out[:, 6] = connections
+    out[:, 7] = cache
+    return out
+
+
+if numba is None:
+    _prange = range
+else:
+    _prange = numba.prange
+
+    # Eager signature so the kernel is compiled (or loaded from the on-disk
+    # cache) at import rather than stalling the first generated point
+    _base_metrics_kernel = numba.njit(
+        "float64[:, :](float64[:], float64[:], float64[:], float64[:, :])",
+        cache=True,
+        fastmath=True,
+    )(_base_metrics_kernel)
+
+
+def _generate_series_all_sites(
+    baselines: np.ndarray,
+    trends: np.ndarray,
+    times: np.ndarray,
+    noise: np.ndarray,
+) -> np.ndarray:
+    """
+    Run _base_metrics_kernel for every site over the same timestamps.
+
+    baselines and trends hold one row per site and noise one (times, 8) slab
+    per site. Returns an (n_sites, n_times, 8) array. Sites run in parallel
+    when numba is present; the noise is pre-drawn, so the result does not
+    depend on thread scheduling.
+    """
+    out = np.empty((baselines.shape[0], times.size, 8))
+    for site in _prange(baselines.shape[0]):
+        out[site] = _base_metrics_kernel(
+            baselines[site],
+            trends[site],
+            times,
+            noise[site],
+        )
+    return out
+
+
+if numba is not None:
+    # Compiled on first use; numba picks its threading layer (tbb, omp or
+    # workqueue) at that point, and NUMBA_THREADING_LAYER overrides it
+    _generate_series_all_sites = numba.njit(parallel=True, cache=True)(
+        _generate_series_all_sites,
+    )
+
+
+def _split_base_columns(columns: np.ndarray) -> dict[str, np.ndarray]:
+    """Split kernel output into one array per metric, integers as int64."""
+    return {
+        metric: (
+            columns[:, i].astype(np.int64)
+            if metric in _INT_METRICS
+            else columns[:, i].copy()
+        )
+        for i, metric in enumerate(_BASE_METRIC_KEYS)
+    }
+
+
+@dataclass(slots=True)
 class MECMetrics:
     """Data class representing MEC site metrics at a point in time."""
 
@@ -52,11 +199,28 @@ class MECMetrics:
     active_connections: int  # number of active connections
     cache_hit_ratio: float  # percentage (0-100)
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert metrics to dictionary format."""
-        data = asdict(self)
-        data["timestamp"] = self.timestamp.isoformat()
-        return data
+    def to_dict(self, *, deep: bool = False) -> dict[str, Any]:
+        """
+        Convert metrics to dictionary format.
+
+        The network_latency mapping is shared with this instance unless
+        ``deep`` is set, in which case the result owns a copy.
+        """
+        return {
+            "site_id": self.site_id,
+            "timestamp": self.timestamp.isoformat(),
+            "cpu_utilization": self.cpu_utilization,
+            "gpu_utilization": self.gpu_utilization,
+            "memory_utilization": self.memory_utilization,
+            "queue_depth": self.queue_depth,
+            "network_latency": (
+                dict(self.network_latency) if deep else self.network_latency
+            ),
+            "response_time_ms": self.response_time_ms,
+            "requests_per_second": self.requests_per_second,
+            "active_connections": self.active_connections,
+            "cache_hit_ratio": self.cache_hit_ratio,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "MECMetrics":
@@ -65,6 +229,77 @@ class MECMetrics:
         return cls(**data)
 
 
+@dataclass(slots=True)
+class MECMetricsBatch:
+    """
+    Column-wise (structure-of-arrays) metrics for one MEC site.
+
+    Row i of every column belongs to the same point in time; network_latency
+    is an (n_points, n_targets) matrix whose columns follow ``targets``.
+    """
+
+    site_id: str
+    targets: list[str]
+    timestamp: np.ndarray  # datetime64[us], UTC
+    cpu_utilization: np.ndarray
+    gpu_utilization: np.ndarray
+    memory_utilization: np.ndarray
+    queue_depth: np.ndarray
+    network_latency: np.ndarray
+    response_time_ms: np.ndarray
+    requests_per_second: np.ndarray
+    active_connections: np.ndarray
+    cache_hit_ratio: np.ndarray
+
+    def __len__(self) -> int:
+        """Return the number of points in the batch."""
+        return len(self.timestamp)
+
+    def to_metrics(self) -> list[MECMetrics]:
+        """Expand the batch into one MECMetrics per point."""
+        site_id = self.site_id
+        targets = self.targets
+        return [
+            MECMetrics(
+                site_id=site_id,
+                timestamp=timestamp.replace(tzinfo=UTC),
+                cpu_utilization=cpu,
+                gpu_utilization=gpu,
+                memory_utilization=memory,
+                queue_depth=queue,
+                network_latency=dict(zip(targets, latency, strict=True)),
+                response_time_ms=response,
+                requests_per_second=rps,
+                active_connections=connections,
+                cache_hit_ratio=cache,
+            )
+            for (
+                timestamp,
+                cpu,
+                gpu,
+                memory,
+                queue,
+                response,
+                rps,
+                connections,
+                cache,
+                latency,
+            ) in zip(
+                self.timestamp.tolist(),
+                self.cpu_utilization.tolist(),
+                self.gpu_utilization.tolist(),
+                self.memory_utilization.tolist(),
+                self.queue_depth.tolist(),
+                self.response_time_ms.tolist(),
+                self.requests_per_second.tolist(),
+                self.active_connections.tolist(),
+                self.cache_hit_ratio.tolist(),
+                self.network_latency.tolist(),
+                strict=True,
+            )
+        ]
+
+
 class MECMetricsGenerator:
     """
     Generates realistic MEC metrics with configurable patterns and scenarios.
@@ -77,7 +312,14 @@ class MECMetricsGenerator:
     - Correlated metrics (CPU spike affects latency, etc.)
     """
 
-    def __init__(self, config: MECConfig):
+    def __init__(self, config: MECConfig, seed: int | None = None):
+        """
+        Initialize the generator.
+
+        Args:
+            config: MEC topology and threshold configuration
+            seed: Seed for reproducible output; None draws fresh entropy
+        """
         self.config = config
         self.thresholds = config.thresholds
         self.mec_sites = config.mec_sites
@@ -89,6 +331,24 @@ class MECMetricsGenerator:
         self._operation_mode = OperationMode.NORMAL
         self._scenario_start_time: datetime | None = None
         self._scenario_duration_seconds = 30  # Default scenario duration
+        self._rng = np.random.default_rng(seed)
+
+        # Scalar draws (baselines, scenario picks) come from a private
+        # random.Random; its methods are bound once instead of looked up
+        # on the random module at every call
+        rand = random.Random(seed)
+        self._uniform = rand.uniform
+        self._randint = rand.randint
+        self._choice = rand.choice
+
+        # Base inter-site latencies as arrays, with target ids in column order
+        self._latency_base: dict[str, tuple[np.ndarray, tuple[str, ...]]] = {
+            site_id: (
+                np.array(list(site.network_latency_ms.values()), dtype=float),
+                tuple(site.network_latency_ms),
+            )
+            for site_id, site in self.mec_sites.items()
+        }
 
         self._initialize_baseline_values()
         self._initialize_trend_factors()
@@ -97,24 +357,24 @@ class MECMetricsGenerator:
         """Initialize baseline values for each MEC site."""
         for site_id in self.mec_sites:
             self._baseline_values[site_id] = {
-                "cpu_utilization": random.uniform(20.0, 40.0),
-                "gpu_utilization": random.uniform(15.0, 35.0),
-                "memory_utilization": random.uniform(30.0, 50.0),
-                "queue_depth": random.randint(5, 15),
-                "response_time_ms": random.uniform(25.0, 45.0),
-                "requests_per_second": random.randint(50, 150),
-                "active_connections": random.randint(100, 300),
-                "cache_hit_ratio": random.uniform(75.0, 90.0),
+                "cpu_utilization": self._uniform(20.0, 40.0),
+                "gpu_utilization": self._uniform(15.0, 35.0),
+                "memory_utilization": self._uniform(30.0, 50.0),
+                "queue_depth": self._randint(5, 15),
+                "response_time_ms": self._uniform(25.0, 45.0),
+                "requests_per_second": self._randint(50, 150),
+                "active_connections": self._randint(100, 300),
+                "cache_hit_ratio": self._uniform(75.0, 90.0),
             }
 
     def _initialize_trend_factors(self) -> None:
         """Initialize trend factors for gradual changes over time."""
         for site_id in self.mec_sites:
             self._trend_factors[site_id] = {
-                "cpu_trend": random.uniform(-0.1, 0.1),
-                "gpu_trend": random.uniform(-0.1, 0.1),
-                "memory_trend": random.uniform(-0.05, 0.05),
-                "latency_trend": random.uniform(-0.02, 0.02),
+                "cpu_trend": self._uniform(-0.1, 0.1),
+                "gpu_trend": self._uniform(-0.1, 0.1),
+                "memory_trend": self._uniform(-0.05, 0.05),
+                "latency_trend": self._uniform(-0.02, 0.02),
             }
 
     def set_operation_mode(
@@ -140,28 +400,28 @@ class MECMetricsGenerator:
 
     def _setup_breach_scenario(self, site_id: str) -> None:
         """Setup a threshold breach scenario for a specific site."""
-        scenario_type = random.choice(["cpu_spike", "latency_spike", "queue_overload"])
+        scenario_type = self._choice(["cpu_spike", "latency_spike", "queue_overload"])
 
         if scenario_type == "cpu_spike":
             self._breach_scenarios[site_id] = {
                 "type": "cpu_spike",
-                "target_cpu": random.uniform(85.0, 95.0),
-                "target_gpu": random.uniform(70.0, 85.0),
-                "spike_duration": random.randint(10, 25),
+                "target_cpu": self._uniform(85.0, 95.0),
+                "target_gpu": self._uniform(70.0, 85.0),
+                "spike_duration": self._randint(10, 25),
             }
         elif scenario_type == "latency_spike":
             self._breach_scenarios[site_id] = {
                 "type": "latency_spike",
-                "target_latency": random.uniform(120.0, 180.0),
-                "affected_connections": random.choice(["all", "partial"]),
-                "spike_duration": random.randint(15, 30),
+                "target_latency": self._uniform(120.0, 180.0),
+                "affected_connections": self._choice(["all", "partial"]),
+                "spike_duration": self._randint(15, 30),
             }
         elif scenario_type == "queue_overload":
             self._breach_scenarios[site_id] = {
                 "type": "queue_overload",
-                "target_queue_depth": random.randint(60, 100),
-                "target_response_time": random.uniform(150.0, 250.0),
-                "overload_duration": random.randint(20, 35),
+                "target_queue_depth": self._randint(60, 100),
+                "target_response_time": self._uniform(150.0, 250.0),
+                "overload_duration": self._randint(20, 35),
             }
 
     def generate_metrics(self, site_id: str) -> MECMetrics:
@@ -178,19 +438,11 @@ class MECMetricsGenerator:
             msg = f"Unknown MEC site: {site_id}"
             raise ValueError(msg)
 
-        site_config = self.mec_sites[site_id]
         current_time = datetime.now(UTC)
-
-        # Check if we're in a scenario and if it should end
-        if self._scenario_start_time:
-            elapsed = (current_time - self._scenario_start_time).total_seconds()
-            if elapsed > self._scenario_duration_seconds:
-                self._operation_mode = OperationMode.NORMAL
-                self._scenario_start_time = None
-                self._breach_scenarios.clear()
+        self._expire_scenario(current_time)
 
         # Generate base metrics with variance
-        base_metrics = self._generate_base_metrics(site_id, current_time)
+        base_metrics = self._generate_base_metrics(site_id, current_time.timestamp())
 
         # Apply operation mode modifications
         if self._operation_mode == OperationMode.THRESHOLD_BREACH:
@@ -201,7 +453,7 @@ class MECMetricsGenerator:
             base_metrics = self._apply_failure_scenario(site_id, base_metrics)
 
         # Generate network latency to other sites
-        network_latency = self._generate_network_latency(site_id, site_config)
+        network_latency = self._generate_network_latency(site_id)
 
         return MECMetrics(
             site_id=site_id,
@@ -217,122 +469,23 @@ class MECMetricsGenerator:
             cache_hit_ratio=base_metrics["cache_hit_ratio"],
         )
 
+    def _expire_scenario(self, current_time: datetime) -> None:
+        """Return to normal mode once the active scenario has run its course."""
+        if self._scenario_start_time:
+            elapsed = (current_time - self._scenario_start_time).total_seconds()
+            if elapsed > self._scenario_duration_seconds:
+                self._operation_mode = OperationMode.NORMAL
+                self._scenario_start_time = None
+                self._breach_scenarios.clear()
+
     def _generate_base_metrics(
         self,
         site_id: str,
-        current_time: datetime,
+        current_ts: float,
     ) -> dict[str, Any]:
-        """Generate base metrics with natural variance and trends."""
-        baseline = self._baseline_values[site_id]
-        trends = self._trend_factors[site_id]
-
-        # Time-based factors for realistic patterns
-        time_factor = math.sin(current_time.timestamp() / 3600) * 0.1  # Hourly pattern
-        daily_factor = (
-            math.sin(current_time.timestamp() / 86400) * 0.05
-        )  # Daily pattern
-
-        # Generate metrics with variance and trends
-        cpu_util = self._apply_variance_and_bounds(
-            baseline["cpu_utilization"] + trends["cpu_trend"] + time_factor * 10,
-            variance=5.0,
-            min_val=0.0,
-            max_val=100.0,
-        )
-
-        gpu_util = self._apply_variance_and_bounds(
-            baseline["gpu_utilization"] + trends["gpu_trend"] + time_factor * 8,
-            variance=4.0,
-            min_val=0.0,
-            max_val=100.0,
-        )
-
-        memory_util = self._apply_variance_and_bounds(
-            baseline["memory_utilization"] + trends["memory_trend"] + daily_factor * 5,
-            variance=3.0,
-            min_val=0.0,
-            max_val=100.0,
-        )
-
-        # Queue depth correlates with CPU usage
-        queue_base = baseline["queue_depth"] + (cpu_util - 30) * 0.5
-        queue_depth = max(
-            0,
-            int(
-                self._apply_variance_and_bounds(
-                    queue_base,
-                    variance=3.0,
-                    min_val=0,
-                    max_val=200,
-                ),
-            ),
-        )
-
-        # Response time correlates with queue depth and CPU
-        response_base = (
-            baseline["response_time_ms"] + queue_depth * 0.8 + (cpu_util - 30) * 0.3
-        )
-        response_time = self._apply_variance_and_bounds(
-            response_base,
-            variance=5.0,
-            min_val=10.0,
-            max_val=500.0,
-        )
-
-        # RPS inversely correlates with response time
-        rps_base = baseline["requests_per_second"] * (50.0 / max(response_time, 25.0))
-        requests_per_second = max(
-            1,
-            int(
-                self._apply_variance_and_bounds(
-                    rps_base,
-                    variance=10.0,
-                    min_val=1,
-                    max_val=1000,
-                ),
-            ),
-        )
-
-        active_connections = max(
-            10,
-            int(
-                self._apply_variance_and_bounds(
-                    baseline["active_connections"] + requests_per_second * 0.5,
-                    variance=20.0,
-                    min_val=10,
-                    max_val=2000,
-                ),
-            ),
-        )
-
-        cache_hit_ratio = self._apply_variance_and_bounds(
-            baseline["cache_hit_ratio"] - (cpu_util - 30) * 0.1,
-            variance=2.0,
-            min_val=50.0,
-            max_val=99.0,
-        )
-
-        return {
-            "cpu_utilization": cpu_util,
-            "gpu_utilization": gpu_util,
-            "memory_utilization": memory_util,
-            "queue_depth": queue_depth,
-            "response_time_ms": response_time,
-            "requests_per_second": requests_per_second,
-            "active_connections": active_connections,
-            "cache_hit_ratio": cache_hit_ratio,
-        }
-
-    def _apply_variance_and_bounds(
-        self,
-        base_value: float,
-        variance: float,
-        min_val: float,
-        max_val: float,
-    ) -> float:
-        """Apply random variance to a value and enforce bounds."""
-        varied_value = base_value + random.gauss(0, variance)
-        return max(min_val, min(max_val, varied_value))
+        """Generate base metrics for a POSIX timestamp (seconds)."""
+        base_metrics = self._generate_base_metrics_vec(site_id, np.array([current_ts]))
+        return {metric: values[0].item() for metric, values in base_metrics.items()}
 
     def _apply_breach_scenario(
         self,
@@ -397,7 +550,7 @@ class MECMetricsGenerator:
     ) -> dict[str, Any]:
         """Apply MEC site failure scenario."""
         # Simulate degraded performance or complete failure
-        failure_severity = random.choice(["partial", "severe"])
+        failure_severity = self._choice(["partial", "severe"])
 
         if failure_severity == "partial":
             base_metrics["cpu_utilization"] = min(
@@ -417,30 +570,122 @@ class MECMetricsGenerator:
 
         return base_metrics
 
-    def _generate_network_latency(
+    def _generate_network_latency(self, site_id: str) -> dict[str, float]:
+        """Generate network latency to other MEC sites."""
+        targets = self._latency_base[site_id][1]
+        latencies = self._generate_network_latency_vec(site_id, 1)[0]
+        return dict(zip(targets, latencies.tolist(), strict=True))
+
+    def _generate_base_metrics_vec(
         self,
         site_id: str,
-        site_config: MECSiteConfig,
-    ) -> dict[str, float]:
-        """Generate network latency to other MEC sites."""
-        latency_map = {}
-        base_latencies = site_config.network_latency_ms
+        times: np.ndarray,
+    ) -> dict[str, np.ndarray]:
+        """Generate base metrics for an array of POSIX timestamps at once."""
+        baseline, trends = self._kernel_inputs(site_id)
+        columns = _base_metrics_kernel(
+            baseline,
+            trends,
+            times,
+            self._rng.standard_normal((times.size, len(_BASE_METRIC_KEYS))),
+        )
+        return _split_base_columns(columns)
 
-        for target_site, base_latency in base_latencies.items():
-            # Add realistic variance to network latency
-            if self._operation_mode == OperationMode.MEC_FAILURE:
-                # High latency during failures
-                latency = base_latency * random.uniform(3.0, 8.0)
-            elif self._operation_mode == OperationMode.SWARM_ACTIVE:
-                # Slightly higher latency during coordination
-                latency = base_latency * random.uniform(1.1, 1.3)
-            else:
-                # Normal variance
-                latency = base_latency * random.uniform(0.8, 1.2)
+    def _kernel_inputs(self, site_id: str) -> tuple[np.ndarray, np.ndarray]:
+        """Return a site's baselines and cpu/gpu/memory trends as arrays."""
+        baseline = self._baseline_values[site_id]
+        trends = self._trend_factors[site_id]
+        return (
+            np.array([baseline[metric] for metric in _BASE_METRIC_KEYS], dtype=float),
+            np.array(
+                [trends["cpu_trend"], trends["gpu_trend"], trends["memory_trend"]],
+            ),
+        )
 
-            latency_map[target_site] = round(latency, 2)
+    def _apply_operation_mode_vec(
+        self,
+        site_id: str,
+        base_metrics: dict[str, np.ndarray],
+    ) -> dict[str, np.ndarray]:
+        """Apply the current operation mode to vectorized base metrics."""
+        n = base_metrics["cpu_utilization"].size
+
+        if self._operation_mode == OperationMode.THRESHOLD_BREACH:
+            scenario = self._breach_scenarios.get(site_id)
+            if scenario is None:
+                return base_metrics
+            scenario_type = scenario["type"]
+
+            if scenario_type == "cpu_spike":
+                base_metrics["cpu_utilization"] = np.full(n, scenario["target_cpu"])
+                base_metrics["gpu_utilization"] = np.full(n, scenario["target_gpu"])
+                base_metrics["response_time_ms"] *= 1.5
+                base_metrics["queue_depth"] = (
+                    base_metrics["queue_depth"] * 1.8
+                ).astype(np.int64)
+            elif scenario_type == "latency_spike":
+                base_metrics["response_time_ms"] = np.full(
+                    n,
+                    scenario["target_latency"],
+                )
+                base_metrics["queue_depth"] = base_metrics["queue_depth"] * 2
+                base_metrics["requests_per_second"] = (
+                    base_metrics["requests_per_second"] * 0.6
+                ).astype(np.int64)
+            elif scenario_type == "queue_overload":
+                base_metrics["queue_depth"] = np.full(
+                    n,
+                    scenario["target_queue_depth"],
+                    dtype=np.int64,
+                )
+                base_metrics["response_time_ms"] = np.full(
+                    n,
+                    scenario["target_response_time"],
+                )
+                base_metrics["cpu_utilization"] = np.minimum(
+                    95.0,
+                    base_metrics["cpu_utilization"] * 1.3,
+                )
+
+        elif self._operation_mode == OperationMode.SWARM_ACTIVE:
+            base_metrics["cpu_utilization"] = np.minimum(
+                100.0,
+                base_metrics["cpu_utilization"] * 1.1,
+            )
+            base_metrics["response_time_ms"] *= 0.9
+            base_metrics["queue_depth"] = (base_metrics["queue_depth"] * 0.8).astype(
+                np.int64,
+            )
+
+        elif self._operation_mode == OperationMode.MEC_FAILURE:
+            # Each point independently degrades partially or fails outright
+            severe = self._rng.random(n) < 0.5
+            partial = ~severe
+            cpu = base_metrics["cpu_utilization"]
+            cpu[partial] = np.minimum(100.0, cpu[partial] * 1.5)
+            cpu[severe] = 0.0
+            base_metrics["gpu_utilization"][severe] = 0.0
+            response = base_metrics["response_time_ms"]
+            response[partial] *= 2.0
+            response[severe] = 999.0
+            queue = base_metrics["queue_depth"]
+            queue[partial] *= 3
+            queue[severe] = 0
+            base_metrics["cache_hit_ratio"][partial] *= 0.7
+            base_metrics["requests_per_second"][severe] = 0
+            base_metrics["active_connections"][severe] = 0
 
-        return latency_map
+        return base_metrics
+
+    def _generate_network_latency_vec(
+        self,
+        site_id: str,
+        n_points: int,
+    ) -> np.ndarray:
+        """Generate an (n_points, n_targets) matrix of inter-site latencies."""
+        base = self._latency_base[site_id][0]
+        low, high = _LATENCY_JITTER.get(self._operation_mode, _LATENCY_JITTER_NORMAL)
+        return np.round(base * self._rng.uniform(low, high, (n_points, base.size)), 2)
 
     def generate_time_series(
         self,
@@ -459,27 +704,148 @@ class MECMetricsGenerator:
         Returns:
             List of MECMetrics objects representing the time series
         """
-        metrics_series = []
+        return self.generate_time_series_batch(
+            site_id,
+            duration_minutes,
+            interval_seconds,
+        ).to_metrics()
+
+    def generate_time_series_batch(
+        self,
+        site_id: str,
+        duration_minutes: int = 60,
+        interval_seconds: int = 5,
+    ) -> MECMetricsBatch:
+        """
+        Generate a time series of metrics as column arrays.
+
+        Args:
+            site_id: MEC site identifier
+            duration_minutes: Duration of the time series
+            interval_seconds: Interval between data points
+
+        Returns:
+            MECMetricsBatch holding one array per metric
+        """
+        if site_id not in self.mec_sites:
+            msg = f"Unknown MEC site: {site_id}"
+            raise ValueError(msg)
+
+        targets = list(self._latency_base[site_id][1])
         start_time = datetime.now(UTC)
-        total_points = (duration_minutes * 60) // interval_seconds
+        total_points = max((duration_minutes * 60) // interval_seconds, 0)
+        offsets = np.arange(total_points) * float(interval_seconds)
+        times = offsets + start_time.timestamp()
+        self._expire_scenario(start_time)
+
+        # Inject scenarios at 25%, 50% and 75% through the series; on short
+        # series where these points coincide the earliest scenario wins
+        switches: dict[int, tuple[OperationMode, str | None, int]] = {}
+        for index, scenario in (
+            (total_points // 4, (OperationMode.THRESHOLD_BREACH, site_id, 120)),
+            (total_points // 2, (OperationMode.SWARM_ACTIVE, None, 60)),
+            (3 * total_points // 4, (OperationMode.NORMAL, None, 30)),
+        ):
+            if index < total_points:
+                switches.setdefault(index, scenario)
+
+        # Generate each scenario segment in one vectorized pass
+        segments = []
+        start = 0
+        for stop in [*sorted(switches), total_points]:
+            if stop > start:
+                segment = self._apply_operation_mode_vec(
+                    site_id,
+                    self._generate_base_metrics_vec(site_id, times[start:stop]),
+                )
+                segment["network_latency"] = self._generate_network_latency_vec(
+                    site_id,
+                    stop - start,
+                )
+                segments.append(segment)
+            if stop in switches:
+                self.set_operation_mode(*switches[stop])
+            start = stop
+
+        if segments:
+            columns = {
+                key: np.concatenate([segment[key] for segment in segments])
+                for key in segments[0]
+            }
+        else:
+            columns = {
+                key: np.empty(0, dtype=np.int64 if key in _INT_METRICS else float)
+                for key in _BASE_METRIC_KEYS
+            }
+            columns["network_latency"] = np.empty((0, len(targets)))
+
+        start_us = np.datetime64(start_time.replace(tzinfo=None), "us")
+        return MECMetricsBatch(
+            site_id=site_id,
+            targets=targets,
+            timestamp=start_us + (offsets * 1e6).astype("timedelta64[us]"),
+            **columns,
+        )
+
+    def generate_fleet_time_series_batch(
+        self,
+        duration_minutes: int = 60,
+        interval_seconds: int = 5,
+        site_ids: list[str] | None = None,
+    ) -> dict[str, MECMetricsBatch]:
+        """
+        Generate time series for many MEC sites in one kernel call.
+
+        Unlike generate_time_series, no scenarios are injected: every site
+        follows the current operation mode for the whole series.
 
-        for i in range(total_points):
-            # Simulate time progression
-            current_time = start_time + timedelta(seconds=i * interval_seconds)
+        Args:
+            duration_minutes: Duration of the time series
+            interval_seconds: Interval between data points
+            site_ids: Sites to generate; defaults to every configured site
 
-            # Inject some scenarios during the time series
-            if i == total_points // 4:  # 25% through, start breach scenario
-                self.set_operation_mode(OperationMode.THRESHOLD_BREACH, site_id, 120)
-            elif i == total_points // 2:  # 50% through, swarm coordination
-                self.set_operation_mode(OperationMode.SWARM_ACTIVE, duration_seconds=60)
-            elif i == 3 * total_points // 4:  # 75% through, back to normal
-                self.set_operation_mode(OperationMode.NORMAL)
+        Returns:
+            Dictionary mapping site ids to their MECMetricsBatch
+        """
+        site_ids = list(self.mec_sites) if site_ids is None else list(site_ids)
+        for site_id in site_ids:
+            if site_id not in self.mec_sites:
+                msg = f"Unknown MEC site: {site_id}"
+                raise ValueError(msg)
 
-            metrics = self.generate_metrics(site_id)
-            metrics.timestamp = current_time  # Override with series time
-            metrics_series.append(metrics)
+        start_time = datetime.now(UTC)
+        total_points = max((duration_minutes * 60) // interval_seconds, 0)
+        offsets = np.arange(total_points) * float(interval_seconds)
+        times = offsets + start_time.timestamp()
+        self._expire_scenario(start_time)
+
+        inputs = [self._kernel_inputs(site_id) for site_id in site_ids]
+        n_metrics = len(_BASE_METRIC_KEYS)
+        columns = _generate_series_all_sites(
+            np.array([baseline for baseline, _ in inputs]).reshape(-1, n_metrics),
+            np.array([trends for _, trends in inputs]).reshape(-1, 3),
+            times,
+            self._rng.standard_normal((len(site_ids), total_points, n_metrics)),
+        )
 
-        return metrics_series
+        start_us = np.datetime64(start_time.replace(tzinfo=None), "us")
+        timestamps = start_us + (offsets * 1e6).astype("timedelta64[us]")
+        return {
+            site_id: MECMetricsBatch(
+                site_id=site_id,
+                targets=list(self._latency_base[site_id][1]),
+                timestamp=timestamps,
+                network_latency=self._generate_network_latency_vec(
+                    site_id,
+                    total_points,
+                ),
+                **self._apply_operation_mode_vec(
+                    site_id,
+                    _split_base_columns(site_columns),
+                ),
+            )
+            for site_id, site_columns in zip(site_ids, columns, strict=True)
+        }
 
     def get_current_thresholds(self) -> ThresholdConfig:
         """Get current threshold configuration."""
@@ -515,6 +881,70 @@ class MECMetricsGenerator:
 
         return breaches
 
+    def is_threshold_breached_batch(
+        self,
+        batch: MECMetricsBatch,
+    ) -> dict[str, np.ndarray]:
+        """
+        Check thresholds for every point of a batch at once.
+
+        Args:
+            batch: MECMetricsBatch to check
+
+        Returns:
+            Dictionary mapping metric names (as in is_threshold_breached)
+            to boolean arrays with one entry per point
+        """
+        breaches = {
+            "cpu_utilization": batch.cpu_utilization
+            > self.thresholds.cpu_threshold_percent,
+            "gpu_utilization": batch.gpu_utilization
+            > self.thresholds.gpu_threshold_percent,
+            "memory_utilization": batch.memory_utilization
+            > self.thresholds.memory_threshold_percent,
+            "queue_depth": batch.queue_depth > self.thresholds.queue_depth_threshold,
+            "response_time": batch.response_time_ms
+            > self.thresholds.latency_threshold_ms,
+        }
+
+        # One comparison over the whole (points, targets) latency matrix
+        latency_breaches = (
+            batch.network_latency > self.thresholds.network_latency_threshold_ms
+        )
+        for column, target_site in enumerate(batch.targets):
+            breaches[f"network_latency_{target_site}"] = latency_breaches[:, column]
+
+        return breaches
+
+    def get_breach_summary_batch(self, batch: MECMetricsBatch) -> dict[str, Any]:
+        """
+        Get a per-point summary of threshold breaches for a batch.
+
+        Args:
+            batch: MECMetricsBatch to analyze
+
+        Returns:
+            Summary dictionary whose per-point fields are arrays
+        """
+        breaches = self.is_threshold_breached_batch(batch)
+        breach_count = np.sum(list(breaches.values()), axis=0)
+
+        return {
+            "site_id": batch.site_id,
+            "timestamp": batch.timestamp,
+            "total_breaches": breach_count,
+            "has_breaches": breach_count > 0,
+            "breach_counts": {
+                metric: int(breached.sum()) for metric, breached in breaches.items()
+            },
+            "breach_details": breaches,
+            "severity": np.where(
+                breach_count >= 3,
+                "high",
+                np.where(breach_count >= 1, "medium", "low"),
+            ),
+        }
+
     def get_breach_summary(self, metrics: MECMetrics) -> dict[str, Any]:
         """
         Get a summary of threshold breaches for given metrics.
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Unit tests for EdgeMind dashboard helpers.
+
+Tests API key format checks and chart downsampling used by the panels.
+"""
+
+import unittest
+
+import numpy as np
+
+from src.dashboard.mec_dashboard import _minmax_downsample, validate_claude_api_key
+
+
+class TestValidateApiKey(unittest.TestCase):
+    """Unit tests for validate_claude_api_key."""
+
+    def test_prefix_and_length(self):
+        """Test keys need the sk- prefix and at least 20 characters."""
+        self.assertTrue(validate_claude_api_key("sk-" + "a" * 17))
+        self.assertFalse(validate_claude_api_key("sk-" + "a" * 16))
+        self.assertFalse(validate_claude_api_key("pk-" + "a" * 30))
+        self.assertFalse(validate_claude_api_key(""))
+
+    def test_any_characters_after_prefix(self):
+        """Test characters after the prefix are not restricted."""
+        self.assertTrue(validate_claude_api_key("sk-ant.api03+key/with=chars"))
+        self.assertTrue(validate_claude_api_key("sk-" + "x" * 10 + "\n" + "y" * 10))
+
+
+class TestMinMaxDownsample(unittest.TestCase):
+    """Unit tests for _minmax_downsample."""
+
+    def test_short_series_unchanged(self):
+        """Test a series within the budget is returned as is."""
+        x, y = _minmax_downsample(list(range(10)), np.arange(10.0), 100)
+        self.assertEqual(list(x), list(range(10)))
+        self.assertEqual(len(y), 10)
+
+    def test_tail_spike_survives(self):
+        """Test a spike past the last whole bucket is kept."""
+        y = np.zeros(1499)
+        y[1200] = 9.0
+        x, sampled = _minmax_downsample(np.arange(1499), y, 1000)
+        self.assertIn(1200, x)
+        self.assertEqual(sampled.max(), 9.0)
+        self.assertEqual(x[-1], 1498)
+        self.assertLessEqual(len(x), 1002)
+
+    def test_keeps_every_bucket_extreme(self):
+        """Test the global min and max of a long noisy series are kept."""
+        y = np.random.default_rng(3).random(10_000)
+        y[4321] = -1.0
+        y[9999] = 2.0
+        x, _ = _minmax_downsample(np.arange(10_000), y, 500)
+        self.assertIn(4321, x)
+        self.assertIn(9999, x)
+        self.assertTrue(np.all(np.diff(x) > 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
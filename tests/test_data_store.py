@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the EdgeMind MEC data persistence layer.
+
+Tests metrics storage, history queries, session state and exports against
+a temporary data directory.
+"""
+
+import csv
+import gc
+import json
+import os
+import tempfile
+import unittest
+import weakref
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from src.data.data_store import DataStore
+from src.data.metrics_generator import MECMetrics
+
+
+def make_metrics(site_id="MEC_A", timestamp=None, cpu_util=42.0):
+    """Create a metrics sample for a site."""
+    return MECMetrics(
+        site_id=site_id,
+        timestamp=timestamp or datetime.now(UTC),
+        cpu_utilization=cpu_util,
+        gpu_utilization=30.0,
+        memory_utilization=55.0,
+        queue_depth=15,
+        network_latency={"MEC_B": 18.0, "MEC_C": 22.0},
+        response_time_ms=25.0,
+        requests_per_second=100,
+        active_connections=50,
+        cache_hit_ratio=85.0,
+    )
+
+
+class TestDataStore(unittest.TestCase):
+    """Unit tests for DataStore."""
+
+    def setUp(self):
+        """Create a data store in a fresh temporary directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self._tmp.name) / "data"
+        self.store = DataStore(str(self.data_dir))
+
+    def tearDown(self):
+        """Close the store and remove the temporary directory."""
+        self.store.close()
+        self._tmp.cleanup()
+
+    def test_config_file_is_human_readable(self):
+        """Test config.json keeps its indented layout."""
+        text = (self.data_dir / "config.json").read_text(encoding="utf-8")
+        self.assertIn('\n  "version"', text)
+        self.assertEqual(json.loads(text)["settings"]["max_history_days"], 7)
+
+    def test_store_and_get_current_metrics(self):
+        """Test current metrics round-trip per site and for all sites."""
+        self.store.store_metrics(make_metrics("MEC_A", cpu_util=10.0))
+        self.store.store_metrics(make_metrics("MEC_B", cpu_util=20.0))
+
+        current = self.store.get_current_metrics("MEC_A")
+        self.assertIsInstance(current, MECMetrics)
+        self.assertEqual(current.cpu_utilization, 10.0)
+        self.assertEqual(current.network_latency, {"MEC_B": 18.0, "MEC_C": 22.0})
+        self.assertIsNone(self.store.get_current_metrics("MEC_X"))
+        self.assertEqual(set(self.store.get_current_metrics()), {"MEC_A", "MEC_B"})
+
+    def test_current_metrics_do_not_alias_the_cache(self):
+        """Test mutating returned metrics leaves the cached record intact."""
+        self.store.store_metrics(make_metrics("MEC_A"))
+        self.store.get_current_metrics("MEC_A").network_latency["MEC_B"] = 999.0
+        self.store.get_current_metrics()["MEC_A"]["network_latency"]["MEC_C"] = 1.0
+
+        latency = self.store.get_current_metrics("MEC_A").network_latency
+        self.assertEqual(latency, {"MEC_B": 18.0, "MEC_C": 22.0})
+
+    def test_close_unregisters_exit_hook(self):
+        """Test a closed store is no longer held by the atexit hook."""
+        store = DataStore(data_dir=str(self.data_dir / "other"))
+        store.close()
+        ref = weakref.ref(store)
+        del store
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_current_metrics_are_flushed_to_site_files(self):
+        """Test cached current metrics reach disk on flush and reload."""
+        self.store.store_metrics(make_metrics("MEC_A", cpu_util=10.0))
+        site_file = self.data_dir / "metrics" / "current" / "MEC_A.json"
+        self.assertEqual(self.store.get_current_metrics("MEC_A").cpu_utilization, 10.0)
+
+        self.store.flush()
+        self.assertTrue(site_file.exists())
+        reloaded = DataStore(str(self.data_dir))
+        self.assertEqual(reloaded.get_current_metrics("MEC_A").cpu_utilization, 10.0)
+        reloaded.close()
+
+    def test_history_filters_by_site_and_window(self):
+        """Test history queries filter by site and time window, newest first."""
+        now = datetime.now(UTC)
+        self.store.store_metrics_batch(
+            [
+                make_metrics("MEC_A", now - timedelta(hours=30)),
+                make_metrics("MEC_A", now - timedelta(hours=2)),
+                make_metrics("MEC_B", now - timedelta(hours=1)),
+                make_metrics("MEC_A", now - timedelta(minutes=5)),
+            ],
+        )
+
+        history = self.store.get_metrics_history(hours=24)
+        self.assertEqual(len(history), 3)
+        self.assertEqual(
+            [m.timestamp for m in history],
+            sorted((m.timestamp for m in history), reverse=True),
+        )
+
+        site_a = self.store.get_metrics_history("MEC_A", hours=24)
+        self.assertEqual([m.site_id for m in site_a], ["MEC_A", "MEC_A"])
+        self.assertEqual(len(self.store.get_metrics_history(hours=48)), 4)
+        self.assertEqual(len(self.store.get_metrics_history(hours=48, limit=1)), 1)
+
+    def test_history_index_handles_out_of_order_appends_and_rebuild(self):
+        """Test indexed window queries after late samples and a lost index."""
+        now = datetime.now(UTC)
+        self.store.store_metrics(make_metrics("MEC_A", now - timedelta(minutes=5)))
+        self.store.store_metrics(make_metrics("MEC_B", now - timedelta(hours=5)))
+        self.store.store_metrics(make_metrics("MEC_A", now - timedelta(hours=3)))
+        self.assertEqual(len(self.store.get_metrics_history(hours=4)), 2)
+
+        self.store.history_index_file.unlink()
+        reloaded = DataStore(str(self.data_dir))
+        self.assertTrue(reloaded.history_index_file.exists())
+        self.assertEqual(len(reloaded.get_metrics_history(hours=4)), 2)
+        self.assertEqual(len(reloaded.get_metrics_history("MEC_B", hours=6)), 1)
+        reloaded.close()
+
+    def test_cleanup_drops_records_past_retention(self):
+        """Test cleanup removes history older than max_history_days."""
+        now = datetime.now(UTC)
+        self.store.store_metrics_batch(
+            [
+                make_metrics("MEC_A", now - timedelta(days=10)),
+                make_metrics("MEC_A", now - timedelta(hours=1)),
+            ],
+        )
+
+        self.store.cleanup_old_data()
+        history = self.store.get_metrics_history(hours=24 * 30)
+        self.assertEqual(len(history), 1)
+        self.assertEqual(self.store.get_storage_stats()["total_metrics_records"], 1)
+
+    def test_cleanup_keeps_frames_with_invalid_timestamps(self):
+        """Test compaction keeps unparseable records ahead of the cutoff hour."""
+        now = datetime.now(UTC)
+        self.store.store_metrics(make_metrics("MEC_A", now - timedelta(days=10)))
+        self.store.close()
+        payload = b'{"site_id":"MEC_X","timestamp":"not-a-time"}'
+        with self.store.history_file.open("ab") as f:
+            f.write(len(payload).to_bytes(4, "big") + payload)
+
+        self.store = DataStore(str(self.data_dir))
+        self.store.store_metrics(make_metrics("MEC_A", now - timedelta(hours=1)))
+        stats = self.store.cleanup_old_data()
+
+        kept = [p for _, p in self.store._iter_history_frames()]
+        self.assertEqual(len(kept), 2)
+        self.assertEqual(kept[0], payload)
+        self.assertEqual(stats["deleted_records"], 1)
+
+    def test_cleanup_archives_stale_exports(self):
+        """Test exports older than 30 days are compressed into the archive."""
+        self.store.store_metrics(make_metrics("MEC_A"))
+        stale = Path(self.store.export_data("csv", hours=1))
+        fresh = Path(self.store.export_data("json", hours=1))
+        old_mtime = (datetime.now(UTC) - timedelta(days=31)).timestamp()
+        os.utime(stale, (old_mtime, old_mtime))
+
+        stats = self.store.cleanup_old_data()
+        self.assertEqual(stats["archived_files"], 1)
+        self.assertFalse(stale.exists())
+        self.assertTrue(fresh.exists())
+
+        (archived,) = (self.data_dir / "archive").iterdir()
+        self.assertTrue(archived.name.startswith(stale.name))
+        self.assertIn(b"network_latency_json", self.store.read_archive(archived))
+
+    def test_legacy_json_files_are_migrated(self):
+        """Test single-file current metrics and history from older versions load."""
+        record = make_metrics("MEC_C").to_dict()
+        legacy_current = {"MEC_C": record, "last_updated": None}
+        legacy_history = {"metrics": [record], "last_updated": None}
+        with tempfile.TemporaryDirectory() as tmp:
+            metrics_dir = Path(tmp) / "metrics"
+            metrics_dir.mkdir()
+            current_file = metrics_dir / "current_metrics.json"
+            history_file = metrics_dir / "metrics_history.json"
+            current_file.write_text(json.dumps(legacy_current), encoding="utf-8")
+            history_file.write_text(json.dumps(legacy_history), encoding="utf-8")
+
+            store = DataStore(tmp)
+            self.assertEqual(set(store.get_current_metrics()), {"MEC_C"})
+            history = store.get_metrics_history(hours=1)
+            self.assertEqual([m.site_id for m in history], ["MEC_C"])
+            self.assertFalse(current_file.exists())
+            self.assertFalse(history_file.exists())
+            store.close()
+
+    def test_history_ignores_torn_tail_frame(self):
+        """Test a partially written trailing frame does not break reads."""
+        self.store.store_metrics(make_metrics("MEC_A"))
+        with self.store.history_file.open("ab") as f:
+            f.write(b"\x00\x00\x01\x00{")
+
+        self.assertEqual(len(self.store.get_metrics_history(hours=1)), 1)
+
+    def test_session_state_updates_merge_nested_settings(self):
+        """Test session updates deep-merge into the default state."""
+        state = self.store.get_session_state("session-1")
+        self.assertEqual(state["operation_mode"], "normal")
+
+        self.store.update_session_state(
+            "session-1",
+            {"operation_mode": "swarm", "dashboard_settings": {"refresh_interval": 5}},
+        )
+        state = self.store.get_session_state("session-1")
+        self.assertEqual(state["operation_mode"], "swarm")
+        self.assertEqual(state["dashboard_settings"]["refresh_interval"], 5)
+        self.assertTrue(state["dashboard_settings"]["auto_refresh"])
+
+    def test_session_access_is_buffered_until_flush(self):
+        """Test reads only touch last_accessed in memory until flushed."""
+        self.store.update_session_state("session-1", {"selected_site": "MEC_B"})
+        on_disk = json.loads(self.store.session_file.read_text(encoding="utf-8"))
+
+        state = self.store.get_session_state("session-1")
+        state["dashboard_settings"]["refresh_interval"] = 99
+        unchanged = json.loads(self.store.session_file.read_text(encoding="utf-8"))
+        self.assertEqual(unchanged["last_accessed"], on_disk["last_accessed"])
+
+        self.store.flush()
+        reloaded_store = DataStore(str(self.data_dir))
+        reloaded = reloaded_store.get_session_state("session-1")
+        reloaded_store.close()
+        self.assertEqual(reloaded["selected_site"], "MEC_B")
+        self.assertEqual(reloaded["dashboard_settings"]["refresh_interval"], 2)
+
+    def test_export_json_and_csv(self):
+        """Test JSON and CSV exports contain the stored history."""
+        self.store.store_metrics(make_metrics("MEC_A"))
+        self.store.store_metrics(make_metrics("MEC_B"))
+
+        json_path = Path(self.store.export_data("json", hours=1))
+        exported = json.loads(json_path.read_text(encoding="utf-8"))
+        self.assertEqual(exported["export_info"]["total_records"], 2)
+        self.assertEqual(len(exported["historical_metrics"]), 2)
+        self.assertEqual(set(exported["current_metrics"]), {"MEC_A", "MEC_B"})
+
+        csv_path = Path(self.store.export_data("csv", site_id="MEC_A", hours=1))
+        with csv_path.open(newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["site_id"], "MEC_A")
+        self.assertEqual(
+            json.loads(rows[0]["network_latency_json"]),
+            {"MEC_B": 18.0, "MEC_C": 22.0},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
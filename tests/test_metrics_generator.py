@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the EdgeMind MEC metrics generator.
+
+Tests time-series generation, scenario injection and value bounds.
+"""
+
+import unittest
+from datetime import UTC, timedelta
+
+import numpy as np
+
+from config import MECConfig
+from src.data.metrics_generator import MECMetrics, MECMetricsGenerator, OperationMode
+
+
+class TestMECMetricsGenerator(unittest.TestCase):
+    """Unit tests for MECMetricsGenerator."""
+
+    def setUp(self):
+        """Create a generator for the default MEC topology."""
+        self.generator = MECMetricsGenerator(MECConfig())
+
+    def test_generate_metrics_bounds(self):
+        """Test single-point metrics respect bounds and integer fields."""
+        for _ in range(200):
+            metrics = self.generator.generate_metrics("MEC_B")
+            self.assertEqual(metrics.site_id, "MEC_B")
+            self.assertIsInstance(metrics.queue_depth, int)
+            self.assertIsInstance(metrics.active_connections, int)
+            self.assertTrue(0.0 <= metrics.gpu_utilization <= 100.0)
+            self.assertTrue(0 <= metrics.queue_depth <= 200)
+            self.assertTrue(10.0 <= metrics.response_time_ms <= 500.0)
+            self.assertTrue(1 <= metrics.requests_per_second <= 1000)
+
+    def test_base_metrics_follow_generator_rng(self):
+        """Test base metrics depend only on the generator's NumPy RNG."""
+        other = MECMetricsGenerator(MECConfig())
+        other._baseline_values = self.generator._baseline_values
+        other._trend_factors = self.generator._trend_factors
+        self.generator._rng = np.random.default_rng(7)
+        other._rng = np.random.default_rng(7)
+
+        now = 1_700_000_000.0
+        self.assertEqual(
+            self.generator._generate_base_metrics("MEC_A", now),
+            other._generate_base_metrics("MEC_A", now),
+        )
+        metrics = self.generator._generate_base_metrics("MEC_A", now)
+        self.assertIsInstance(metrics["queue_depth"], int)
+        self.assertIsInstance(metrics["cpu_utilization"], float)
+
+    def test_seed_makes_series_reproducible(self):
+        """Test two generators with the same seed produce the same series."""
+        first = MECMetricsGenerator(MECConfig(), seed=11)
+        second = MECMetricsGenerator(MECConfig(), seed=11)
+        self.assertEqual(first._baseline_values, second._baseline_values)
+
+        times = np.arange(24) * 5.0 + 1_700_000_000.0
+        a = first._generate_base_metrics_vec("MEC_B", times)
+        b = second._generate_base_metrics_vec("MEC_B", times)
+        for metric, values in a.items():
+            np.testing.assert_array_equal(values, b[metric])
+
+        first._setup_breach_scenario("MEC_B")
+        second._setup_breach_scenario("MEC_B")
+        self.assertEqual(first._breach_scenarios, second._breach_scenarios)
+
+    def test_time_series_shape_and_bounds(self):
+        """Test series length, spacing, field types and value bounds."""
+        series = self.generator.generate_time_series("MEC_A", 60, 5)
+        self.assertEqual(len(series), 720)
+        self.assertEqual(
+            series[1].timestamp - series[0].timestamp,
+            timedelta(seconds=5),
+        )
+
+        targets = set(self.generator.mec_sites["MEC_A"].network_latency_ms)
+        for metrics in series:
+            self.assertIsInstance(metrics, MECMetrics)
+            self.assertIsInstance(metrics.queue_depth, int)
+            self.assertIsInstance(metrics.requests_per_second, int)
+            self.assertTrue(0.0 <= metrics.cpu_utilization <= 100.0)
+            self.assertTrue(50.0 * 0.7 <= metrics.cache_hit_ratio <= 99.0)
+            self.assertEqual(set(metrics.network_latency), targets)
+
+    def test_time_series_batch_columns(self):
+        """Test the batch form keeps one aligned array per metric."""
+        batch = self.generator.generate_time_series_batch("MEC_A", 2, 5)
+        self.assertEqual(len(batch), 24)
+        self.assertEqual(batch.network_latency.shape, (24, len(batch.targets)))
+        self.assertEqual(batch.queue_depth.dtype, np.int64)
+        self.assertEqual(
+            batch.timestamp[1] - batch.timestamp[0],
+            np.timedelta64(5, "s"),
+        )
+
+        series = batch.to_metrics()
+        self.assertEqual(series[3].cpu_utilization, batch.cpu_utilization[3])
+        self.assertEqual(series[0].timestamp.tzinfo, UTC)
+        self.assertEqual(
+            list(series[0].network_latency.values()),
+            batch.network_latency[0].tolist(),
+        )
+        self.assertEqual(
+            len(self.generator.generate_time_series_batch("MEC_A", 0, 5)),
+            0,
+        )
+
+    def test_fleet_batch_covers_every_site(self):
+        """Test fleet generation yields one aligned batch per site."""
+        fleet = self.generator.generate_fleet_time_series_batch(2, 5)
+        self.assertEqual(set(fleet), set(self.generator.mec_sites))
+        for site_id, batch in fleet.items():
+            self.assertEqual(batch.site_id, site_id)
+            self.assertEqual(len(batch), 24)
+            self.assertEqual(batch.network_latency.shape, (24, len(batch.targets)))
+            self.assertTrue(np.all(batch.cpu_utilization <= 100.0))
+            self.assertTrue(np.all(batch.cache_hit_ratio >= 50.0))
+
+        subset = self.generator.generate_fleet_time_series_batch(1, 5, ["MEC_B"])
+        self.assertEqual(list(subset), ["MEC_B"])
+        with self.assertRaises(ValueError):
+            self.generator.generate_fleet_time_series_batch(1, 5, ["MEC_X"])
+
+    def test_batch_breaches_match_scalar(self):
+        """Test batch threshold checks agree with the per-point checks."""
+        batch = self.generator.generate_time_series_batch("MEC_A", 5, 5)
+        breaches = self.generator.is_threshold_breached_batch(batch)
+        summary = self.generator.get_breach_summary_batch(batch)
+
+        for i, metrics in enumerate(batch.to_metrics()):
+            expected = self.generator.is_threshold_breached(metrics)
+            self.assertEqual(
+                {metric: bool(breached[i]) for metric, breached in breaches.items()},
+                expected,
+            )
+            scalar = self.generator.get_breach_summary(metrics)
+            self.assertEqual(summary["total_breaches"][i], scalar["total_breaches"])
+            self.assertEqual(summary["severity"][i], scalar["severity"])
+
+    def test_time_series_injects_scenarios(self):
+        """Test the series walks through breach and swarm back to normal."""
+        self.generator.generate_time_series("MEC_A", 1, 20)
+        self.assertEqual(self.generator._operation_mode, OperationMode.NORMAL)
+        self.assertIn("MEC_A", self.generator._breach_scenarios)
+
+        self.assertEqual(self.generator.generate_time_series("MEC_A", 0, 5), [])
+        with self.assertRaises(ValueError):
+            self.generator.generate_time_series("MEC_X")
+
+    def test_failure_mode_applies_to_whole_series_segment(self):
+        """Test an active failure scenario degrades the leading segment."""
+        self.generator.set_operation_mode(OperationMode.MEC_FAILURE)
+        series = self.generator.generate_time_series("MEC_A", 1, 5)
+        base = self.generator.mec_sites["MEC_A"].network_latency_ms
+        for metrics in series[:3]:
+            for target, latency in metrics.network_latency.items():
+                self.assertGreaterEqual(latency, round(base[target] * 3.0, 2))
+
+    def test_to_dict_round_trip_and_sharing(self):
+        """Test to_dict round-trips and only copies latency when deep."""
+        metrics = self.generator.generate_metrics("MEC_A")
+        data = metrics.to_dict()
+        self.assertEqual(data["timestamp"], metrics.timestamp.isoformat())
+        self.assertIs(data["network_latency"], metrics.network_latency)
+
+        deep = metrics.to_dict(deep=True)
+        self.assertIsNot(deep["network_latency"], metrics.network_latency)
+        self.assertEqual(deep, data)
+        self.assertEqual(MECMetrics.from_dict(data), metrics)
+
+
+if __name__ == "__main__":
+    unittest.main()